@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""Module containing the pipelined inventory crawler for Autodesk Forge BIM360 accounts."""
+import json
+import queue
+import threading
+from PyForge.ForgeFolders import FoldersApi
+from PyForge.ForgeHubs import HubsApi
+from PyForge.ForgeProjects import ProjectsApi
+from PyForge.ForgeVersions import VersionsApi
+
+DEFAULT_QUEUE_SIZE = 1000
+
+# Marks the end of the work for a stage worker.
+STOP = object()
+
+
+class AccountCrawler():
+    """Crawls hubs, projects, folders, items and versions as a pipeline of concurrent stages, streaming JSON Lines."""
+
+    def __init__(self, token, hub_ids=None, project_workers=4, folder_workers=16, version_workers=8,
+                 queue_size=DEFAULT_QUEUE_SIZE, hubs_api=None, projects_api=None, folders_api=None, versions_api=None):
+        """
+        Initialize the AccountCrawler class with the concurrency limits of its stages.
+
+        Every stage has its own pool of worker threads. The queues feeding the stages and the output are bounded, so a
+        fast stage blocks instead of piling up work for a slower one. The folder stage feeds itself with the subfolders it
+        finds, a worker crawls the subfolders that do not fit into the full folder queue itself, so the folder workers can
+        never block each other.
+
+        Args:
+            token (str, TokenProvider): Authentication token or token provider for Autodesk Forge API.
+            hub_ids (list(str), optional): Hubs to be crawled. Defaults to None, in which case all hubs are crawled.
+            project_workers (int, optional): Number of threads listing the projects of hubs. Defaults to 4.
+            folder_workers (int, optional): Number of threads listing the contents of folders. Defaults to 16.
+            version_workers (int, optional): Number of threads fetching versions. Defaults to 8.
+            queue_size (int, optional): Maximum number of waiting tasks per bounded queue. Defaults to DEFAULT_QUEUE_SIZE.
+            hubs_api (HubsApi, optional): HubsApi instance to be used. A new one is created if None. Defaults to None.
+            projects_api (ProjectsApi, optional): ProjectsApi instance to be used. A new one is created if None.
+                Defaults to None.
+            folders_api (FoldersApi, optional): FoldersApi instance to be used. A new one is created if None.
+                Defaults to None.
+            versions_api (VersionsApi, optional): VersionsApi instance to be used. A new one is created if None.
+                Defaults to None.
+
+        Returns:
+            None.
+        """
+        self.hub_ids = hub_ids
+        self.project_workers = project_workers
+        self.folder_workers = folder_workers
+        self.version_workers = version_workers
+        self.queue_size = queue_size
+        self.hubs_api = HubsApi(token) if hubs_api is None else hubs_api
+        self.projects_api = ProjectsApi(token) if projects_api is None else projects_api
+        self.folders_api = FoldersApi(token) if folders_api is None else folders_api
+        self.versions_api = VersionsApi(token) if versions_api is None else versions_api
+        self._counts = {}
+        self._counts_lock = threading.Lock()
+        self._abort = threading.Event()
+        self._writer_error = None
+
+    def crawl(self, output):
+        """
+        Crawl the account, writing one JSON object per line for every hub, project, folder, item, version and error.
+
+        Every line has the form {"type": ..., "hub_id": ..., "project_id": ..., "data": ...}, errors have an "error" and
+        a "stage" instead of data. Lines are written as soon as their stage produced them. The tip version of every item
+        is taken from the folder listing if it is included there, and only fetched separately otherwise.
+
+        If the output can not be opened or written, the crawl is aborted: the remaining tasks are dropped and the error of
+        the writer is raised.
+
+        Args:
+            output (str, file): Path of the JSON Lines file to be written, or a text file object to write to.
+
+        Raises:
+            Exception: The error that stopped the writer, e.g. an OSError or a TypeError for a line that can not be serialized.
+
+        Returns:
+            dict: Number of written lines per type.
+        """
+        self._counts = {}
+        self._abort.clear()
+        self._writer_error = None
+        projects = queue.Queue(self.queue_size)
+        folders = queue.Queue(self.queue_size)
+        versions = queue.Queue(self.queue_size)
+        records = queue.Queue(self.queue_size)
+
+        stages = [(projects, self.project_workers, lambda task: self._crawl_hub(task, folders, records)),
+                  (folders, self.folder_workers, lambda task: self._crawl_folders(task, folders, versions, records)),
+                  (versions, self.version_workers, lambda task: self._crawl_version(task, records))]
+
+        threads = []
+
+        for tasks, workers, handle in stages:
+            for _ in range(workers):
+                threads.append(self._start(self._work, tasks, handle, records))
+
+        writer = self._start(self._write, output, records)
+
+        try:
+            for hub in self._get_hubs(records):
+                projects.put(hub)
+
+            for tasks, _, _ in stages:
+                tasks.join()
+
+            records.join()
+        except BaseException:
+            self._abort.set()
+            raise
+        finally:
+            for tasks, workers, _ in stages:
+                for _ in range(workers):
+                    self._put_stop(tasks, threads)
+            self._put_stop(records, [writer])
+
+            for thread in threads:
+                thread.join()
+            writer.join()
+
+        if self._writer_error is not None:
+            raise self._writer_error
+
+        return dict(self._counts)
+
+    @staticmethod
+    def _put_stop(tasks, threads, timeout=0.1):
+        """
+        Put STOP on a queue, giving up once none of the threads consuming it are alive.
+
+        Args:
+            tasks (queue.Queue): The queue.
+            threads (list(threading.Thread)): The threads consuming the queue.
+            timeout (float, optional): Time in s to wait for room in the queue between checks. Defaults to 0.1.
+
+        Returns:
+            None.
+        """
+        while True:
+            try:
+                tasks.put(STOP, timeout=timeout)
+                return
+            except queue.Full:
+                if not any(thread.is_alive() for thread in threads):
+                    return
+
+    @staticmethod
+    def _start(target, *args):
+        """
+        Start a daemon thread.
+
+        Args:
+            target (callable): Function run by the thread.
+            args: Arguments of the function.
+
+        Returns:
+            threading.Thread: The started thread.
+        """
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        return thread
+
+    def _work(self, tasks, handle, records):
+        """
+        Worker loop of a stage, handling tasks until it receives STOP. Tasks are dropped once the crawl is aborted.
+
+        Args:
+            tasks (queue.Queue): The queue of the stage.
+            handle (callable): Function handling a single task.
+            records (queue.Queue): The output queue, receiving an error line for every failed task.
+
+        Returns:
+            None.
+        """
+        while True:
+            task = tasks.get()
+            try:
+                if task is STOP:
+                    return
+                if not self._abort.is_set():
+                    handle(task)
+            except Exception as e:
+                records.put(self._make_error(task, e))
+            finally:
+                tasks.task_done()
+
+    @staticmethod
+    def _make_error(task, error):
+        """
+        Make the error line of a failed task.
+
+        Args:
+            task (dict): The task, with the stage and the ids it was given.
+            error (Exception): The error raised by the task.
+
+        Returns:
+            dict: The error line.
+        """
+        return {'type' : 'error', 'stage' : task['stage'], 'hub_id' : task.get('hub_id'),
+                'project_id' : task.get('project_id'), 'id' : task.get('id'), 'error' : repr(error)}
+
+    def _write(self, output, records):
+        """
+        Writer loop, writing the lines from the output queue until it receives STOP.
+
+        If opening or writing the output fails, the error is kept, the crawl is aborted and the remaining lines are
+        drained without being written, so the workers putting lines never block.
+
+        Args:
+            output (str, file): Path of the JSON Lines file, or a text file object.
+            records (queue.Queue): The output queue.
+
+        Returns:
+            None.
+        """
+        f = None
+
+        try:
+            f = open(output, 'w', encoding='utf8') if isinstance(output, str) else output
+
+            while True:
+                record = records.get()
+                try:
+                    if record is STOP:
+                        return
+                    f.write(json.dumps(record) + '\n')
+                    with self._counts_lock:
+                        self._counts[record['type']] = self._counts.get(record['type'], 0) + 1
+                finally:
+                    records.task_done()
+        except Exception as e:
+            self._writer_error = e
+            self._abort.set()
+            self._drain(records)
+        finally:
+            if f is not None:
+                try:
+                    if isinstance(output, str):
+                        f.close()
+                    else:
+                        f.flush()
+                except Exception as e:
+                    if self._writer_error is None:
+                        self._writer_error = e
+
+    @staticmethod
+    def _drain(records):
+        """
+        Discard the lines of the output queue until it receives STOP.
+
+        Args:
+            records (queue.Queue): The output queue.
+
+        Returns:
+            None.
+        """
+        while True:
+            record = records.get()
+            records.task_done()
+            if record is STOP:
+                return
+
+    def _get_hubs(self, records):
+        """
+        Hub stage, listing the hubs to be crawled.
+
+        Args:
+            records (queue.Queue): The output queue.
+
+        Returns:
+            list(dict): Project stage tasks, one per hub.
+        """
+        try:
+            hubs = self.hubs_api.get_hubs()
+        except Exception as e:
+            records.put({'type' : 'error', 'stage' : 'hubs', 'hub_id' : None, 'project_id' : None, 'id' : None,
+                         'error' : repr(e)})
+            return []
+
+        tasks = []
+
+        for hub in hubs:
+            if self.hub_ids is not None and hub['id'] not in self.hub_ids:
+                continue
+            records.put({'type' : 'hub', 'hub_id' : hub['id'], 'project_id' : None, 'data' : hub})
+            tasks.append({'stage' : 'projects', 'hub_id' : hub['id'], 'id' : hub['id']})
+
+        return tasks
+
+    def _crawl_hub(self, task, folders, records):
+        """
+        Project stage, listing the projects of a hub and queueing their root folders.
+
+        Args:
+            task (dict): The task, with the hub_id.
+            folders (queue.Queue): The queue of the folder stage.
+            records (queue.Queue): The output queue.
+
+        Returns:
+            None.
+        """
+        hub_id = task['hub_id']
+
+        for page in self.projects_api.iter_account_projects(hub_id):
+            for project in page:
+                records.put({'type' : 'project', 'hub_id' : hub_id, 'project_id' : project['id'], 'data' : project})
+
+                try:
+                    root_folder_id = project['relationships']['rootFolder']['data']['id']
+                except (KeyError, TypeError):
+                    continue
+
+                folders.put({'stage' : 'folders', 'hub_id' : hub_id, 'project_id' : project['id'],
+                             'id' : root_folder_id})
+
+    def _crawl_folders(self, task, folders, versions, records):
+        """
+        Folder stage, crawling a folder and the subfolders that did not fit into the full folder queue.
+
+        Args:
+            task (dict): The task, with the hub_id, project_id and folder id.
+            folders (queue.Queue): The queue of the folder stage.
+            versions (queue.Queue): The queue of the version stage.
+            records (queue.Queue): The output queue.
+
+        Returns:
+            None.
+        """
+        pending = [task]
+
+        while pending and not self._abort.is_set():
+            task = pending.pop()
+            try:
+                self._crawl_folder(task, folders, versions, records, pending)
+            except Exception as e:
+                records.put(self._make_error(task, e))
+
+    def _crawl_folder(self, task, folders, versions, records, pending):
+        """
+        List the contents of a folder, queueing its subfolders and the tip versions of its items.
+
+        Args:
+            task (dict): The task, with the hub_id, project_id and folder id.
+            folders (queue.Queue): The queue of the folder stage.
+            versions (queue.Queue): The queue of the version stage.
+            records (queue.Queue): The output queue.
+            pending (list(dict)): The subfolder tasks left to the current worker, receiving those that do not fit into the
+                folder queue.
+
+        Returns:
+            None.
+        """
+        hub_id = task['hub_id']
+        project_id = task['project_id']
+
+        for data, included in self.folders_api.iter_folder_contents(project_id, task['id']):
+            included_versions = {version['id'] : version for version in included if version.get('type') == 'versions'}
+
+            for entry in data:
+                if entry['type'] == 'folders':
+                    records.put({'type' : 'folder', 'hub_id' : hub_id, 'project_id' : project_id,
+                                 'parent_id' : task['id'], 'data' : entry})
+                    subfolder = {'stage' : 'folders', 'hub_id' : hub_id, 'project_id' : project_id, 'id' : entry['id']}
+                    try:
+                        folders.put_nowait(subfolder)
+                    except queue.Full:
+                        pending.append(subfolder)
+                    continue
+
+                records.put({'type' : 'item', 'hub_id' : hub_id, 'project_id' : project_id,
+                             'parent_id' : task['id'], 'data' : entry})
+
+                try:
+                    tip_id = entry['relationships']['tip']['data']['id']
+                except (KeyError, TypeError):
+                    continue
+
+                if tip_id in included_versions:
+                    records.put({'type' : 'version', 'hub_id' : hub_id, 'project_id' : project_id,
+                                 'item_id' : entry['id'], 'data' : included_versions[tip_id]})
+                else:
+                    versions.put({'stage' : 'versions', 'hub_id' : hub_id, 'project_id' : project_id,
+                                  'item_id' : entry['id'], 'id' : tip_id})
+
+    def _crawl_version(self, task, records):
+        """
+        Version stage, fetching a tip version that was not included in its folder listing.
+
+        Args:
+            task (dict): The task, with the hub_id, project_id, item_id and version id.
+            records (queue.Queue): The output queue.
+
+        Returns:
+            None.
+        """
+        version = self.versions_api.get_version(task['project_id'], task['id'])
+        records.put({'type' : 'version', 'hub_id' : task['hub_id'], 'project_id' : task['project_id'],
+                     'item_id' : task['item_id'], 'data' : version})
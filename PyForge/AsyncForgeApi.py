@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Module containing the asynchronous base Api class for the Autodesk Forge platform."""
+import asyncio
+import json
+import time
+import weakref
+from urllib.parse import urljoin
+from PyForge.TimeoutHttpAdapter import TimeoutPolicy
+from PyForge.TokenProvider import TokenProvider
+from PyForge.TransportRegistry import default_registry
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+DEFAULT_CONNECTION_LIMIT = 256
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = ('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS')
+
+
+class AsyncResponse():
+    """Fully read response of an asynchronous request, mirroring the parts of requests.Response PyForge uses."""
+
+    def __init__(self, status_code, headers, content, url):
+        """
+        Initialize the AsyncResponse with the data read from an aiohttp response.
+
+        Args:
+            status_code (int): HTTP status code of the response.
+            headers (dict): Response headers.
+            content (bytes): Response body.
+            url (str): Url the response was retrieved from.
+
+        Returns:
+            None.
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    def json(self, **kwargs):
+        """
+        Decode the response body as JSON.
+
+        Returns:
+            The decoded JSON document.
+        """
+        return json.loads(self.content.decode('utf8'), **kwargs)
+
+
+class AsyncBaseUrlSession():
+    """Asynchronous counterpart of requests_toolbelt's BaseUrlSession on top of a shared aiohttp session."""
+
+    _sessions = weakref.WeakKeyDictionary()
+    connection_limit = DEFAULT_CONNECTION_LIMIT
+
+    def __init__(self, base_url, timeout=1, retries=6, backoff_factor=1):
+        """
+        Initialize the AsyncBaseUrlSession with a base url and retry settings.
+
+        Args:
+            base_url (str): Base URL all relative request urls are joined with.
+            timeout (float, optional): Connect and read timeout for requests. Defaults to 1.
+            retries (int, optional): Maximum number of retries for failed requests. Defaults to 6.
+            backoff_factor (float, optional): Backoff factor between retries, as used by urllib3. Defaults to 1.
+
+        Returns:
+            None.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.auth = None
+        self.rate_limiter = None
+        self.timeout_policy = None
+
+    @classmethod
+    def get_client_session(cls):
+        """
+        Get the aiohttp ClientSession shared by all PyForge clients on the running event loop.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+
+        Returns:
+            aiohttp.ClientSession: The shared client session.
+        """
+        if aiohttp is None:
+            raise ImportError("The asynchronous PyForge clients require aiohttp to be installed.")
+
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=cls.connection_limit, limit_per_host=0)
+            session = aiohttp.ClientSession(connector=connector)
+            cls._sessions[loop] = session
+
+        return session
+
+    @classmethod
+    async def close_client_session(cls):
+        """
+        Close the shared aiohttp ClientSession of the running event loop, if any.
+
+        Returns:
+            None.
+        """
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def create_url(self, url):
+        """
+        Join the given url with the base url.
+
+        Args:
+            url (str): Relative or absolute url.
+
+        Returns:
+            str: Absolute url.
+        """
+        return urljoin(self.base_url, url)
+
+    async def request(self, method, url, headers=None, params=None, data=None, json=None):
+        """
+        Send a request, retrying on connection errors and retryable status codes with exponential backoff.
+
+        Every attempt first waits for the rate limiter of the session, if it has one. If the session has a timeout policy
+        its connect and read timeouts are used instead of the timeout of the session, and the latency is reported to it.
+
+        If a TokenProvider is attached as auth, the request is authenticated with its cached token and replayed once with a
+        renewed token if it is rejected with a 401. The provider is called in the default executor, so a token refresh does
+        not block the event loop.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Url relative to the base url, or an absolute url.
+            headers (dict, optional): Request headers. Defaults to None.
+            params (dict, optional): Query parameters. Defaults to None.
+            data (optional): Request body. Defaults to None.
+            json (optional): JSON serializable request body. Defaults to None.
+
+        Raises:
+            aiohttp.ClientResponseError: If the final response has an error status code.
+
+        Returns:
+            AsyncResponse: The fully read response.
+        """
+        session = self.get_client_session()
+        url = self.create_url(url)
+        if self.timeout_policy is not None:
+            connect_timeout, read_timeout = self.timeout_policy.get_timeout(url)
+        else:
+            connect_timeout, read_timeout = self.timeout, self.timeout
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        retry = method.upper() in RETRY_METHODS
+        attempt = 0
+        token = None
+        replayed = False
+
+        if self.auth is not None:
+            token = await asyncio.get_running_loop().run_in_executor(None, self.auth.get_token)
+
+        while True:
+            if token is not None:
+                headers = dict(headers or {})
+                headers['Authorization'] = "Bearer {}".format(token)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url)
+            try:
+                started = time.perf_counter()
+                async with session.request(method, url, headers=headers, params=params,
+                                           data=data, json=json, timeout=timeout) as resp:
+                    content = await resp.read()
+                    if self.timeout_policy is not None:
+                        self.timeout_policy.observe(url, time.perf_counter() - started)
+                    if resp.status == 401 and token is not None and not replayed:
+                        replayed = True
+                        token = await asyncio.get_running_loop().run_in_executor(None, self.auth.renew_token, token)
+                        continue
+                    if not (retry and resp.status in RETRY_STATUS_CODES and attempt < self.retries):
+                        if resp.status >= 400:
+                            resp.raise_for_status()
+                        return AsyncResponse(resp.status, dict(resp.headers), content, str(resp.url))
+                    retry_after = resp.headers.get('Retry-After')
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not retry or attempt >= self.retries:
+                    raise
+                retry_after = None
+
+            attempt += 1
+            delay = self.backoff_factor * (2 ** (attempt - 1))
+            if retry_after is not None and retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            await asyncio.sleep(delay)
+
+    async def get(self, url, **kwargs):
+        """Send an asynchronous GET request, see AsyncBaseUrlSession.request."""
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        """Send an asynchronous POST request, see AsyncBaseUrlSession.request."""
+        return await self.request('POST', url, **kwargs)
+
+    async def head(self, url, **kwargs):
+        """Send an asynchronous HEAD request, see AsyncBaseUrlSession.request."""
+        return await self.request('HEAD', url, **kwargs)
+
+
+class AsyncForgeApi():
+    """This class provides the base class for asynchronous API calls for Autodesk Forge."""
+
+    def __init__(self, token=None,
+                 base_url=r'https://developer.api.autodesk.com/',
+                 timeout=1, rate_limiter=None, timeout_policy=None):
+        """
+        Initialize the AsyncForgeApi class and optionally attach an authentication token for the Autodesk Forge API.
+
+        All instances running on the same event loop share one aiohttp connection pool. With rate_limiter=True they share
+        the rate limiter of the default registry with the synchronous ForgeApi instances.
+
+        Args:
+            token (str, TokenProvider): Authentication token or token provider for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the forge API.
+                Defaults to r'https://developer.api.autodesk.com/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            rate_limiter (RateLimiter, bool, optional): Rate limiter pacing the requests per endpoint family. True uses the
+                rate limiter of the default registry. Defaults to None, in which case the requests are not rate limited.
+            timeout_policy (TimeoutPolicy, optional): Connect and read timeouts per endpoint template. Defaults to None, in
+                which case timeout is used for all endpoints except the slow model derivative endpoints in
+                DEFAULT_TEMPLATE_TIMEOUTS.
+
+        Returns:
+            None.
+        """
+        self.token = token
+        self.http = AsyncBaseUrlSession(base_url, timeout=timeout)
+        self.http.rate_limiter = default_registry.rate_limiter if rate_limiter is True else rate_limiter or None
+        self.http.timeout_policy = TimeoutPolicy(connect=timeout, read=timeout) if timeout_policy is None else timeout_policy
+        if isinstance(token, TokenProvider):
+            self.http.auth = token
+
+    @staticmethod
+    async def close():
+        """
+        Close the connection pool shared by the asynchronous clients on the running event loop.
+
+        Returns:
+            None.
+        """
+        await AsyncBaseUrlSession.close_client_session()
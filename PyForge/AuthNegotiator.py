@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to authentication on the Autodesk Forge BIM360 platform."""
 from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from PyForge.TokenProvider import TokenProvider, DEFAULT_REFRESH_MARGIN
 
 class OAuth2Negotiator(ForgeApi):
     """Class to negotiate the authentication with the Autodesk Forge Api Authentication servers."""
 
-    def __init__(self, webAddress, clientId, clientSecret, scopes, redirectAddress=None, endAddress=None, timeout=1):
+    def __init__(self, webAddress, clientId, clientSecret, scopes, redirectAddress=None, endAddress=None, timeout=1,
+                 **kwargs):
         """
         Initialize the OAuth2Negotiator class and assign the needed parameters for authentication.
 
@@ -17,6 +20,7 @@ class OAuth2Negotiator(ForgeApi):
             redirectAddress (str, optional): Redirect web address used for 3-legged authentication. Defaults to None.
             endAddress (str, optional): End web address to redirect to after 3-legged authentication has succeeded. Defaults to None.
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
 
         Raises:
             TypeError: If the type of the scopes argument is not list of str this error is raised.
@@ -29,19 +33,32 @@ class OAuth2Negotiator(ForgeApi):
         self.redirectAddress = redirectAddress
         self.clientId = clientId
         self.clientSecret = clientSecret
+        self.scopes = self.make_scopes(scopes)
+        self.endAddress = endAddress
 
-        if type(scopes) == list:
-            self.scopes = ''
-            for scope in scopes:
-                self.scopes += "{} ".format(scope)
-        elif type(scopes) == str:
-            self.scopes = scopes
-        else:
-            raise TypeError(scopes)
+        super().__init__(base_url=webAddress, timeout=timeout, **kwargs)
 
-        self.endAddress = endAddress
+    @staticmethod
+    def make_scopes(scopes):
+        """
+        Make the scope parameter of an authentication request.
 
-        super().__init__(self, base_url=webAddress, timeout=timeout)
+        Args:
+            scopes (list, str): API access scopes, as a list or separated by spaces.
+
+        Raises:
+            TypeError: If the type of the scopes argument is not list of str or str this error is raised.
+
+        Returns:
+            str: The scopes separated by spaces.
+        """
+        if type(scopes) == list and all(type(scope) == str for scope in scopes):
+            return " ".join(scopes)
+
+        if type(scopes) == str:
+            return scopes
+
+        raise TypeError(scopes)
 
     def get_token(self, legs=2):
         """
@@ -81,4 +98,88 @@ class OAuth2Negotiator(ForgeApi):
                                   " and message : {}".format(resp.content) +
                                   " during authentication.")
         else:
-            raise NotImplementedError("3-legged authentication has not been implemented.")
\ No newline at end of file
+            raise NotImplementedError("3-legged authentication has not been implemented.")
+
+    def token_provider(self, legs=2, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        """
+        Create a TokenProvider caching the tokens obtained by this negotiator, to be passed as token to the Api classes.
+
+        Args:
+            legs (int, optional): Indicates if 2- or 3-legged authentication is used. Defaults to 2.
+            refresh_margin (float, optional): Time in s before the token expires at which it is refreshed.
+                Defaults to DEFAULT_REFRESH_MARGIN.
+
+        Returns:
+            TokenProvider: Token provider for this negotiator.
+        """
+        return TokenProvider(self, legs=legs, refresh_margin=refresh_margin)
+
+
+class AsyncOAuth2Negotiator(AsyncForgeApi):
+    """Class to asynchronously negotiate the authentication with the Autodesk Forge Api Authentication servers."""
+
+    def __init__(self, webAddress, clientId, clientSecret, scopes, redirectAddress=None, endAddress=None, timeout=1,
+                 **kwargs):
+        """
+        Initialize the AsyncOAuth2Negotiator class and assign the needed parameters for authentication.
+
+        Args:
+            webAddress (str): Web address for the Autodesk Forge API authentication server.
+            clientId (str): Client id for the Forge App this authentication is used for.
+            clientSecret (str): Client secret for the Forge App this authentication is used for.
+            scopes (list, str): API access scopes requested in the authentication.
+            redirectAddress (str, optional): Redirect web address used for 3-legged authentication. Defaults to None.
+            endAddress (str, optional): End web address to redirect to after 3-legged authentication has succeeded. Defaults to None.
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            kwargs: Additional keyword arguments passed on to AsyncForgeApi, such as rate_limiter.
+
+        Raises:
+            TypeError: If the type of the scopes argument is not list of str this error is raised.
+
+        Returns:
+            None.
+
+        """
+        self.webAddress = webAddress
+        self.redirectAddress = redirectAddress
+        self.clientId = clientId
+        self.clientSecret = clientSecret
+        self.scopes = OAuth2Negotiator.make_scopes(scopes)
+        self.endAddress = endAddress
+
+        super().__init__(base_url=webAddress, timeout=timeout, **kwargs)
+
+    async def get_token(self, legs=2):
+        """
+        Contact the Autodesk Forge API Authentication server and obtain an access token.
+
+        Args:
+            legs (int, optional): Indicates if 2- or 3-legged authentication is used. Defaults to 2.
+
+        Raises:
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            str: Autodesk Forge acces token.
+            int: Time in s that the token stays active.
+
+        """
+        if legs != 2:
+            raise NotImplementedError("3-legged authentication has not been implemented.")
+
+        headers = {'Content-Type' : 'application/x-www-form-urlencoded'}
+
+        data = {'client_id' : self.clientId,
+                'client_secret' : self.clientSecret,
+                'grant_type' : 'client_credentials',
+                'scope' : self.scopes}
+
+        resp = await self.http.post(self.webAddress, headers=headers, data=data)
+
+        if resp.status_code == 200:
+            cont = resp.json()
+            return (cont['access_token'], cont['expires_in'])
+
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " during authentication.")
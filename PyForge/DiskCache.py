@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""Module containing the persistent http response cache for the PyForge package."""
+import datetime
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_MAX_BYTES = 1073741824 # 1 GiB
+
+# Derivatives, metadata GUID lists, object trees and properties of a translated model never change.
+IMMUTABLE_PATTERNS = [r'/designdata/[^/]+/metadata(/|$|\?)',
+                      r'/designdata/[^/]+/manifest/[^?]+']
+
+# Headers describing the transfer of the original body, which no longer apply to the decoded body on disk.
+TRANSFER_HEADERS = ['Content-Encoding', 'Content-Length', 'Transfer-Encoding', 'Connection', 'Keep-Alive']
+
+
+class DiskCache():
+    """Thread-safe persistent cache of GET responses, with revalidation and least recently used eviction."""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, immutable_patterns=None, scope=None):
+        """
+        Initialize the DiskCache class with the directory holding the cache.
+
+        Response bodies are stored as files in the directory, the index is kept in an sqlite database next to them.
+        Responses for urls matching one of the immutable patterns are served from disk without contacting the server,
+        other responses are only stored if they carry an ETag or Last-Modified header and are revalidated on every use.
+
+        Args:
+            directory (str): Directory holding the cache, created if it does not exist.
+            max_bytes (int, optional): Maximum total size of the cached bodies. Defaults to DEFAULT_MAX_BYTES.
+            immutable_patterns (list(str), optional): Regular expressions matching the urls of resources that never change.
+                Defaults to None, in which case IMMUTABLE_PATTERNS is used.
+            scope (str, optional): Stable name of the tenant the responses belong to, e.g. the client id of the app. Caches
+                with different scopes never serve each other's entries, even if they share the directory. Defaults to None.
+
+        Raises:
+            ValueError: If max_bytes is smaller than 0.
+
+        Returns:
+            None.
+        """
+        if max_bytes < 0:
+            raise ValueError("Maximum size of the cache must be at least 0.")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.scope = scope
+        patterns = IMMUTABLE_PATTERNS if immutable_patterns is None else immutable_patterns
+        self.immutable_patterns = [re.compile(pattern) for pattern in patterns]
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(os.path.join(directory, 'index.sqlite'), check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, url TEXT, status INTEGER, "
+                         "headers TEXT, size INTEGER, etag TEXT, last_modified TEXT, immutable INTEGER, accessed REAL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._db.commit()
+
+    def is_immutable(self, url):
+        """
+        Check if the resource at the given url never changes once it was retrieved.
+
+        Args:
+            url (str): Url of the resource.
+
+        Returns:
+            bool: True if the url matches one of the immutable patterns.
+        """
+        return any(pattern.search(url) for pattern in self.immutable_patterns)
+
+    def send(self, send, request, **kwargs):
+        """
+        Answer a GET request from the cache, revalidating or fetching it using the given send function when needed.
+
+        Args:
+            send (callable): Function sending a prepared request, e.g. requests.Session.send.
+            request (requests.PreparedRequest): The GET request.
+            kwargs: Keyword arguments passed on to the send function.
+
+        Returns:
+            requests.Response: The response, with from_cache set to True if its body was read from disk.
+        """
+        key = self.make_key(request)
+        entry = self._lookup(key)
+
+        if entry is not None and entry['immutable']:
+            body = self._read_body(key)
+            if body is not None:
+                self._touch(key, hit=True)
+                return self._build_response(request, entry, body)
+
+        if entry is not None and (entry['etag'] or entry['last_modified']):
+            request = request.copy()
+            if entry['etag']:
+                request.headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        resp = send(request, **kwargs)
+
+        if resp.status_code == 304 and entry is not None:
+            body = self._read_body(key)
+            if body is not None:
+                entry['headers'].update(self._strip_headers(resp.headers))
+                self._touch(key, revalidated=True, headers=entry['headers'])
+                resp.close()
+                return self._build_response(request, entry, body)
+
+        with self._lock:
+            self.misses += 1
+
+        if resp.status_code == 200:
+            self.store(key, resp)
+
+        return resp
+
+    def store(self, key, resp):
+        """
+        Store a response if it can be reused, evicting the least recently used entries if the cache grows too large.
+
+        Args:
+            key (str): Key of the request, see DiskCache.make_key.
+            resp (requests.Response): The response, its body must already have been read.
+
+        Returns:
+            bool: True if the response was stored.
+        """
+        immutable = self.is_immutable(resp.url)
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        body = resp.content
+
+        if not (immutable or etag or last_modified) or len(body) > self.max_bytes:
+            return False
+
+        path = self._body_path(key)
+        tmp_path = "{}.{}.tmp".format(path, threading.get_ident())
+
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+        headers = json.dumps(self._strip_headers(resp.headers))
+
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (key, resp.url, resp.status_code, headers, len(body), etag, last_modified,
+                              int(immutable), time.time()))
+            self._db.commit()
+            self._evict()
+
+        return True
+
+    def invalidate(self, url_prefix=''):
+        """
+        Remove all entries for urls starting with the given prefix.
+
+        Args:
+            url_prefix (str, optional): Prefix of the urls to be removed. Defaults to '', which clears the cache.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        with self._lock:
+            keys = [row[0] for row in self._db.execute("SELECT key FROM entries WHERE substr(url, 1, ?) = ?",
+                                                       (len(url_prefix), url_prefix))]
+            self._remove(keys)
+            self._db.commit()
+
+        return len(keys)
+
+    def size(self):
+        """
+        Get the total size of the cached bodies.
+
+        Returns:
+            int: The size in bytes.
+        """
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def stats(self):
+        """
+        Get the counters of the cache.
+
+        Returns:
+            dict: The number of entries, their total size in bytes, and the number of hits, revalidations and misses.
+        """
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return {'entries' : entries, 'bytes' : size, 'hits' : self.hits,
+                    'revalidations' : self.revalidations, 'misses' : self.misses}
+
+    def close(self):
+        """
+        Close the index of the cache.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._db.close()
+
+    def make_key(self, request):
+        """
+        Get the cache key of a request, made of the scope of the cache, the method and the url.
+
+        The token is not part of the key, so entries are still used after the token was refreshed. Entries that are not
+        immutable are revalidated with the token of the request, immutable entries are served to every request within
+        the same scope.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+
+        Returns:
+            str: The key.
+        """
+        return "{} {} {}".format(self.scope or '', request.method, request.url)
+
+    @staticmethod
+    def _strip_headers(headers):
+        """
+        Get the headers of a response that remain valid for its decoded body.
+
+        Args:
+            headers (dict): The response headers.
+
+        Returns:
+            dict: The headers without the transfer headers.
+        """
+        return {name : value for name, value in headers.items()
+                if name.lower() not in [header.lower() for header in TRANSFER_HEADERS]}
+
+    def _body_path(self, key):
+        """
+        Get the path of the file holding the body of an entry.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            str: The path.
+        """
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf8')).hexdigest())
+
+    def _read_body(self, key):
+        """
+        Read the body of an entry, removing the entry if its file has disappeared.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            bytes: The body, or None if it could not be read.
+        """
+        try:
+            with open(self._body_path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            with self._lock:
+                self._remove([key])
+                self._db.commit()
+            return None
+
+    def _lookup(self, key):
+        """
+        Get the index entry of a key.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            dict: The entry, or None if the key is not cached.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT status, headers, etag, last_modified, immutable FROM entries WHERE key = ?",
+                                   (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        return {'status' : row[0], 'headers' : json.loads(row[1]), 'etag' : row[2],
+                'last_modified' : row[3], 'immutable' : bool(row[4])}
+
+    def _touch(self, key, hit=False, revalidated=False, headers=None):
+        """
+        Mark an entry as used and update the counters.
+
+        Args:
+            key (str): Key of the entry.
+            hit (bool, optional): The entry was served without contacting the server. Defaults to False.
+            revalidated (bool, optional): The entry was confirmed by the server. Defaults to False.
+            headers (dict, optional): New headers of the entry. Defaults to None.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self.hits += hit
+            self.revalidations += revalidated
+            if headers is None:
+                self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            else:
+                self._db.execute("UPDATE entries SET accessed = ?, headers = ? WHERE key = ?",
+                                 (time.time(), json.dumps(headers), key))
+            self._db.commit()
+
+    def _evict(self):
+        """
+        Remove the least recently used entries until the cache fits in max_bytes, the caller must hold the lock.
+
+        Returns:
+            None.
+        """
+        size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+        if size <= self.max_bytes:
+            return
+
+        keys = []
+
+        for key, entry_size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            if size <= self.max_bytes:
+                break
+            keys.append(key)
+            size -= entry_size
+
+        self._remove(keys)
+        self._db.commit()
+
+    def _remove(self, keys):
+        """
+        Remove entries and their body files, the caller must hold the lock and commit.
+
+        Args:
+            keys (list(str)): Keys of the entries.
+
+        Returns:
+            None.
+        """
+        for key in keys:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _build_response(request, entry, body):
+        """
+        Build a response from a cached entry.
+
+        Args:
+            request (requests.PreparedRequest): The request answered from the cache.
+            entry (dict): The index entry.
+            body (bytes): The cached body.
+
+        Returns:
+            requests.Response: The response.
+        """
+        resp = requests.Response()
+        resp.status_code = entry['status']
+        resp.reason = 'OK'
+        resp.headers = CaseInsensitiveDict(entry['headers'])
+        resp.headers['Content-Length'] = str(len(body))
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.url = request.url
+        resp.request = request
+        resp.elapsed = datetime.timedelta(0)
+        resp._content = body
+        resp.from_cache = True
+        return resp
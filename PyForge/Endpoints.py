@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Module containing helpers to group the urls of the Autodesk Forge platform by endpoint."""
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+
+VERSION_SEGMENT = re.compile(r'^v\d+$')
+TWO_SEGMENT_FAMILIES = ('bim360', 'construction', 'data', 'project')
+ID_SEGMENT = re.compile(r'[A-Z.%=~@]|^\d+$|\d.*[-_]|[-_].*\d|^(?=.*\d)[0-9a-z]{16,}$')
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(url):
+    """
+    Get the endpoint template of a url, replacing the path segments holding ids with ':id'.
+
+    A segment is taken to be an id if it contains an upper case letter or one of the characters .%=~@, if it is a number,
+    if it combines digits with dashes or underscores, or if it is a long run of digits and letters. This covers hub,
+    project, folder, version and derivative ids, urns, guids and base64 encoded urns, while names such as 'v1' and 'bim360'
+    are kept. The query string is dropped.
+
+    Args:
+        url (str): An absolute url or a path, e.g. 'https://developer.api.autodesk.com/data/v1/projects/b.abc/folders'.
+
+    Returns:
+        str: The template, e.g. '/data/v1/projects/:id/folders'.
+    """
+    segments = urlparse(url).path.split('/')
+    template = []
+
+    for segment in segments:
+        if segment and not VERSION_SEGMENT.match(segment) and ID_SEGMENT.search(segment):
+            template.append(':id')
+        else:
+            template.append(segment)
+
+    return '/'.join(template) or '/'
+
+
+@lru_cache(maxsize=4096)
+def endpoint_family(url):
+    """
+    Get the endpoint family of a url, the group of endpoints Autodesk Forge applies a shared rate limit to.
+
+    The family is the first segment of the path, or the first two segments for the APIs that are split per service
+    such as 'bim360/admin', 'bim360/docs' and 'data/v1'.
+
+    Args:
+        url (str): An absolute url or a path, e.g. 'https://developer.api.autodesk.com/data/v1/projects/b.abc/folders'.
+
+    Returns:
+        str: The family, e.g. 'data/v1'.
+    """
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+
+    if not segments:
+        return ''
+
+    if segments[0] in TWO_SEGMENT_FAMILIES and len(segments) > 1:
+        return '/'.join(segments[:2])
+
+    return segments[0]
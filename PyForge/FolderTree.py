@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
 """Module containing classes to implementing and navigating data structures from Autodesk Forge BIM360 platform."""
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from PyForge.ForgeFolders import FoldersApi
 
 
@@ -26,18 +33,25 @@ class FolderTree():
         else:
             raise ValueError("FolderTree needs a folder object to be initialized")
         self.parent = parent
+        self._index = None
+        self._snapshot = None
         if children is None:
             self.children = []
         else:
             self.children = children
+            for child in children:
+                child.parent = self
+                child._index = None
 
-    def get_children(self, token, project_id):
+    def get_children(self, token, project_id, folders_api=None):
         """
         Get the children folder JsonApi objects of this FolderTree instance in the form of a list of dicts.
 
         Args:
             token (str): Authentication token for Autodesk Forge API.
             project_id (str): The project id for the project the folder is in.
+            folders_api (FoldersApi, optional): FoldersApi instance to reuse for the request. A new one is created if None.
+                Defaults to None.
 
         Raises:
             ValueError: Is raised if token or project_id are NoneType.
@@ -54,7 +68,9 @@ class FolderTree():
 
         type_filter = 'folders'
 
-        folders_api = FoldersApi(token)
+        if folders_api is None:
+            folders_api = FoldersApi(token)
+
         folder_data, folder_versions = folders_api.get_folder_contents(project_id, self.folder['id'], type_filter)
 
         children_folders = []
@@ -64,29 +80,466 @@ class FolderTree():
 
         return children_folders
 
-    def populate(self, token, project_id):
+    def populate(self, token, project_id, breadth_first=False, max_workers=8, folders_api=None):
         """
         Populate this FolderTree instance recursively down all of its' children in the Autodesk BIM360 folder structure.
 
+        All requests are sent through a single FoldersApi client. In breadth first mode the tree is populated level by level,
+        fetching the children of all folders on a level concurrently with a bounded pool of worker threads.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            project_id (str): The project id for the project the folder is in.
+            breadth_first (bool, optional): Populate the tree level by level with concurrent requests. Defaults to False.
+            max_workers (int, optional): Maximum number of concurrent requests in breadth first mode. Defaults to 8.
+            folders_api (FoldersApi, optional): FoldersApi instance to reuse for the requests. A new one is created if None.
+                Defaults to None.
+
+        Returns:
+            None.
+        """
+        if folders_api is None:
+            folders_api = FoldersApi(token)
+
+        if not breadth_first:
+            children_list = self.get_children(token, project_id, folders_api)
+
+            for child in children_list:
+
+                new_child = self.add_child(child)
+                new_child.populate(token, project_id, folders_api=folders_api)
+
+            return
+
+        level = [self]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            while level:
+
+                children_lists = executor.map(lambda node: node.get_children(token, project_id, folders_api), level)
+
+                next_level = []
+
+                for node, children_list in zip(level, children_lists):
+
+                    for child in children_list:
+
+                        next_level.append(node.add_child(child))
+
+                level = next_level
+
+    def refresh(self, token, project_id, max_workers=8, folders_api=None):
+        """
+        Bring this populated FolderTree instance up to date with the Autodesk BIM360 folder structure, in place.
+
+        The modification time of every folder (lastModifiedTimeRollup, or lastModifiedTime if the API does not report it) is
+        compared with the one seen before. Only folders whose modification time changed have their children fetched, level
+        by level with a bounded pool of worker threads. New folders are added and populated on the following levels with
+        the same pool, deleted folders are removed and changed folders are updated, so unchanged subtrees cost no requests
+        at all.
+
         Args:
             token (str): Authentication token for Autodesk Forge API.
             project_id (str): The project id for the project the folder is in.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            folders_api (FoldersApi, optional): FoldersApi instance to reuse for the requests. A new one is created if None.
+                Defaults to None.
+
+        Returns:
+            dict: Lists of the added, removed and updated FolderTree instances.
+        """
+        if folders_api is None:
+            folders_api = FoldersApi(token)
+
+        changes = {'added' : [], 'removed' : [], 'updated' : []}
+
+        folder = folders_api.get_folder(project_id, self.folder['id'])
+
+        if self.modified_time(folder) is not None and self.modified_time(folder) == self.modified_time(self.folder):
+            return changes
+
+        self._update_folder(folder)
+        changes['updated'].append(self)
+
+        level = [self]
+        # The folders below an added folder are fetched on the following levels and are not reported separately.
+        added = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            while level:
+
+                children_lists = executor.map(lambda node: node.get_children(token, project_id, folders_api), level)
+
+                next_level = []
+
+                for node, children_list in zip(level, children_lists):
+
+                    existing = {child.folder['id'] : child for child in node.children}
+                    seen = set()
+
+                    for child_folder in children_list:
+                        seen.add(child_folder['id'])
+                        child = existing.get(child_folder['id'])
+
+                        if child is None:
+                            child = node.add_child(child_folder)
+                            if node not in added:
+                                changes['added'].append(child)
+                            added.add(child)
+                            next_level.append(child)
+                        elif (self.modified_time(child_folder) is None or
+                              self.modified_time(child_folder) != self.modified_time(child.folder)):
+                            child._update_folder(child_folder)
+                            changes['updated'].append(child)
+                            next_level.append(child)
+
+                    for folder_id, child in existing.items():
+                        if folder_id not in seen:
+                            changes['removed'].append(node.remove_child(child))
+
+                level = next_level
+
+        return changes
+
+    @staticmethod
+    def modified_time(folder):
+        """
+        Get the time a BIM360 Api folder object or any of its contents was last modified.
+
+        Args:
+            folder (dict(JsonApiObject)): The BIM360 Api folder object in the form of a dict.
+
+        Returns:
+            str: lastModifiedTimeRollup, or lastModifiedTime if the folder has no rollup, or None if it has neither.
+        """
+        attributes = folder.get('attributes', {})
+        return attributes.get('lastModifiedTimeRollup', attributes.get('lastModifiedTime'))
+
+    @property
+    def children(self):
+        """
+        Get the children of this FolderTree instance, loading them from the snapshot on first access for a loaded tree.
+
+        Returns:
+            list(FolderTree): The FolderTree objects that are this instance's children.
+        """
+        if self._children is None:
+            self._snapshot.load_children(self)
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        """
+        Set the children of this FolderTree instance.
+
+        Args:
+            children (list(FolderTree)): The FolderTree objects that are this instance's children.
+
+        Returns:
+            None.
+        """
+        self._children = children
+
+    def save(self, path):
+        """
+        Save this FolderTree instance and all of its descendants to an SQLite snapshot, replacing an existing snapshot.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            None.
+        """
+        rows = []
+        stack = [(self, None, 0, '')]
+
+        while stack:
+            node, parent_id, position, node_path = stack.pop()
+            folder = zlib.compress(json.dumps(node.folder).encode('utf8'))
+            rows.append((node.folder['id'], parent_id, position, node.name, node_path, folder))
+            for child_position, child in reversed(list(enumerate(node.children))):
+                child_path = node_path + '/' + child.name if node_path else child.name
+                stack.append((child, node.folder['id'], child_position, child_path))
+
+        # The snapshot is written to a temporary file first, so an existing snapshot is only replaced by a complete one.
+        tmp_path = "{}.{}.tmp".format(path, threading.get_ident())
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        try:
+            db = sqlite3.connect(tmp_path)
+            try:
+                self._write_rows(db, rows)
+            finally:
+                db.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _write_rows(db, rows):
+        """
+        Write the rows of a snapshot to an empty SQLite database.
+
+        Args:
+            db (sqlite3.Connection): Connection to the empty database.
+            rows (list(tuple)): The id, parent id, position, name, path and compressed folder object of every folder.
 
         Returns:
             None.
         """
-        children_list = self.get_children(token, project_id)
+        db.execute("CREATE TABLE folders (id TEXT PRIMARY KEY, parent_id TEXT, position INTEGER, name TEXT, "
+                   "path TEXT, folder BLOB)")
+        db.executemany("INSERT OR REPLACE INTO folders VALUES (?, ?, ?, ?, ?, ?)", rows)
+        db.execute("CREATE INDEX folders_parent ON folders (parent_id, position)")
+        db.execute("CREATE INDEX folders_name ON folders (name)")
+        db.execute("CREATE INDEX folders_path ON folders (path)")
+        db.commit()
+
+    @classmethod
+    def load(cls, path):
+        """
+        Open an SQLite snapshot saved with FolderTree.save without materialising its folders.
+
+        Only the root is read when the snapshot is opened. The children of a folder are read when they are first accessed,
+        and lookups by id, path and name query the snapshot and only load the folders on the way to the results.
+        The snapshot is opened read-only and stays open until the close method of the root is called.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Raises:
+            ValueError: If the file does not contain a FolderTree snapshot.
+
+        Returns:
+            FolderTree: The root of the loaded tree.
+        """
+        return FolderSnapshot(path).load_root()
+
+    def close(self):
+        """
+        Close the snapshot this tree was loaded from, children that were not loaded yet can no longer be accessed.
+
+        Does nothing for a tree that was not loaded from a snapshot.
+
+        Returns:
+            None.
+        """
+        if self.root._snapshot is not None:
+            self.root._snapshot.close()
+
+    @property
+    def name(self):
+        """
+        Get the name of the Autodesk BIM360 folder of this FolderTree instance.
+
+        Returns:
+            str: The folder name.
+        """
+        return self.folder['attributes']['name']
+
+    @property
+    def root(self):
+        """
+        Get the root of the tree this FolderTree instance is part of.
+
+        Returns:
+            FolderTree: The root FolderTree instance.
+        """
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    @property
+    def path(self):
+        """
+        Get the path of this FolderTree instance from the root, e.g. 'Project Files/Design'.
+
+        The name of the root itself is not part of the path, so the path of the root is ''.
+
+        Returns:
+            str: The folder names from the root down to this instance, separated by '/'.
+        """
+        names = []
+        node = self
+        while node.parent is not None:
+            names.append(node.name)
+            node = node.parent
+        return '/'.join(reversed(names))
+
+    def walk(self):
+        """
+        Iterate over this FolderTree instance and all of its descendants, depth first.
+
+        Yields:
+            FolderTree: The FolderTree instances in the order the folders are listed.
+        """
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def _walk_loaded(self):
+        """
+        Iterate over this FolderTree instance and its descendants depth first, without loading children from a snapshot.
+
+        Yields:
+            FolderTree: The FolderTree instances that are in memory.
+        """
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            yield node
+            if node._children is not None:
+                stack.extend(reversed(node._children))
+
+    def add_child(self, folder):
+        """
+        Add a child folder to this FolderTree instance, keeping the indexes of the tree up to date.
+
+        Args:
+            folder (dict(JsonApiObject), FolderTree): The BIM360 Api folder object of the child in the form of a dict,
+                or a FolderTree instance to be attached together with its children.
+
+        Returns:
+            FolderTree: The FolderTree instance of the child.
+        """
+        if isinstance(folder, FolderTree):
+            child = folder
+            child.parent = self
+            child._index = None
+        else:
+            child = FolderTree(folder, self)
+
+        self.children.append(child)
+
+        index = self.root._index
+        if index is not None:
+            for node in child._walk_loaded():
+                index.add(node)
+
+        return child
+
+    def remove_child(self, child):
+        """
+        Remove a child FolderTree instance, together with its descendants, from this FolderTree instance.
+
+        Args:
+            child (FolderTree): The child to be removed.
+
+        Raises:
+            ValueError: If the given FolderTree instance is not a child of this instance.
+
+        Returns:
+            FolderTree: The removed child, which is the root of its own tree afterwards.
+        """
+        if child.parent is not self:
+            raise ValueError("FolderTree is not a child of this folder.")
+
+        index = self.root._index
+        if index is not None:
+            for node in child._walk_loaded():
+                index.remove(node)
+
+        self.children.remove(child)
+        child.parent = None
+        child._index = None
+
+        return child
+
+    def reindex(self):
+        """
+        Rebuild the indexes of the tree, needed after children lists or folder objects were changed directly.
+
+        Returns:
+            None.
+        """
+        root = self.root
+        root._index = FolderIndex()
+        for node in root._walk_loaded():
+            root._index.add(node)
+
+    def find_by_id(self, folder_id):
+        """
+        Find the FolderTree instance of a folder id anywhere in the tree this instance is part of.
+
+        Args:
+            folder_id (str): The id of the Autodesk BIM360 folder, e.g. 'urn:adsk.wipprod:fs.folder:co.abc'.
+
+        Returns:
+            FolderTree: The FolderTree instance, or None if the folder is not in the tree.
+        """
+        node = self._get_index().by_id.get(folder_id)
 
-        for child in children_list:
+        root = self.root
 
-            new_child = FolderTree(child, self)
-            self.children.append(new_child)
-            new_child.populate(token, project_id)
+        if node is None and root._snapshot is not None:
+            node = root._snapshot.find_by_id(root, folder_id)
+
+        return node
+
+    def find_by_path(self, path):
+        """
+        Find the FolderTree instance at a path relative to this FolderTree instance.
+
+        Args:
+            path (str): Folder names separated by '/', e.g. 'Project Files/Design'.
+
+        Returns:
+            FolderTree: The FolderTree instance, or None if there is no folder at the path.
+        """
+        path = path.strip('/')
+        own_path = self.path
+
+        if own_path:
+            path = own_path + '/' + path if path else own_path
+
+        node = self._get_index().by_path.get(path)
+
+        root = self.root
+
+        if node is None and root._snapshot is not None:
+            node = root._snapshot.find_by_path(root, path)
+
+        return node
+
+    def find_all(self, folder_name):
+        """
+        Find all descendants of this FolderTree instance with the given name.
+
+        Args:
+            folder_name (str): The name of the Autodesk BIM360 folders to be searched for.
+
+        Returns:
+            list(FolderTree): The FolderTree instances with the given name, in the order they were added to the tree.
+        """
+        root = self.root
+
+        if root._snapshot is not None:
+            root._snapshot.load_by_name(root, folder_name)
+
+        nodes = self._get_index().by_name.get(folder_name, [])
+
+        if self.parent is None:
+            return [node for node in nodes if node is not self]
+
+        return [node for node in nodes if node is not self and self._is_ancestor_of(node)]
 
     def search_tree(self, folder_name):
         """
         Search the for the FolderTree instance with the given name in this FolderTree's children, recursively.
 
+        The search is a lookup in the name index of the tree. If several folders have the name, the first one in depth first
+        order is returned.
+
         Args:
             folder_name (str): The name of the Autodesk BIM360 folder to be searched for.
 
@@ -94,15 +547,301 @@ class FolderTree():
             FolderTree: FolderTree instance with the given name.
 
         """
-        folder_tree = None
+        nodes = self.find_all(folder_name)
+
+        if not nodes:
+            return None
+
+        if len(nodes) == 1:
+            return nodes[0]
+
+        return min(nodes, key=lambda node: node._position())
+
+    def _update_folder(self, folder):
+        """
+        Replace the BIM360 Api folder object of this FolderTree instance, reindexing its subtree if it was renamed.
+
+        Args:
+            folder (dict(JsonApiObject)): The new BIM360 Api folder object in the form of a dict.
+
+        Returns:
+            None.
+        """
+        index = self.root._index
+
+        if index is None or folder['attributes']['name'] == self.name:
+            self.folder = folder
+            return
+
+        nodes = list(self._walk_loaded())
+
+        for node in nodes:
+            index.remove(node)
+
+        self.folder = folder
+
+        for node in nodes:
+            index.add(node)
+
+    def _get_index(self):
+        """
+        Get the indexes of the tree, building them on first use.
+
+        Returns:
+            FolderIndex: The indexes kept by the root of the tree.
+        """
+        root = self.root
+        if root._index is None:
+            root.reindex()
+        return root._index
+
+    def _is_ancestor_of(self, node):
+        """
+        Check if this FolderTree instance is an ancestor of the given node.
+
+        Args:
+            node (FolderTree): The possible descendant.
+
+        Returns:
+            bool: True if the node is a descendant of this instance.
+        """
+        node = node.parent
+        while node is not None:
+            if node is self:
+                return True
+            node = node.parent
+        return False
+
+    def _position(self):
+        """
+        Get the position of this FolderTree instance in depth first order.
+
+        Returns:
+            list(int): The indexes of the instance and its ancestors among their siblings, from the root down.
+        """
+        position = []
+        node = self
+        while node.parent is not None:
+            position.append(node.parent.children.index(node))
+            node = node.parent
+        return position[::-1]
+
+
+class FolderIndex():
+    """Hash indexes of a FolderTree by folder id, folder name and path, kept by the root of the tree."""
+
+    def __init__(self):
+        """
+        Initialize empty FolderIndex indexes.
+
+        Returns:
+            None.
+        """
+        self.by_id = {}
+        self.by_name = {}
+        self.by_path = {}
+
+    def add(self, node):
+        """
+        Add a FolderTree instance to the indexes.
+
+        Args:
+            node (FolderTree): The instance to be added.
+
+        Returns:
+            None.
+        """
+        self.by_id[node.folder['id']] = node
+        self.by_name.setdefault(node.name, []).append(node)
+        self.by_path[node.path] = node
+
+    def remove(self, node):
+        """
+        Remove a FolderTree instance from the indexes.
+
+        Args:
+            node (FolderTree): The instance to be removed.
+
+        Returns:
+            None.
+        """
+        if self.by_id.get(node.folder['id']) is node:
+            del self.by_id[node.folder['id']]
+
+        nodes = self.by_name.get(node.name, [])
+        if node in nodes:
+            nodes.remove(node)
+            if not nodes:
+                del self.by_name[node.name]
+
+        path = node.path
+        if self.by_path.get(path) is node:
+            del self.by_path[path]
+
+
+class FolderSnapshot():
+    """SQLite snapshot of a FolderTree, loading the folders of the tree on demand."""
+
+    def __init__(self, path):
+        """
+        Initialize the FolderSnapshot class by opening a snapshot saved with FolderTree.save, read-only.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Raises:
+            ValueError: If the file cannot be opened.
+
+        Returns:
+            None.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+
+        try:
+            self._db = sqlite3.connect('{}?mode=ro'.format(pathlib.Path(path).absolute().as_uri()), uri=True,
+                                       check_same_thread=False)
+        except sqlite3.Error:
+            raise ValueError("{} is not a FolderTree snapshot.".format(path))
+
+    def load_root(self):
+        """
+        Read the root folder of the snapshot.
+
+        Raises:
+            ValueError: If the file does not contain a FolderTree snapshot.
+
+        Returns:
+            FolderTree: The root, with its children still to be loaded.
+        """
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT folder FROM folders WHERE parent_id IS NULL").fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+
+        if row is None:
+            self.close()
+            raise ValueError("{} is not a FolderTree snapshot.".format(self.path))
+
+        return self._make_node(row[0], None)
+
+    def load_children(self, node):
+        """
+        Read the children of a FolderTree instance from the snapshot and attach them to it.
 
-        for child in self.children:
+        Args:
+            node (FolderTree): The FolderTree instance whose children are to be loaded.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            if node._children is not None:
+                return
 
-            if child.folder['attributes']['name'] == folder_name:
-                return child
-            else:
-                folder_tree = child.search_tree(folder_name)
-                if folder_tree is not None:
-                    return folder_tree
+            rows = self._db.execute("SELECT folder FROM folders WHERE parent_id = ? ORDER BY position",
+                                    (node.folder['id'],)).fetchall()
+            node._children = [self._make_node(row[0], node) for row in rows]
+
+            index = node.root._index
+            if index is not None:
+                for child in node._children:
+                    index.add(child)
+
+    def find_by_id(self, root, folder_id):
+        """
+        Load the FolderTree instance of a folder id, together with its ancestors.
+
+        Args:
+            root (FolderTree): The root of the loaded tree.
+            folder_id (str): The id of the folder.
 
-        return folder_tree
+        Returns:
+            FolderTree: The FolderTree instance, or None if the folder is not in the snapshot or no longer in the tree.
+        """
+        chain = []
+
+        with self._lock:
+            while folder_id is not None:
+                row = self._db.execute("SELECT parent_id FROM folders WHERE id = ?", (folder_id,)).fetchone()
+                if row is None:
+                    return None
+                chain.append(folder_id)
+                folder_id = row[0]
+
+        chain.reverse()
+
+        if chain[0] != root.folder['id']:
+            return None
+
+        node = root
+
+        for folder_id in chain[1:]:
+            node = next((child for child in node.children if child.folder['id'] == folder_id), None)
+            if node is None:
+                return None
+
+        return node
+
+    def find_by_path(self, root, path):
+        """
+        Load the FolderTree instance at a path from the root, together with its ancestors.
+
+        Args:
+            root (FolderTree): The root of the loaded tree.
+            path (str): Folder names separated by '/'.
+
+        Returns:
+            FolderTree: The FolderTree instance, or None if there is no folder at the path.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT id FROM folders WHERE path = ?", (path,)).fetchone()
+
+        if row is None:
+            return None
+
+        return self.find_by_id(root, row[0])
+
+    def load_by_name(self, root, folder_name):
+        """
+        Load all FolderTree instances with the given name, together with their ancestors, so the name index is complete.
+
+        Args:
+            root (FolderTree): The root of the loaded tree.
+            folder_name (str): The name of the folders.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT id FROM folders WHERE name = ?", (folder_name,)).fetchall()
+
+        for row in rows:
+            self.find_by_id(root, row[0])
+
+    def close(self):
+        """
+        Close the snapshot, children that were not loaded yet can no longer be accessed.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._db.close()
+
+    def _make_node(self, folder, parent):
+        """
+        Create a FolderTree instance for a stored folder, with its children still to be loaded.
+
+        Args:
+            folder (bytes): The compressed BIM360 Api folder object.
+            parent (FolderTree): The parent of the instance, None for the root.
+
+        Returns:
+            FolderTree: The FolderTree instance.
+        """
+        node = FolderTree(json.loads(zlib.decompress(folder).decode('utf8')), parent)
+        node._children = None
+        node._snapshot = self
+        return node
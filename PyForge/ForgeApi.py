@@ -1,32 +1,227 @@
 # -*- coding: utf-8 -*-
 """Module containing the base Api class for the Autodesk Forge platform."""
-from urllib3.util.retry import Retry
+import time
+import requests
+from requests.auth import AuthBase
 from requests_toolbelt import sessions
-from PyForge.TimeoutHttpAdapter import TimeoutHttpAdapter
+from PyForge.TimeoutHttpAdapter import TimeoutPolicy
+from PyForge.TransportRegistry import default_registry
+
+
+class ForgeSession(sessions.BaseUrlSession):
+    """Implementation of the BaseUrlSession class applying a default timeout to all requests."""
+
+    def __init__(self, base_url=None, timeout=None, disk_cache=None, metrics=None, rate_limiter=None,
+                 timeout_policy=None, coalescer=None, response_cache=None):
+        """
+        Initialize the ForgeSession class with a base url and a default timeout.
+
+        Args:
+            base_url (str, optional): Base URL for requests sent using the session. Defaults to None.
+            timeout (float, optional): Default timeout for requests sent using the session. Defaults to None.
+            disk_cache (DiskCache, optional): Persistent cache answering GET requests. Defaults to None.
+            metrics (RequestMetrics, optional): Metrics recording every request sent using the session. Defaults to None.
+            rate_limiter (RateLimiter, optional): Rate limiter every request that goes out to the network waits for.
+                Defaults to None.
+            timeout_policy (TimeoutPolicy, optional): Policy providing the connect and read timeouts per endpoint template,
+                used instead of the default timeout. Defaults to None.
+            coalescer (RequestCoalescer, optional): Coalescer merging identical concurrent GET requests. Defaults to None.
+            response_cache (ResponseCache, optional): In-memory cache answering GET requests, invalidated by the requests
+                with other methods sent using the session. Defaults to None.
+
+        Returns:
+            None.
+        """
+        self.timeout = timeout
+        self.timeout_policy = timeout_policy
+        self.coalescer = coalescer
+        self.response_cache = response_cache
+        self.disk_cache = disk_cache
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        super().__init__(base_url)
+
+    def request(self, method, url, *args, size_hint=None, **kwargs):
+        """
+        Send a request, applying the timeouts of the timeout policy or the default timeout of the session if no timeout is given.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Url relative to the base url, or an absolute url.
+            size_hint (int, optional): Expected size of the response in bytes, extending the read timeout of the timeout
+                policy. Defaults to None.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if kwargs.get('timeout') is None:
+            if self.timeout_policy is not None:
+                kwargs['timeout'] = self.timeout_policy.get_timeout(self.create_url(url), size_hint)
+            else:
+                kwargs['timeout'] = self.timeout
+        return super().request(method, url, *args, **kwargs)
+
+    def send(self, request, **kwargs):
+        """
+        Send a prepared request, answering GET requests from the disk cache of the session if it has one.
+
+        Streamed requests bypass the cache, as their body is not read up front. If the session has metrics, the request is
+        recorded with its latency, including the time to read the body of requests that are not streamed.
+
+        Args:
+            request (requests.PreparedRequest): The request to be sent.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if self.metrics is None:
+            return self._send(request, **kwargs)
+
+        started = time.perf_counter()
+
+        try:
+            resp = self._send(request, **kwargs)
+        except requests.RequestException as e:
+            self.metrics.record_response(request, e.response, time.perf_counter() - started)
+            raise
+
+        self.metrics.record_response(request, resp, time.perf_counter() - started)
+        return resp
+
+    def _send(self, request, **kwargs):
+        """
+        Send a prepared request through the response cache, the coalescer and the disk cache of the session, if it has them
+        and the request is a GET request that is not streamed.
+
+        Other requests invalidate the cached responses they may have made stale.
+
+        Args:
+            request (requests.PreparedRequest): The request to be sent.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if request.method != 'GET' or kwargs.get('stream'):
+            if self.response_cache is None:
+                return self._send_limited(request, **kwargs)
+            try:
+                return self._send_limited(request, **kwargs)
+            finally:
+                self.response_cache.invalidate_for(request)
+        if self.response_cache is not None:
+            return self.response_cache.send(self._send_coalesced, request, **kwargs)
+        return self._send_coalesced(request, **kwargs)
+
+    def _send_coalesced(self, request, **kwargs):
+        """
+        Send a GET request through the coalescer of the session, if it has one.
+
+        Args:
+            request (requests.PreparedRequest): The request to be sent.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if self.coalescer is None:
+            return self._send_cached(request, **kwargs)
+        return self.coalescer.send(self._send_cached, request, **kwargs)
+
+    def _send_cached(self, request, **kwargs):
+        """
+        Send a GET request through the disk cache of the session, if it has one.
+
+        Args:
+            request (requests.PreparedRequest): The request to be sent.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if self.disk_cache is None:
+            return self._send_limited(request, **kwargs)
+        return self.disk_cache.send(self._send_limited, request, **kwargs)
+
+    def _send_limited(self, request, **kwargs):
+        """
+        Send a prepared request to the network, after waiting for the rate limiter of the session if it has one.
+
+        The latency of the request is reported to the timeout policy of the session, if it has one.
+
+        Args:
+            request (requests.PreparedRequest): The request to be sent.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(request.url)
+
+        if self.timeout_policy is None:
+            return super().send(request, **kwargs)
+
+        started = time.perf_counter()
+        resp = super().send(request, **kwargs)
+        self.timeout_policy.observe(request.url, time.perf_counter() - started)
+        return resp
+
 
 class ForgeApi():
     """This class provides the base class for API calls for Autodesk Forge."""
 
     def __init__(self, token=None,
                  base_url=r'https://developer.api.autodesk.com/',
-                 timeout=1):
+                 timeout=1, registry=None, disk_cache=None, metrics=None, rate_limiter=None, timeout_policy=None,
+                 coalesce=False, cache_responses=False):
         """
         Initialize the ForgeApi class and optionally attach an authentication token for the Autodesk Forge API.
 
+        The connection pool of the session is shared with all other ForgeApi instances talking to the same host.
+        If a TokenProvider is given as token it authenticates every request with a cached token that is refreshed before
+        it expires, and replays a request once if it is rejected with a 401.
+
         Args:
-            token (str): Authentication token for Autodesk Forge API.
+            token (str, TokenProvider): Authentication token or token provider for Autodesk Forge API.
             base_url (str, optional): Base URL for calls to the forge API.
                 Defaults to r'https://developer.api.autodesk.com/'
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            registry (TransportRegistry, optional): Registry providing the shared http adapters.
+                Defaults to None, in which case the process-wide default registry is used.
+            disk_cache (DiskCache, optional): Persistent cache answering GET requests, e.g. for immutable model derivatives.
+                Defaults to None.
+            metrics (RequestMetrics, bool, optional): Metrics recording every request per endpoint template.
+                Defaults to None, in which case the metrics of the registry are used. False disables the metrics.
+            rate_limiter (RateLimiter, bool, optional): Rate limiter pacing the requests per endpoint family. True uses the
+                rate limiter of the registry, shared by all ForgeApi instances using it. Defaults to None, in which case the
+                requests are not rate limited.
+            timeout_policy (TimeoutPolicy, optional): Connect and read timeouts per endpoint template. Defaults to None, in
+                which case timeout is used for all endpoints except the slow model derivative endpoints in
+                DEFAULT_TEMPLATE_TIMEOUTS.
+            coalesce (bool, RequestCoalescer, optional): Merge identical concurrent GET requests, with the same url, query
+                parameters and headers, into one request whose response is shared. True uses the coalescer of the
+                registry, shared by all ForgeApi instances using it. Defaults to False.
+            cache_responses (bool, ResponseCache, optional): Answer GET requests to the endpoints with a time to live, such as
+                the hubs, projects, folders and business units, from memory. True uses the response cache of the registry,
+                shared by all ForgeApi instances using it. Defaults to False.
 
         Returns:
             None.
 
         """
         self.token = token
-        self.http = sessions.BaseUrlSession(base_url)
+        self.registry = default_registry if registry is None else registry
+        if metrics is None:
+            metrics = self.registry.metrics
+        if rate_limiter is True:
+            rate_limiter = self.registry.rate_limiter
+        if timeout_policy is None:
+            timeout_policy = TimeoutPolicy(connect=timeout, read=timeout)
+        self.http = ForgeSession(base_url, timeout=timeout, disk_cache=disk_cache, metrics=metrics or None,
+                                 rate_limiter=rate_limiter or None, timeout_policy=timeout_policy,
+                                 coalescer=self.registry.coalescer if coalesce is True else coalesce or None,
+                                 response_cache=(self.registry.response_cache if cache_responses is True
+                                                 else cache_responses or None))
+        if isinstance(token, AuthBase):
+            self.http.auth = token
         self.http.hooks['response'] = [lambda response, *args, **kwargs: response.raise_for_status()]
-        retries = Retry(total=6, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = TimeoutHttpAdapter(timeout=timeout, max_retries=retries)
+        adapter = self.registry.get_adapter(base_url)
         self.http.mount("https://", adapter)
         self.http.mount("http://", adapter)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to business units on the Autodesk Forge BIM360 platform."""
 from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi
 
 
 class BusinessUnitsApi(ForgeApi):
@@ -8,7 +9,7 @@ class BusinessUnitsApi(ForgeApi):
 
     def __init__(self, token,
                  base_url=r'https://developer.api.autodesk.com/hq/v1/accounts/',
-                 timeout=1):
+                 timeout=1, **kwargs):
         """
         Initialize the BusinessUnitsApi class and attach an authentication token for the Autodesk Forge API.
 
@@ -19,12 +20,13 @@ class BusinessUnitsApi(ForgeApi):
                 Which is valid for the US region.
                 For the EU r'https://developer.api.autodesk.com/hq/v1/regions/eu/accounts/' is used.
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
 
         Returns:
             None.
 
         """
-        super().__init__(token=token, base_url=base_url, timeout=timeout)
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
 
     def get_account_business_units(self, account_id=None, endpoint=r':account_id/business_units_structure'):
         """
@@ -50,7 +52,7 @@ class BusinessUnitsApi(ForgeApi):
             raise ValueError("Please enter a account id.")
 
         if account_id.startswith("b."):
-            account_id = project_id[2:]
+            account_id = account_id[2:]
 
         endpoint = endpoint.replace(':account_id', account_id)
 
@@ -71,4 +73,67 @@ class BusinessUnitsApi(ForgeApi):
 
         raise ConnectionError("Request failed with code {}".format(resp.status_code) +
                               " and message : {}".format(resp.content) +
-                              " for endpoint: {}".format(endpoint))
\ No newline at end of file
+                              " for endpoint: {}".format(endpoint))
+
+
+class AsyncBusinessUnitsApi(AsyncForgeApi):
+    """This class provides the asynchronous API calls for Autodesk BIM360 business units."""
+
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/hq/v1/accounts/',
+                 timeout=1):
+        """
+        Initialize the AsyncBusinessUnitsApi class and attach an authentication token for the Autodesk Forge API.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the business unit API.
+                Defaults to r'https://developer.api.autodesk.com/hq/v1/accounts/'
+                Which is valid for the US region.
+                For the EU r'https://developer.api.autodesk.com/hq/v1/regions/eu/accounts/' is used.
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+
+        Returns:
+            None.
+
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout)
+
+    async def get_account_business_units(self, account_id=None, endpoint=r':account_id/business_units_structure'):
+        """
+        Send a GET accounts/:account_id/business_units_structure request to the BIM360 API, returns the business units available to the Autodesk account on the given account.
+
+        Args:
+            account_id (str, optional): The account id for the BIM360 account. Defaults to None.
+            endpoint (str, optional): url endpoint for the GET accounts/:account_id/business_units_structure request. Defaults to r':account_id/business_units_structure'.
+
+        Raises:
+            ValueError: If self.token, account_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            list(dict(JsonApiObject)): List of JsonApi Business Unit objects in the form of dicts.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncBusinessUnitsApi.")
+
+        if account_id is None:
+            raise ValueError("Please enter a account id.")
+
+        if account_id.startswith("b."):
+            account_id = account_id[2:]
+
+        endpoint = endpoint.replace(':account_id', account_id)
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+
+        resp = await self.http.get(endpoint, headers=headers)
+
+        if resp.status_code == 200:
+            return resp.json()['business_units']
+
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(endpoint))
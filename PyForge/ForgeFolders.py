@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to folders on the Autodesk Forge BIM360 platform."""
-import re
 from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from PyForge.Paginator import JsonApiPaginator
 
 
 class FoldersApi(ForgeApi):
@@ -9,7 +10,7 @@ class FoldersApi(ForgeApi):
 
     def __init__(self, token,
                  base_url=r'https://developer.api.autodesk.com/data/v1/projects/',
-                 timeout=1):
+                 timeout=1, **kwargs):
         """
         Initialize the FoldersApi class and attach an authentication token for the Autodesk Forge API.
 
@@ -18,11 +19,12 @@ class FoldersApi(ForgeApi):
             base_url (str, optional): Base URL for calls to the folders API.
                 Defaults to r'https://developer.api.autodesk.com/data/v1/projects/'
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
 
         Returns:
             None.
         """
-        super().__init__(token=token, base_url=base_url, timeout=timeout)
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
 
     def get_folder_contents(self, project_id=None, folder_id=None, type_filter=None,
                             endpoint=r':project_id/folders/:folder_id/contents'):
@@ -44,6 +46,36 @@ class FoldersApi(ForgeApi):
             list(dict(JsonApiObject)): List of JsonApi Data objects in the form of dicts.
             list(dict(JsonApiObject)): List of JsonApi Version objects in the form of dicts.
         """
+        data = []
+        included = []
+
+        for page_data, page_included in self.iter_folder_contents(project_id, folder_id, type_filter, endpoint=endpoint):
+            data += page_data
+            included += page_included
+
+        return data, included
+
+    def iter_folder_contents(self, project_id=None, folder_id=None, type_filter=None, prefetch=True,
+                             endpoint=r':project_id/folders/:folder_id/contents'):
+        """
+        Lazily iterate over the pages of a GET projects/:project_id/folders/:folder_id/contents request to the BIM360 API.
+
+        Args:
+            project_id (str): The project id for the project the folder is in.
+            folder_id (str): The folder id for the folder.
+            type_filter (str, list): BIM360 item type or list of BIM360 item types to filter for.
+            prefetch (bool, optional): Fetch the next page while the current page is being processed. Defaults to True.
+            endpoint (str): endpoint for the GET projects/:project_id/folders/:folder_id/contents request.
+                Defaults to r':project_id/folders/:folder_id/contents'.
+
+        Raises:
+            ValueError: If any of self.token, project_id or folder_id are NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Yields:
+            list(dict(JsonApiObject)): List of JsonApi Data objects of the page in the form of dicts.
+            list(dict(JsonApiObject)): List of JsonApi Version objects of the page in the form of dicts.
+        """
         try:
             token = self.token
         except AttributeError:
@@ -69,50 +101,8 @@ class FoldersApi(ForgeApi):
         if type_filter is not None:
             params.update(self.make_filter_param(type_filter, "type"))
 
-        next_page = -1
-        data = []
-        included = []
-
-        while next_page != 0:
-
-            if next_page > 0:
-
-                params.update({'page[number]' : str(next_page)})
-
-                resp = self.http.get(endpoint, headers=headers, params=params)
-
-            else:
-
-                resp = self.http.get(endpoint, headers=headers, params=params)
-
-            if resp.status_code == 200:
-
-                cont = resp.json()
-                data += cont['data']
-
-                try:
-                    included += cont['included']
-                except KeyError:
-                    pass
-                try:
-                    match = re.search(r'page%5Bnumber%5D=(\d+)', cont['links']['next']['href'])
-
-                    if match is not None:
-                        next_page = int(match.groups()[0])
-                    else:
-                        return data, included
-
-                except KeyError:
-
-                    return data, included
-
-            else:
-                if resp.status_code == 401:
-                    raise ConnectionError("Renew authorization token.")
-
-                raise ConnectionError("Request failed with code {}".format(resp.status_code) +
-                                      " and message : {}".format(resp.content) +
-                                      " for endpoint: {}".format(endpoint))
+        for cont in JsonApiPaginator(self.http, endpoint, headers=headers, params=params, prefetch=prefetch):
+            yield cont['data'], cont.get('included', [])
 
     def get_folder(self, project_id, folder_id, endpoint=r':project_id/folders/:folder_id'):
         """
@@ -163,7 +153,7 @@ class FoldersApi(ForgeApi):
                               " for endpoint: {}".format(endpoint))
 
     def search_folder(self, project_id, folder_id, search_filter, type_filter,
-                      endpoint=r':project_id/folders/:folder_id'):
+                      endpoint=r':project_id/folders/:folder_id/search'):
         """
         Send a GET projects/:project_id/folders/:folder_id/search request to the BIM360 API, recursively searching the folder and subfolders for the given search filter. Returns the search results data JsonApi Objects available to the user in the given search.
 
@@ -172,8 +162,8 @@ class FoldersApi(ForgeApi):
             folder_id (str): The folder id for the folder to be searched.
             search_filter (str, list): The filter(s) to search for.
             type_filter (str, list): Autodesk item type filter(s).
-            endpoint (TYPE, optional): endpoint for the GET projects/:project_id/folders/:folder_id request.
-                Defaults to r':project_id/folders/:folder_id'.
+            endpoint (TYPE, optional): endpoint for the GET projects/:project_id/folders/:folder_id/search request.
+                Defaults to r':project_id/folders/:folder_id/search'.
 
         Raises:
             ValueError: If any of self.token, project_id or folder_id are NoneType.
@@ -184,6 +174,39 @@ class FoldersApi(ForgeApi):
             list(dict(JsonApiObject)): List of JsonApi Data objects in the form of dicts.
             list(dict(JsonApiObject)): List of JsonApi Version objects in the form of dicts.
         """
+        data = []
+        included = []
+
+        for page_data, page_included in self.iter_search_folder(project_id, folder_id, search_filter, type_filter,
+                                                                endpoint=endpoint):
+            data += page_data
+            included += page_included
+
+        return data, included
+
+    def iter_search_folder(self, project_id, folder_id, search_filter, type_filter, prefetch=True,
+                           endpoint=r':project_id/folders/:folder_id/search'):
+        """
+        Lazily iterate over the pages of a GET projects/:project_id/folders/:folder_id/search request to the BIM360 API.
+
+        Args:
+            project_id (str): The project id for the project the folder to be searched is in.
+            folder_id (str): The folder id for the folder to be searched.
+            search_filter (str, list): The filter(s) to search for.
+            type_filter (str, list): Autodesk item type filter(s).
+            prefetch (bool, optional): Fetch the next page while the current page is being processed. Defaults to True.
+            endpoint (TYPE, optional): endpoint for the GET projects/:project_id/folders/:folder_id/search request.
+                Defaults to r':project_id/folders/:folder_id/search'.
+
+        Raises:
+            ValueError: If any of self.token, project_id or folder_id are NoneType.
+            TypeError: If search filter is of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Yields:
+            list(dict(JsonApiObject)): List of JsonApi Data objects of the page in the form of dicts.
+            list(dict(JsonApiObject)): List of JsonApi Version objects of the page in the form of dicts.
+        """
         try:
             token = self.token
         except AttributeError:
@@ -213,71 +236,230 @@ class FoldersApi(ForgeApi):
         if type_filter is not None:
             params.update(self.make_filter_param(type_filter, "type"))
 
-        next_page = -1
-        data = []
-        included = []
+        for cont in JsonApiPaginator(self.http, endpoint, headers=headers, params=params, prefetch=prefetch):
+            yield cont['data'], cont.get('included', [])
 
-        while next_page != 0:
+    def make_filter_param(self, filter_entries, filter_type):
+        """
+        Create a filter query parameter of the given type with the given entries.
 
-            if next_page > 0:
+        Args:
+            filter_entries (str, list): The entries to be filtered for.
+            filter_type (str): The type of filter to be made.
 
-                params.update({'next[page]' : str(next_page)})
+        Raises:
+            TypeError: Raised if the filter_entries parameter is not of type str or list.
 
-                resp = self.http.get(endpoint, params=params, headers=headers)
+        Returns:
+            dict: A filter dictionary to be used as a query parameter.
 
-            else:
+        """
+        if isinstance(filter_entries, list):
+            things = ",".join(filter_entries)
+            return {"filter[{}]".format(filter_type) : things}
+        if isinstance(filter_entries, str):
+            return {"filter[{}]".format(filter_type) : filter_entries}
 
-                resp = self.http.get(endpoint, params=params, headers=headers)
+        raise TypeError("filter_entries parameter has the wrong type: {}".format(type(filter_entries)))
 
-            if resp.status_code == 200:
 
-                cont = resp.json()
-                data += cont['data']
+class AsyncFoldersApi(AsyncForgeApi):
+    """This class provides the asynchronous API calls for Autodesk BIM360 folders."""
 
-                try:
-                    included += cont['included']
-                except KeyError:
-                    pass
+    make_filter_param = FoldersApi.make_filter_param
 
-                try:
-                    match = re.search(r'page%5Bnumber%5D=(\d+)', cont['links']['next']['href'])
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/data/v1/projects/',
+                 timeout=1):
+        """
+        Initialize the AsyncFoldersApi class and attach an authentication token for the Autodesk Forge API.
 
-                    if match is not None:
-                        next_page = int(match.groups()[0])
-                    else:
-                        return data, included
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the folders API.
+                Defaults to r'https://developer.api.autodesk.com/data/v1/projects/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
 
-                except KeyError:
+        Returns:
+            None.
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout)
 
-                    return data, included
+    async def get_folder_contents(self, project_id=None, folder_id=None, type_filter=None,
+                                  endpoint=r':project_id/folders/:folder_id/contents'):
+        """
+        Send a GET projects/:project_id/folders/:folder_id/contents request to the BIM360 API, returns the folder contents available to the Autodesk account on the given hub.
 
-            else:
-                if resp.status_code == 401:
-                    raise ConnectionError("Renew authorization token.")
+        Args:
+            project_id (str): The project id for the project the folder is in.
+            folder_id (str): The folder id for the folder.
+            type_filter (str, list): BIM360 item type or list of BIM360 item types to filter for.
+            endpoint (str): endpoint for the GET projects/:project_id/folders/:folder_id/contents request.
+                Defaults to r':project_id/folders/:folder_id/contents'.
 
-                raise ConnectionError("Request failed with code {}".format(resp.status_code) +
-                                      " and message : {}".format(resp.content) +
-                                      " for endpoint: {}".format(endpoint))
+        Raises:
+            ValueError: If any of self.token, project_id or folder_id are NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
 
-    def make_filter_param(self, filter_entries, filter_type):
+        Returns:
+            list(dict(JsonApiObject)): List of JsonApi Data objects in the form of dicts.
+            list(dict(JsonApiObject)): List of JsonApi Version objects in the form of dicts.
         """
-        Create a filter query parameter of the given type with the given entries.
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncFoldersApi.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if not project_id.startswith("b."):
+            project_id = "b.{}".format(project_id)
+
+        if folder_id is None:
+            raise ValueError("Please enter a folder id.")
+
+        endpoint = endpoint.replace(':project_id', project_id).replace(':folder_id', folder_id)
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+
+        params = {}
+
+        if type_filter is not None:
+            params.update(self.make_filter_param(type_filter, "type"))
+
+        return await self._get_pages(endpoint, headers, params)
+
+    async def get_folder(self, project_id, folder_id, endpoint=r':project_id/folders/:folder_id'):
+        """
+        Send a GET projects/:project_id/folders/:folder_id request to the BIM360 API, returns the folder JsonApiObject available to the Autodesk account on the given hub for the given project id.
 
         Args:
-            filter_entries (str, list): The entries to be filtered for.
-            filter_type (str): The type of filter to be made.
+            project_id (str): The project id for the project the folder is in.
+            folder_id (str): The folder id for the folder.
+            endpoint (str, optional): endpoint for the GET projects/:project_id/folders/:folder_id request.
+                Defaults to r':project_id/folders/:folder_id'.
 
         Raises:
-            TypeError: Raised if the filter_entries parameter is not of type str or list.
+            ValueError: If any of self.token, project_id or folder_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
 
         Returns:
-            dict: A filter dictionary to be used as a query parameter.
+            dict(JsonApiObject): JsonApi Folder object in the form of a dict.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncFoldersApi.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
 
+        if not project_id.startswith("b."):
+            project_id = "b.{}".format(project_id)
+
+        if folder_id is None:
+            raise ValueError("Please enter a folder id.")
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+        endpoint = endpoint.replace(':project_id', project_id).replace(':folder_id', folder_id)
+
+        resp = await self.http.get(endpoint, headers=headers)
+
+        if resp.status_code == 200:
+            cont = resp.json()
+            return cont['data']
+
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(endpoint))
+
+    async def search_folder(self, project_id, folder_id, search_filter, type_filter,
+                            endpoint=r':project_id/folders/:folder_id/search'):
         """
-        if isinstance(filter_entries, list):
-            things = ",".join(filter_entries)
-            return {"filter[{}]".format(filter_type) : things}
-        if isinstance(filter_entries, str):
-            return {"filter[{}]".format(filter_type) : filter_entries}
+        Send a GET projects/:project_id/folders/:folder_id/search request to the BIM360 API, recursively searching the folder and subfolders for the given search filter. Returns the search results data JsonApi Objects available to the user in the given search.
 
-        raise TypeError("filter_entries parameter has the wrong type: {}".format(type(filter_entries)))
+        Args:
+            project_id (str): The project id for the project the folder to be searched is in.
+            folder_id (str): The folder id for the folder to be searched.
+            search_filter (str, list): The filter(s) to search for.
+            type_filter (str, list): Autodesk item type filter(s).
+            endpoint (TYPE, optional): endpoint for the GET projects/:project_id/folders/:folder_id/search request.
+                Defaults to r':project_id/folders/:folder_id/search'.
+
+        Raises:
+            ValueError: If any of self.token, project_id or folder_id are NoneType.
+            TypeError: If search filter is of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            list(dict(JsonApiObject)): List of JsonApi Data objects in the form of dicts.
+            list(dict(JsonApiObject)): List of JsonApi Version objects in the form of dicts.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncFoldersApi.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if not project_id.startswith("b."):
+            project_id = "b.{}".format(project_id)
+
+        if folder_id is None:
+            raise ValueError("Please enter a folder id.")
+
+        endpoint = endpoint.replace(':project_id', project_id).replace(':folder_id', folder_id)
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+
+        params = {}
+
+        if search_filter is not None:
+            params.update(self.make_filter_param(search_filter, "name"))
+        else:
+            raise TypeError("Search filter can not be NoneType")
+
+        if type_filter is not None:
+            params.update(self.make_filter_param(type_filter, "type"))
+
+        return await self._get_pages(endpoint, headers, params)
+
+    async def _get_pages(self, endpoint, headers, params):
+        """
+        Collect the data and included JsonApi objects of all pages of a paginated folder request.
+
+        Args:
+            endpoint (str): endpoint of the first page.
+            headers (dict): Request headers.
+            params (dict): Query parameters of the first page.
+
+        Raises:
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            list(dict(JsonApiObject)): List of JsonApi Data objects in the form of dicts.
+            list(dict(JsonApiObject)): List of JsonApi Version objects in the form of dicts.
+        """
+        data = []
+        included = []
+
+        while True:
+
+            resp = await self.http.get(endpoint, headers=headers, params=params)
+
+            if resp.status_code != 200:
+                raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                      " and message : {}".format(resp.content) +
+                                      " for endpoint: {}".format(endpoint))
+
+            cont = resp.json()
+            data += cont['data']
+            included += cont.get('included', [])
+
+            endpoint = JsonApiPaginator.next_link(cont)
+            params = None
+
+            if endpoint is None:
+                return data, included
@@ -1,16 +1,52 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to deriving model data from the Autodesk Forge BIM360 platform."""
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
 from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from PyForge.JsonStream import JsonArrayStream
+from PyForge.Poller import Poller
 from urllib.parse import quote_plus
 import base64
 
+CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(?:\d+|\*)$')
+
+
+def make_endpoint(endpoint, urn, guid=None, derivative_urn=None):
+    """
+    Fill in the placeholders of a Model Derivative endpoint.
+
+    Args:
+        endpoint (str): Endpoint containing the :urn and optionally the :guid and :derivativeUrn placeholders.
+        urn (str): The urn for the BIM360 model, which is base64 encoded.
+        guid (str, optional): The guid for the model view. Defaults to None.
+        derivative_urn (str, optional): The urn for the derivative, which is url encoded. Defaults to None.
+
+    Returns:
+        str: The endpoint, e.g. 'dXJuOmFkc2sud2lwcHJvZDpmcy5maWxlOnZmLmFiYz92ZXJzaW9uPTE=/metadata/:guid' for
+        make_endpoint(':urn/metadata/:guid', 'urn:adsk.wipprod:fs.file:vf.abc?version=1').
+    """
+    endpoint = endpoint.replace(':urn', base64.urlsafe_b64encode(urn.encode('utf8')).decode('utf8'))
+
+    if guid is not None:
+        endpoint = endpoint.replace(':guid', guid)
+
+    if derivative_urn is not None:
+        endpoint = endpoint.replace(':derivativeUrn', quote_plus(derivative_urn))
+
+    return endpoint
+
 
 class ModelDerivativeApi(ForgeApi):
     """This class provides the base API calls for Autodesk BIM360 model derivatives."""
 
     def __init__(self, token,
                  base_url=r'https://developer.api.autodesk.com/modelderivative/v2/designdata/',
-                 timeout=1):
+                 timeout=1, poller=None, **kwargs):
         """
         Initialize the ModelDerivativeApi class and attach an authentication token for the Autodesk Forge API.
 
@@ -19,12 +55,16 @@ class ModelDerivativeApi(ForgeApi):
             base_url (str, optional): Base URL for calls to the model derivative API.
                 Defaults to r'https://developer.api.autodesk.com/modelderivative/v2/designdata/'
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            poller (Poller, optional): Poller repeating requests that are answered with 202 Accepted.
+                Defaults to None, in which case a Poller with the default backoff settings is used.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry or disk_cache.
 
         Returns:
             None.
 
         """
-        super().__init__(token=token, base_url=base_url, timeout=timeout)
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
+        self.poller = Poller() if poller is None else poller
 
     def get_manifest(self, urn=None, accept_encoding=None, endpoint=r':urn/manifest'):
         """
@@ -50,9 +90,7 @@ class ModelDerivativeApi(ForgeApi):
         if urn is None:
             raise ValueError("Please enter an urn.")
 
-        urn = base64.urlsafe_b64encode(urn.encode('utf8'))
-
-        endpoint = endpoint.replace(':urn', urn.decode('utf8'))
+        endpoint = make_endpoint(endpoint, urn)
 
         headers = {}
 
@@ -73,15 +111,15 @@ class ModelDerivativeApi(ForgeApi):
                               " and message : {}".format(resp.content) +
                               " for endpoint: {}".format(endpoint))
 
-    def get_derivative(self, urn=None, derivative_urn=None, endpoint=r':urn/manifest/:derivativeUrn'):
+    def get_derivative(self, urn=None, derivative_urn=None, stream=False, endpoint=r':urn/manifest/:derivativeUrn'):
         """
         Send a GET  :urn/manifest/:derivativeurn request to the BIM360 API, Downloads a selected derivative.
 
         Args:
             urn (str, optional): The urn for the BIM360 model. Defaults to None.
             derivative_urn (str, optional): The urn for the chosen derivative. Defaults to None.
-            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
-            x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            stream (bool, optional): Leave the body of the response unread so it can be consumed in chunks, see also
+                download_derivative. Defaults to False.
             endpoint (str, optional):  endpoint for the GET /:urn/metadata/:guid. Defaults to r':urn/manifest/:derivativeUrn'
 
         Raises:
@@ -99,20 +137,13 @@ class ModelDerivativeApi(ForgeApi):
         if urn is None:
             raise ValueError("Please enter an urn.")
 
-        urn = base64.urlsafe_b64encode(urn.encode('utf8'))
-
-        endpoint = endpoint.replace(':urn', urn.decode('utf8'))
-
-        endpoint = endpoint.replace(':derivativeUrn', quote_plus(derivative_urn))
+        endpoint = make_endpoint(endpoint, urn, derivative_urn=derivative_urn)
 
         headers = {}
 
         headers.update({'Authorization' : "Bearer {}".format(token)})
 
-        resp = self.http.get(endpoint, headers=headers)
-
-        while resp.status_code == 202:
-            resp = self.http.get(endpoint, headers=headers)
+        resp = self.poller.poll(lambda: self.http.get(endpoint, headers=headers, stream=stream))
 
         if resp.status_code == 200:
             return resp
@@ -124,6 +155,207 @@ class ModelDerivativeApi(ForgeApi):
                               " and message : {}".format(resp.content) +
                               " for endpoint: {}".format(endpoint))
 
+    def download_derivative(self, urn=None, derivative_urn=None, path=None, chunk_size=1048576,
+                            segment_size=67108864, max_workers=4, retries=3,
+                            endpoint=r':urn/manifest/:derivativeUrn'):
+        """
+        Download a selected derivative to disk, fetching large derivatives as parallel HTTP Range segments.
+
+        The download is written to path + '.part' and its progress to path + '.part.json', so a download that failed
+        is resumed where it stopped when this method is called again. The file is only moved to the given path after its
+        size has been checked against the Content-Length of the derivative.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            derivative_urn (str, optional): The urn for the chosen derivative. Defaults to None.
+            path (str, optional): Path of the file the derivative is written to. Defaults to None.
+            chunk_size (int, optional): Number of bytes read from a response and written at a time. Defaults to 1048576.
+            segment_size (int, optional): Size in bytes of the Range segments. Defaults to 67108864.
+            max_workers (int, optional): Maximum number of segments downloaded concurrently. Defaults to 4.
+            retries (int, optional): Number of times a failed segment is resumed before giving up. Defaults to 3.
+            endpoint (str, optional):  endpoint for the GET :urn/manifest/:derivativeUrn. Defaults to r':urn/manifest/:derivativeUrn'
+
+        Raises:
+            ValueError: If any of self.token, urn, derivative_urn and path are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API,
+                if a response does not match the requested range, or if the downloaded size does not match the
+                Content-Length of the derivative.
+
+        Returns:
+            str: The path the derivative was written to.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the ModelDerivativeApi.")
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        if derivative_urn is None:
+            raise ValueError("Please enter a derivative urn.")
+
+        if path is None:
+            raise ValueError("Please enter a path.")
+
+        endpoint = make_endpoint(endpoint, urn, derivative_urn=derivative_urn)
+
+        headers = {}
+
+        headers.update({'Authorization' : "Bearer {}".format(token)})
+        headers.update({'Accept-Encoding' : 'identity'})
+
+        resp = self.poller.poll(lambda: self.http.head(endpoint, headers=headers))
+
+        if resp.status_code != 200:
+            raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                  " and message : {}".format(resp.content) +
+                                  " for endpoint: {}".format(endpoint))
+
+        size = resp.headers.get('Content-Length')
+        size = int(size) if size is not None else None
+        etag = resp.headers.get('ETag')
+        part_path = path + '.part'
+        state_path = path + '.part.json'
+
+        if size is None or resp.headers.get('Accept-Ranges', '').lower() != 'bytes':
+            resp = self.http.get(endpoint, headers=headers, stream=True, size_hint=size)
+            try:
+                if resp.status_code != 200:
+                    raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                          " for endpoint: {}".format(endpoint))
+
+                received = 0
+                with open(part_path, 'wb') as part_file:
+                    for chunk in resp.iter_content(chunk_size):
+                        part_file.write(chunk)
+                        received += len(chunk)
+            finally:
+                resp.close()
+
+            if size is not None and received != size:
+                raise ConnectionError("Downloaded {} bytes".format(received) +
+                                      " while {} bytes were expected".format(size) +
+                                      " for endpoint: {}".format(endpoint))
+        else:
+            state = None
+            if os.path.exists(state_path) and os.path.exists(part_path):
+                try:
+                    with open(state_path, 'r') as state_file:
+                        state = json.load(state_file)
+                except (OSError, ValueError):
+                    state = None
+                # A progress file that cannot be used means starting over.
+                if (not isinstance(state, dict) or state.get('size') != size or state.get('etag') != etag or
+                        not isinstance(state.get('done'), dict) or not isinstance(state.get('segment_size'), int) or
+                        state['segment_size'] < 1):
+                    state = None
+
+            if state is None:
+                state = {'size' : size, 'etag' : etag, 'segment_size' : segment_size, 'done' : {}}
+                with open(part_path, 'wb') as part_file:
+                    part_file.truncate(size)
+
+            segment_size = state['segment_size']
+            lock = threading.Lock()
+
+            def save_progress(start, done):
+                with lock:
+                    state['done'][str(start)] = done
+                    tmp_path = state_path + '.tmp'
+                    with open(tmp_path, 'w') as state_file:
+                        json.dump(state, state_file)
+                    os.replace(tmp_path, state_path)
+
+            segments = [(start, min(start + segment_size, size)) for start in range(0, size, segment_size)]
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._download_segment, endpoint, headers, part_path, start, end,
+                                           state['done'].get(str(start), 0), chunk_size, retries, save_progress)
+                           for start, end in segments if state['done'].get(str(start), 0) < end - start]
+                for future in futures:
+                    future.result()
+
+            received = sum(state['done'].get(str(start), 0) for start, end in segments)
+            if received != size:
+                raise ConnectionError("Downloaded {} bytes".format(received) +
+                                      " while {} bytes were expected".format(size) +
+                                      " for endpoint: {}".format(endpoint))
+
+        os.replace(part_path, path)
+
+        if os.path.exists(state_path):
+            os.remove(state_path)
+
+        return path
+
+    def _download_segment(self, endpoint, headers, part_path, start, end, done, chunk_size, retries, save_progress):
+        """
+        Download the byte range [start, end) of a derivative into the partial file, resuming from the bytes already done.
+
+        Args:
+            endpoint (str): endpoint of the derivative.
+            headers (dict): Request headers.
+            part_path (str): Path of the partial file, which already has the full size of the derivative.
+            start (int): Offset of the first byte of the segment.
+            end (int): Offset of the byte after the segment.
+            done (int): Number of bytes of the segment that were already downloaded.
+            chunk_size (int): Number of bytes read from the response and written at a time.
+            retries (int): Number of times the segment is resumed after a failure.
+            save_progress (callable): Function recording the number of bytes of the segment that are on disk.
+
+        Raises:
+            ConnectionError: If the server does not answer with the requested range, or sends more bytes than requested.
+
+        Returns:
+            None.
+        """
+        attempt = 0
+
+        while done < end - start:
+            before = done
+            range_headers = dict(headers)
+            range_headers.update({'Range' : "bytes={}-{}".format(start + done, end - 1)})
+
+            try:
+                resp = self.http.get(endpoint, headers=range_headers, stream=True,
+                                     size_hint=end - start - done)
+                try:
+                    if resp.status_code != 206:
+                        raise ConnectionError("Range request failed with code {}".format(resp.status_code) +
+                                              " for endpoint: {}".format(endpoint))
+
+                    content_range = CONTENT_RANGE.match(resp.headers.get('Content-Range', ''))
+                    if (content_range is None or int(content_range.group(1)) != start + done
+                            or not start + done <= int(content_range.group(2)) < end):
+                        raise ConnectionError("Range request for bytes {}-{}".format(start + done, end - 1) +
+                                              " was answered with Content-Range: {}".format(resp.headers.get('Content-Range')) +
+                                              " for endpoint: {}".format(endpoint))
+
+                    with open(part_path, 'r+b') as part_file:
+                        part_file.seek(start + done)
+                        for chunk in resp.iter_content(chunk_size):
+                            if len(chunk) > end - start - done:
+                                raise ConnectionError("Range request for bytes {}-{}".format(start, end - 1) +
+                                                      " returned more bytes than requested" +
+                                                      " for endpoint: {}".format(endpoint))
+                            part_file.write(chunk)
+                            part_file.flush()
+                            done += len(chunk)
+                            save_progress(start, done)
+                finally:
+                    resp.close()
+            except requests.RequestException:
+                attempt += 1
+                if attempt > retries:
+                    raise
+                continue
+
+            if done == before:
+                attempt += 1
+                if attempt > retries:
+                    raise ConnectionError("Range request returned no data for endpoint: {}".format(endpoint))
+
     def get_metadata_ids(self, urn=None, accept_encoding=None, endpoint=r':urn/metadata'):
         """
         Send a GET :urn/metadata request to the BIM360 API, returns the available metadata ID's for the model.
@@ -148,9 +380,7 @@ class ModelDerivativeApi(ForgeApi):
         if urn is None:
             raise ValueError("Please enter an urn.")
 
-        urn = base64.urlsafe_b64encode(urn.encode('utf8'))
-
-        endpoint = endpoint.replace(':urn', urn.decode('utf8'))
+        endpoint = make_endpoint(endpoint, urn)
 
         headers = {}
 
@@ -172,7 +402,7 @@ class ModelDerivativeApi(ForgeApi):
                               " for endpoint: {}".format(endpoint))
 
     def get_object_tree(self, urn=None, guid=None, accept_encoding=None, x_ads_force='true', forceget='true',
-                        endpoint=r':urn/metadata/:guid'):
+                        size_hint=None, endpoint=r':urn/metadata/:guid'):
         """
         Send a GET :urn/metadata/:guid request to the BIM360 API, returns the object tree for the given metadata id (corresponding to a model view) for the model.
 
@@ -181,6 +411,8 @@ class ModelDerivativeApi(ForgeApi):
             guid (str, optional): The guid for the chosen model view. Defaults to None.
             accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
             x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            size_hint (int, optional): Expected size of the response in bytes, e.g. the size of an earlier response for the
+                same view, extending the read timeout of the timeout policy of the session. Defaults to None.
             endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid. Defaults to r':urn/metadata/:guid'
 
         Raises:
@@ -198,11 +430,7 @@ class ModelDerivativeApi(ForgeApi):
         if urn is None:
             raise ValueError("Please enter an urn.")
 
-        urn = base64.urlsafe_b64encode(urn.encode('utf8'))
-
-        endpoint = endpoint.replace(':urn', urn.decode('utf8'))
-
-        endpoint = endpoint.replace(':guid', guid)
+        endpoint = make_endpoint(endpoint, urn, guid=guid)
 
         headers = {}
 
@@ -219,10 +447,8 @@ class ModelDerivativeApi(ForgeApi):
             if isinstance(forceget, str):
                 params.update({'forceget' : forceget})
 
-        resp = self.http.get(endpoint, headers=headers)
-
-        while resp.status_code == 202:
-            resp = self.http.get(endpoint, headers=headers)
+        resp = self.poller.poll(lambda: self.http.get(endpoint, headers=headers, params=params,
+                                                      size_hint=size_hint))
 
         if resp.status_code == 200:
             return resp.json()['data']
@@ -235,7 +461,8 @@ class ModelDerivativeApi(ForgeApi):
                               " for endpoint: {}".format(endpoint))
 
     def get_object_properties(self, urn=None, guid=None, accept_encoding=None, x_ads_force='true',
-                              object_id=None, forceget='true', endpoint=r':urn/metadata/:guid/properties'):
+                              object_id=None, forceget='true', size_hint=None,
+                              endpoint=r':urn/metadata/:guid/properties'):
         """
         Send a GET :urn/metadata/:guid/properties request to the BIM360 API, returns all object properties for the given metadata id (corresponding to a model view) for the model.
 
@@ -245,6 +472,8 @@ class ModelDerivativeApi(ForgeApi):
             accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
             x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
             object_id (str, optional): Specific Object id for which the properties are to be found. Defaults to True.
+            size_hint (int, optional): Expected size of the response in bytes, e.g. the size of an earlier response for the
+                same view, extending the read timeout of the timeout policy of the session. Defaults to None.
             endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid/properties. Defaults to r':urn/metadata/:guid/properties'
 
         Raises:
@@ -262,11 +491,7 @@ class ModelDerivativeApi(ForgeApi):
         if urn is None:
             raise ValueError("Please enter an urn.")
 
-        urn = base64.urlsafe_b64encode(urn.encode('utf8'))
-
-        endpoint = endpoint.replace(':urn', urn.decode('utf8'))
-
-        endpoint = endpoint.replace(':guid', guid)
+        endpoint = make_endpoint(endpoint, urn, guid=guid)
 
         headers = {}
 
@@ -286,10 +511,8 @@ class ModelDerivativeApi(ForgeApi):
             if isinstance(forceget, str):
                 params.update({'forceget' : forceget})
 
-        resp = self.http.get(endpoint, headers=headers, params=params)
-
-        while resp.status_code == 202:
-            resp = self.http.get(endpoint, headers=headers, params=params)
+        resp = self.poller.poll(lambda: self.http.get(endpoint, headers=headers, params=params,
+                                                      size_hint=size_hint))
 
         if resp.status_code == 200:
             return resp.json()['data']
@@ -299,4 +522,443 @@ class ModelDerivativeApi(ForgeApi):
 
         raise ConnectionError("Request failed with code {}".format(resp.status_code) +
                               " and message : {}".format(resp.content) +
-                              " for endpoint: {}".format(endpoint))
\ No newline at end of file
+                              " for endpoint: {}".format(endpoint))
+
+
+    def iter_object_properties(self, urn=None, guid=None, accept_encoding=None, x_ads_force='true',
+                               object_id=None, forceget='true', chunk_size=65536, size_hint=None,
+                               endpoint=r':urn/metadata/:guid/properties'):
+        """
+        Stream a GET :urn/metadata/:guid/properties request to the BIM360 API, yielding the object properties for the given metadata id (corresponding to a model view) one object at a time.
+
+        The response body is read and parsed incrementally, so memory use stays bounded regardless of the size of the model.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            guid (str, optional): The guid for the chosen model view. Defaults to None.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            object_id (str, optional): Specific Object id for which the properties are to be found. Defaults to None.
+            forceget (str, optional): Specifies if large property sets are to be retrieved anyway. Defaults to true.
+            chunk_size (int, optional): Number of bytes read from the response at a time. Defaults to 65536.
+            size_hint (int, optional): Expected size of the response in bytes, e.g. the size of an earlier response for the
+                same view, extending the read timeout of the timeout policy of the session. Defaults to None.
+            endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid/properties. Defaults to r':urn/metadata/:guid/properties'
+
+        Raises:
+            ValueError: If any of self.token, urn and guid are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Yields:
+            dict: Properties of a single object of the collection in the form of a dict.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the ModelDerivativeApi.")
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        if guid is None:
+            raise ValueError("Please enter a guid.")
+
+        endpoint = make_endpoint(endpoint, urn, guid=guid)
+
+        headers = {}
+
+        headers.update({'Authorization' : "Bearer {}".format(token)})
+        if accept_encoding is not None:
+            if accept_encoding in ['*', 'gzip']:
+                headers.update({'Accept-Encoding' : accept_encoding})
+        if x_ads_force in ['true', 'false']:
+            headers.update({'x-ads-force' : x_ads_force})
+
+        params = {}
+
+        if object_id is not None:
+            if isinstance(object_id, (int, str)):
+                params.update({'objectid' : object_id})
+        if forceget is not None:
+            if isinstance(forceget, str):
+                params.update({'forceget' : forceget})
+
+        resp = self.poller.poll(lambda: self.http.get(endpoint, headers=headers, params=params, stream=True,
+                                                      size_hint=size_hint))
+
+        try:
+            if resp.status_code == 200:
+                yield from JsonArrayStream(resp.iter_content(chunk_size), ('data', 'collection'))
+                return
+
+            if resp.status_code == 401:
+                raise ConnectionError("Renew authorization token.")
+
+            raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                  " and message : {}".format(resp.content) +
+                                  " for endpoint: {}".format(endpoint))
+        finally:
+            resp.close()
+
+    def get_object_trees(self, urn_guids, accept_encoding=None, x_ads_force='true', forceget='true', max_workers=8,
+                         size_hint=None, endpoint=r':urn/metadata/:guid'):
+        """
+        Send GET :urn/metadata/:guid requests for many model views at once, polling all pending views from a single scheduler.
+
+        Args:
+            urn_guids (list(tuple(str, str))): The (urn, guid) pairs of the model views.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            forceget (str, optional): Specifies if large trees are to be retrieved anyway. Defaults to true.
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to 8.
+            size_hint (int, optional): Expected size of each response in bytes, extending the read timeout of the timeout
+                policy of the session. Defaults to None.
+            endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid. Defaults to r':urn/metadata/:guid'
+
+        Raises:
+            ValueError: If self.token is of NoneType.
+
+        Returns:
+            tuple(dict, dict): The object trees by (urn, guid), and the exceptions of the failed model views by (urn, guid).
+        """
+        params = {}
+
+        if isinstance(forceget, str):
+            params.update({'forceget' : forceget})
+
+        return self._get_many(urn_guids, endpoint, self._make_headers(accept_encoding, x_ads_force), params, max_workers,
+                              size_hint)
+
+    def get_objects_properties(self, urn_guids, accept_encoding=None, x_ads_force='true', forceget='true', max_workers=8,
+                               size_hint=None, endpoint=r':urn/metadata/:guid/properties'):
+        """
+        Send GET :urn/metadata/:guid/properties requests for many model views at once, polling all pending views from a single scheduler.
+
+        Args:
+            urn_guids (list(tuple(str, str))): The (urn, guid) pairs of the model views.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Specifies if the properties are to be force retrieved even though they failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            forceget (str, optional): Specifies if large property sets are to be retrieved anyway. Defaults to true.
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to 8.
+            size_hint (int, optional): Expected size of each response in bytes, extending the read timeout of the timeout
+                policy of the session. Defaults to None.
+            endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid/properties. Defaults to r':urn/metadata/:guid/properties'
+
+        Raises:
+            ValueError: If self.token is of NoneType.
+
+        Returns:
+            tuple(dict, dict): The properties by (urn, guid), and the exceptions of the failed model views by (urn, guid).
+        """
+        params = {}
+
+        if isinstance(forceget, str):
+            params.update({'forceget' : forceget})
+
+        return self._get_many(urn_guids, endpoint, self._make_headers(accept_encoding, x_ads_force), params, max_workers,
+                              size_hint)
+
+    def _make_headers(self, accept_encoding=None, x_ads_force=None):
+        """
+        Build the request headers shared by the model derivative calls.
+
+        Args:
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Value for the x-ads-force header (allowed: true or false). Defaults to None.
+
+        Raises:
+            ValueError: If self.token is of NoneType.
+
+        Returns:
+            dict: The request headers.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the ModelDerivativeApi.")
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+
+        if accept_encoding in ['*', 'gzip']:
+            headers.update({'Accept-Encoding' : accept_encoding})
+        if x_ads_force in ['true', 'false']:
+            headers.update({'x-ads-force' : x_ads_force})
+
+        return headers
+
+    def _get_many(self, urn_guids, endpoint, headers, params, max_workers, size_hint=None):
+        """
+        Send a GET request per model view and poll them together until none of them is answered with 202 Accepted.
+
+        Args:
+            urn_guids (list(tuple(str, str))): The (urn, guid) pairs of the model views.
+            endpoint (str): Endpoint containing the :urn and :guid placeholders.
+            headers (dict): Request headers sent with every request.
+            params (dict): Query parameters sent with every request.
+            max_workers (int): Maximum number of requests in flight at the same time.
+            size_hint (int, optional): Expected size of each response in bytes. Defaults to None.
+
+        Returns:
+            tuple(dict, dict): The data of the responses by (urn, guid), and the exceptions of the failed requests by (urn, guid).
+        """
+        sends = {}
+
+        for urn, guid in urn_guids:
+            url = make_endpoint(endpoint, urn, guid=guid)
+            sends[(urn, guid)] = lambda url=url: self.http.get(url, headers=headers, params=params,
+                                                               size_hint=size_hint)
+
+        results = {}
+        errors = {}
+
+        for key, resp in self.poller.poll_many(sends, max_workers=max_workers).items():
+            if isinstance(resp, Exception):
+                errors[key] = resp
+            elif resp.status_code == 200:
+                results[key] = resp.json()['data']
+            elif resp.status_code == 401:
+                errors[key] = ConnectionError("Renew authorization token.")
+            else:
+                errors[key] = ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                              " and message : {}".format(resp.content) +
+                                              " for endpoint: {}".format(resp.url))
+
+        return results, errors
+
+class AsyncModelDerivativeApi(AsyncForgeApi):
+    """This class provides the asynchronous API calls for Autodesk BIM360 model derivatives."""
+
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/modelderivative/v2/designdata/',
+                 timeout=1, poller=None):
+        """
+        Initialize the AsyncModelDerivativeApi class and attach an authentication token for the Autodesk Forge API.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the model derivative API.
+                Defaults to r'https://developer.api.autodesk.com/modelderivative/v2/designdata/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            poller (Poller, optional): Poller repeating requests that are answered with 202 Accepted.
+                Defaults to None, in which case a Poller with the default backoff settings is used.
+
+        Returns:
+            None.
+
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout)
+        self.poller = Poller() if poller is None else poller
+
+    def _make_headers(self, accept_encoding=None, x_ads_force=None):
+        """
+        Create the request headers shared by the model derivative calls.
+
+        Args:
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Value for the x-ads-force header (allowed: true or false). Defaults to None.
+
+        Raises:
+            ValueError: If self.token is of NoneType.
+
+        Returns:
+            dict: The request headers.
+        """
+        if self.token is None:
+            raise ValueError("Please initialise the AsyncModelDerivativeApi.")
+
+        headers = {'Authorization' : "Bearer {}".format(self.token)}
+
+        if accept_encoding in ['*', 'gzip']:
+            headers.update({'Accept-Encoding' : accept_encoding})
+        if x_ads_force in ['true', 'false']:
+            headers.update({'x-ads-force' : x_ads_force})
+
+        return headers
+
+    async def _get_when_ready(self, endpoint, headers, params=None):
+        """
+        Send a GET request and repeat it with backoff for as long as the Forge API answers with 202 Accepted.
+
+        Args:
+            endpoint (str): endpoint for the GET request.
+            headers (dict): Request headers.
+            params (dict, optional): Query parameters. Defaults to None.
+
+        Raises:
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+            TimeoutError: If the request is still answered with 202 Accepted after the deadline of the poller.
+
+        Returns:
+            AsyncResponse: The final response.
+        """
+        resp = await self.poller.poll_async(lambda: self.http.get(endpoint, headers=headers, params=params))
+
+        if resp.status_code == 200:
+            return resp
+
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(endpoint))
+
+    async def get_manifest(self, urn=None, accept_encoding=None, endpoint=r':urn/manifest'):
+        """
+        Send a GET :urn/manifest request to the BIM360 API, returns information about derivatives that correspond to a specific source file, including derivative URNs and statuses.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            endpoint (str, optional): endpoint for the GET :urn/manifest. Defaults to r':urn/manifest'
+
+        Raises:
+            ValueError: If self.token, urn are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            dict(JsonApiObject): Manifest JsonApi object in the form of a dict.
+        """
+        headers = self._make_headers(accept_encoding)
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        endpoint = make_endpoint(endpoint, urn)
+
+        resp = await self._get_when_ready(endpoint, headers)
+
+        return resp.json()
+
+    async def get_derivative(self, urn=None, derivative_urn=None, endpoint=r':urn/manifest/:derivativeUrn'):
+        """
+        Send a GET :urn/manifest/:derivativeurn request to the BIM360 API, Downloads a selected derivative.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            derivative_urn (str, optional): The urn for the chosen derivative. Defaults to None.
+            endpoint (str, optional):  endpoint for the GET :urn/manifest/:derivativeUrn. Defaults to r':urn/manifest/:derivativeUrn'
+
+        Raises:
+            ValueError: If any of self.token, urn and derivative_urn are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            AsyncResponse: Response object with the body containing the requested derivative.
+        """
+        headers = self._make_headers()
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        if derivative_urn is None:
+            raise ValueError("Please enter a derivative urn.")
+
+        endpoint = make_endpoint(endpoint, urn, derivative_urn=derivative_urn)
+
+        return await self._get_when_ready(endpoint, headers)
+
+    async def get_metadata_ids(self, urn=None, accept_encoding=None, endpoint=r':urn/metadata'):
+        """
+        Send a GET :urn/metadata request to the BIM360 API, returns the available metadata ID's for the model.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            endpoint (str, optional):  endpoint for the GET :urn/metadata. Defaults to r':urn/metadata'
+
+        Raises:
+            ValueError: If any of self.token, urn are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            dict(JsonApiObject): Metadata JsonApi object in the form of a dict.
+        """
+        headers = self._make_headers(accept_encoding)
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        endpoint = make_endpoint(endpoint, urn)
+
+        resp = await self._get_when_ready(endpoint, headers)
+
+        return resp.json()['data']
+
+    async def get_object_tree(self, urn=None, guid=None, accept_encoding=None, x_ads_force='true', forceget='true',
+                              endpoint=r':urn/metadata/:guid'):
+        """
+        Send a GET :urn/metadata/:guid request to the BIM360 API, returns the object tree for the given metadata id (corresponding to a model view) for the model.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            guid (str, optional): The guid for the chosen model view. Defaults to None.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            forceget (str, optional): Specifies if large trees are to be retrieved anyway. Defaults to true.
+            endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid. Defaults to r':urn/metadata/:guid'
+
+        Raises:
+            ValueError: If any of self.token, urn and guid are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            dict(JsonApiObject): Object tree JsonApi object in the form of a dict.
+        """
+        headers = self._make_headers(accept_encoding, x_ads_force)
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        if guid is None:
+            raise ValueError("Please enter a guid.")
+
+        endpoint = make_endpoint(endpoint, urn, guid=guid)
+
+        params = {}
+
+        if isinstance(forceget, str):
+            params.update({'forceget' : forceget})
+
+        resp = await self._get_when_ready(endpoint, headers, params)
+
+        return resp.json()['data']
+
+    async def get_object_properties(self, urn=None, guid=None, accept_encoding=None, x_ads_force='true',
+                                    object_id=None, forceget='true', endpoint=r':urn/metadata/:guid/properties'):
+        """
+        Send a GET :urn/metadata/:guid/properties request to the BIM360 API, returns all object properties for the given metadata id (corresponding to a model view) for the model.
+
+        Args:
+            urn (str, optional): The urn for the BIM360 model. Defaults to None.
+            guid (str, optional): The guid for the chosen model view. Defaults to None.
+            accept_encoding (str, optional): Specifies if the results may be compressed (allowed: gzip or *). Defaults to None.
+            x_ads_force (str, optional): Specifies if the tree is to be force retrieved even though it failed to be retrieved or got timeout previously. Possible values [true/false]. Defaults to true.
+            object_id (str, optional): Specific Object id for which the properties are to be found. Defaults to None.
+            forceget (str, optional): Specifies if large property sets are to be retrieved anyway. Defaults to true.
+            endpoint (str, optional): Endpoint for the GET :urn/metadata/:guid/properties. Defaults to r':urn/metadata/:guid/properties'
+
+        Raises:
+            ValueError: If any of self.token, urn and guid are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            dict(JsonApiObject): Properties JsonApi object in the form of a dict.
+        """
+        headers = self._make_headers(accept_encoding, x_ads_force)
+
+        if urn is None:
+            raise ValueError("Please enter an urn.")
+
+        if guid is None:
+            raise ValueError("Please enter a guid.")
+
+        endpoint = make_endpoint(endpoint, urn, guid=guid)
+
+        params = {}
+
+        if isinstance(object_id, (int, str)):
+            params.update({'objectid' : object_id})
+        if isinstance(forceget, str):
+            params.update({'forceget' : forceget})
+
+        resp = await self._get_when_ready(endpoint, headers, params)
+
+        return resp.json()['data']
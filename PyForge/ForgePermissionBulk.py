@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Module containing the bulk folder permission engine for the BIM 360 Document Management API."""
+from concurrent.futures import ThreadPoolExecutor
+from PyForge.ForgePermissionPost import PostPermissionApi, OPERATIONS
+
+DEFAULT_BATCH_SIZE = 100 # subjects per permissions:batch-* request
+
+# Deletes go first so a plan can replace the permissions of a subject, creates before updates of the same folder.
+PHASES = ('delete', 'create', 'update')
+
+
+class BulkPermissionApi(PostPermissionApi):
+    """This class applies folder permission plans for many folders and subjects using batched, concurrent requests."""
+
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/',
+                 timeout=12, **kwargs):
+        """
+        Initialize the BulkPermissionApi class and attach an authentication token for the Autodesk Forge API.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the BIM 360 Document Management API.
+                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 12.
+            kwargs: Additional keyword arguments passed on to PostPermissionApi and ForgeApi, such as poller or registry.
+
+        Returns:
+            None.
+        """
+        super().__init__(token, base_url=base_url, timeout=timeout, **kwargs)
+
+    @staticmethod
+    def make_plan(folder_ids, subjects, operation='create'):
+        """
+        Make a plan applying the same permissions of every subject to every folder.
+
+        Args:
+            folder_ids (list(str)): The folder ids.
+            subjects (list(tuple)): The (subject_id, subject_type, actions) of the subjects, actions are ignored to delete.
+            operation (str, optional): One of 'create', 'update' or 'delete'. Defaults to 'create'.
+
+        Returns:
+            list(dict): The plan items, with folder_id, subject_id, subject_type, actions and operation.
+        """
+        return [{'folder_id' : folder_id, 'subject_id' : subject_id, 'subject_type' : subject_type,
+                 'actions' : actions, 'operation' : operation}
+                for folder_id in folder_ids for subject_id, subject_type, actions in subjects]
+
+    def apply_plan(self, project_id, plan, batch_size=DEFAULT_BATCH_SIZE, max_workers=8):
+        """
+        Apply a permission plan, grouping the subjects per folder and operation into batch payloads sent concurrently.
+
+        The deletes of the plan are applied first, then the creates and then the updates. If a plan holds the same folder,
+        subject and operation more than once the last item is applied.
+
+        Args:
+            project_id (str): The project id for the project the folders are in.
+            plan (list(dict)): The plan items, see make_plan.
+            batch_size (int, optional): Maximum number of subjects per request. Defaults to DEFAULT_BATCH_SIZE.
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to 8.
+
+        Raises:
+            ValueError: If self.token or project_id are of NoneType, batch_size is smaller than 1 or an operation is unknown.
+            TypeError: If the actions of a plan item are not a list of str or a str.
+
+        Returns:
+            tuple(list, dict): The applied plan items, and the exceptions of the failed plan items by
+            (folder_id, subject_id, operation).
+        """
+        if self.token is None:
+            raise ValueError("Please give a authorization token.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+
+        groups = {operation : {} for operation in PHASES}
+
+        for item in plan:
+            operation = item.get('operation', 'create')
+            if operation not in OPERATIONS:
+                raise ValueError("Operation must be one of {}.".format(', '.join(OPERATIONS)))
+            subjects = groups[operation].setdefault(item['folder_id'], {})
+            subjects.pop(item['subject_id'], None)
+            subjects[item['subject_id']] = item
+
+        applied = []
+        failed = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for operation in PHASES:
+                futures = []
+                for folder_id, subjects in groups[operation].items():
+                    items = list(subjects.values())
+                    for i in range(0, len(items), batch_size):
+                        batch = items[i:i + batch_size]
+                        payload = [self._make_payload_item(item, operation) for item in batch]
+                        futures.append((folder_id, batch, executor.submit(self.post_folder_permissions,
+                                                                          project_id, folder_id, operation, payload)))
+
+                for folder_id, batch, future in futures:
+                    try:
+                        cont = future.result()
+                    except Exception as e:
+                        failed.update(((folder_id, item['subject_id'], operation), e) for item in batch)
+                        continue
+
+                    errors = self._get_errors(cont)
+
+                    for item in batch:
+                        error = errors.get(item['subject_id'])
+                        if error is None:
+                            applied.append(item)
+                        else:
+                            failed[(folder_id, item['subject_id'], operation)] = error
+
+        return applied, failed
+
+    def _make_payload_item(self, item, operation):
+        """
+        Make the payload item of a plan item.
+
+        Args:
+            item (dict): The plan item.
+            operation (str): One of 'create', 'update' or 'delete'.
+
+        Raises:
+            TypeError: If the actions of the plan item are not a list of str or a str.
+
+        Returns:
+            dict: The payload item, with subjectId, subjectType and, except to delete, actions.
+        """
+        payload = {'subjectId' : item['subject_id'], 'subjectType' : item['subject_type']}
+
+        if operation != 'delete':
+            payload['actions'] = self.make_actions(item.get('actions') or [])
+
+        return payload
+
+    @staticmethod
+    def _get_errors(cont):
+        """
+        Get the errors the API reported for single subjects of a batch.
+
+        Args:
+            cont (dict): The response of the batch request.
+
+        Returns:
+            dict(str, ConnectionError): The errors by subject id.
+        """
+        errors = {}
+
+        if not isinstance(cont, dict):
+            return errors
+
+        for error in cont.get('errors') or []:
+            subject_id = error.get('subjectId') or (error.get('source') or {}).get('subjectId')
+            if subject_id is not None:
+                errors[subject_id] = ConnectionError("Permission change failed with code {}".format(error.get('code')) +
+                                                     " and message : {}".format(error.get('title', error.get('detail'))))
+
+        return errors
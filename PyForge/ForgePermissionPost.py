@@ -1,23 +1,46 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to BIM 360 Document Management folder (POST), including details about the name and the status."""
-import re
 import requests
+from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi, AsyncResponse
+from PyForge.Poller import Poller
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
 
-class PostPermissionApi():
+OPERATIONS = ('create', 'update', 'delete')
+
+# Statuses a batch request is repeated for, the http adapters do not retry POST requests.
+RETRY_STATUSES = (429, 503)
+
+
+class PostPermissionApi(ForgeApi):
 
     """This class provides the base API calls permission for Autodesk BIM 360 Document Management folder."""
 
-    def __init__(self, token, subjectId, subjectType, actions):
+    def __init__(self, token, subjectId=None, subjectType=None, actions=None,
+                 base_url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/',
+                 timeout=12, poller=None, **kwargs):
         """
         Initialize the PostPermissionApi class and assign the needed parameters for authentication.
 
         Args:
-
-            subjectId (str): subjectId of the user, role, or company.
-            subjectType (str): The type of subject. Possible values: USER, COMPANY, ROLE
-            actions (list, str): Permitted actions for the user, role, or company.
+            token (str): Authentication token for Autodesk Forge API.
+            subjectId (str, optional): subjectId of the user, role, or company. Defaults to None.
+            subjectType (str, optional): The type of subject. Possible values: USER, COMPANY, ROLE. Defaults to None.
+            actions (list, str, optional): Permitted actions for the user, role, or company, as a list or separated by spaces.
                                 The six permission levels in BIM 360 Document Managment correspond to one or more actions.
+                                Defaults to None.
+            base_url (str, optional): Base URL for calls to the BIM 360 Document Management API.
+                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 12.
+            poller (Poller, optional): Poller repeating batch requests that are answered with 429 Too Many Requests or
+                503 Service Unavailable, honouring their Retry-After header.
+                Defaults to None, in which case a Poller with the default backoff settings is used.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
+
         Raises:
             TypeError: If the type of the actions argument is not list of str this error is raised.
 
@@ -25,45 +48,64 @@ class PostPermissionApi():
             None.
 
         """
-        self.token = token
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
         self.subjectId = subjectId
         self.subjectType = subjectType
+        self.actions = self.make_actions(actions) if actions is not None else []
+        self.poller = Poller() if poller is None else poller
 
-        if type(actions) == list:
-            self.actions = ''
-            for action in actions:
-                self.actions += "{} ".format(action)
-        elif type(actions) == str:
-            self.actions = actions
-        else:
-            raise TypeError(actions)
+    @staticmethod
+    def make_actions(actions):
+        """
+        Make the list of actions of a permission payload.
 
+        Args:
+            actions (list, str): Permitted actions, as a list or separated by spaces, e.g. 'VIEW DOWNLOAD'.
 
-    def get_folder_permission_batch_create(self, token, project_id, folder_id,
-                   url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-create'):
+        Raises:
+            TypeError: If the type of the actions argument is not list of str this error is raised.
+
+        Returns:
+            list(str): The actions.
         """
-        Assign permissions to multiple users, roles, and companies for a BIM 360 Document Management folder.
-        Send a POST projects/:project_id/folders/:folder_id request to the BIM 360 Document Management folder, returns the results JsonApiObject available to the Autodesk account on the given project id for the given folder id .
+        if isinstance(actions, str):
+            return actions.split()
+
+        if isinstance(actions, (list, tuple)) and all(isinstance(action, str) for action in actions):
+            return list(actions)
+
+        raise TypeError(actions)
+
+    def post_folder_permissions(self, project_id, folder_id, operation, subjects,
+                                endpoint=r':project_id/folders/:folder_id/permissions:batch-:operation', token=None):
+        """
+        Send a POST projects/:project_id/folders/:folder_id/permissions:batch-:operation request for multiple subjects at once.
+
+        A request that is answered with 429 Too Many Requests or 503 Service Unavailable is repeated by the poller.
+
         Args:
-            token (str): Authentication token for Autodesk Forge API.
             project_id (str): The project id for the project the folder is in.
             folder_id (str): The folder id for the folder.
-            url (str, optional): url endpoint for the GET projects/:project_id/folders/:folder_id request.
-                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-create'.
+            operation (str): One of 'create', 'update' or 'delete'.
+            subjects (list(dict)): The payload items, with subjectId, subjectType and, except to delete, actions.
+            endpoint (str, optional): endpoint for the POST projects/:project_id/folders/:folder_id/permissions:batch-:operation request.
+                Defaults to r':project_id/folders/:folder_id/permissions:batch-:operation'.
+            token (str, optional): Authentication token for this request, used if self.token is None. Defaults to None.
+
         Raises:
-            ValueError: If any of token and self.token, project_id or folder_id are of NoneType.
+            ValueError: If any of token and self.token, project_id or folder_id are of NoneType, or the operation is unknown.
             ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+            TimeoutError: If the request is still throttled when the deadline of the poller has passed.
+
         Returns:
-            dict(JsonApiObject): JsonApi Folder object in the form of a dict.
+            dict(JsonApiObject): The results of the operation in the form of a dict, empty if there is no response body.
         """
-        method = 'POST'
-
-        if (self.token is None and token is None):
-            raise ValueError("Please give a authorization token.")
-
         if self.token is not None:
             token = self.token
 
+        if token is None:
+            raise ValueError("Please give a authorization token.")
+
         if project_id is None:
             raise ValueError("Please enter a project id.")
 
@@ -73,18 +115,25 @@ class PostPermissionApi():
         if folder_id is None:
             raise ValueError("Please enter a folder id.")
 
-        headers = {'Authorization' : "Bearer {}".format(token),
-                   'Content-Type' : 'application/json'}
-        url = url.replace(':project_id', project_id).replace(':folder_id', folder_id)
-        data = { 'subjectId' : self.subjectId,
-                  'subjectType' : self.subjectType,
-                   'actions' : self.actions }
+        if operation not in OPERATIONS:
+            raise ValueError("Operation must be one of {}.".format(', '.join(OPERATIONS)))
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+        endpoint = endpoint.replace(':project_id', project_id).replace(':folder_id', folder_id)
+        endpoint = endpoint.replace(':operation', operation)
+
+        def send():
+            try:
+                return self.http.post(endpoint, headers=headers, json=subjects)
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code in RETRY_STATUSES:
+                    return e.response
+                raise
 
-        resp = requests.request(method,
-                                url,
-                                headers=headers,
-                                body=data,
-                                timeout=12)
+        resp = self.poller.poll(send, is_pending=lambda resp: resp.status_code in RETRY_STATUSES)
+
+        if resp.status_code == 204 or (resp.status_code == 200 and not resp.content):
+            return {}
 
         if resp.status_code == 200:
             cont = resp.json()
@@ -97,95 +146,130 @@ class PostPermissionApi():
             raise ConnectionError("Renew authorization token.")
 
         raise ConnectionError("Request failed with code {}".format(resp.status_code) +
-                              " and message : {}".format(resp.content))
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(endpoint))
+
+    def get_folder_permission_batch_create(self, token, project_id, folder_id,
+                   url=r':project_id/folders/:folder_id/permissions:batch-create'):
+        """
+        Assign permissions to multiple users, roles, and companies for a BIM 360 Document Management folder.
+        Send a POST projects/:project_id/folders/:folder_id request to the BIM 360 Document Management folder, returns the results JsonApiObject available to the Autodesk account on the given project id for the given folder id .
+        Args:
+            token (str): Authentication token for Autodesk Forge API, used if self.token is None.
+            project_id (str): The project id for the project the folder is in.
+            folder_id (str): The folder id for the folder.
+            url (str, optional): url endpoint for the GET projects/:project_id/folders/:folder_id request.
+                Defaults to r':project_id/folders/:folder_id/permissions:batch-create'.
+        Raises:
+            ValueError: If any of token and self.token, project_id or folder_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+        Returns:
+            dict(JsonApiObject): JsonApi Folder object in the form of a dict.
+        """
+        data = [{'subjectId' : self.subjectId,
+                 'subjectType' : self.subjectType,
+                 'actions' : self.actions}]
+
+        return self.post_folder_permissions(project_id, folder_id, 'create', data, endpoint=url, token=token)
 
     def get_folder_permission_batch_update(self, token, project_id, folder_id,
-                   url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-update'):
+                   url=r':project_id/folders/:folder_id/permissions:batch-update'):
         """
         Updates the permissions assigned to multiple users, roles, and companies for a folder. This endpoint replaces the permissions that were previously assigned to the user for this folder.
         Send a POST bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-update request to the BIM 360 Document Management folder, returns the result updated JsonApiObject available to the Autodesk account on the given project id for the given folder id.
         Args:
-            token (str): Authentication token for Autodesk Forge API.
+            token (str): Authentication token for Autodesk Forge API, used if self.token is None.
             project_id (str): The project id for the project the folder is in.
             folder_id (str): The folder id for the folder.
             url (str, optional): url endpoint for the POST projects/:project_id/folders/:folder_id/permissions:batch-update request.
-                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-update'.
+                Defaults to r':project_id/folders/:folder_id/permissions:batch-update'.
         Raises:
             ValueError: If any of token and self.token, project_id or folder_id are of NoneType.
             ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
         Returns:
             dict(JsonApiObject): JsonApi Folder object in the form of a dict.
         """
-        method = 'POST'
+        data = [{'subjectId' : self.subjectId,
+                 'subjectType' : self.subjectType,
+                 'actions' : self.actions}]
 
-        if (self.token is None and token is None):
-            raise ValueError("Please give a authorization token.")
-
-        if self.token is not None:
-            token = self.token
-
-        if project_id is None:
-            raise ValueError("Please enter a project id.")
+        return self.post_folder_permissions(project_id, folder_id, 'update', data, endpoint=url, token=token)
 
-        if project_id.startswith("b."):
-            project_id = project_id[2:]
+    def get_folder_permission_batch_delete(self, token, project_id, folder_id,
+                   url=r':project_id/folders/:folder_id/permissions:batch-delete'):
+        """
+        Deletes all the permissions assigned to specified users, roles, and companies.
+        Note that you cannot delete permission for project admins, who are always assigned full permissions.
+        Send a POST bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-delete request to BIM 360 Document Management folder, returns No response!
+        Args:
+            token (str): Authentication token for Autodesk Forge API, used if self.token is None.
+            project_id (str): The project id for the project the folder is in.
+            folder_id (str): The folder id for the folder.
+            url (str, optional): url endpoint for the post projects/:project_id/folders/:folder_id/permissions:batch-delete request.
+                Defaults to r':project_id/folders/:folder_id/permissions:batch-delete'.
+        Raises:
+            ValueError: If any of token and self.token, project_id or folder_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+        Returns:
+            dict(JsonApiObject): JsonApi Folder object in the form of a dict, empty as the endpoint has no response body.
+        """
+        data = [{'subjectId' : self.subjectId,
+                 'subjectType' : self.subjectType}]
 
-        if folder_id is None:
-            raise ValueError("Please enter a folder id.")
+        return self.post_folder_permissions(project_id, folder_id, 'delete', data, endpoint=url, token=token)
 
-        headers = {'Authorization' : "Bearer {}".format(token),
-                   'Content-Type' : 'application/json'}
-        url = url.replace(':project_id', project_id).replace(':folder_id', folder_id)
-        data = { 'subjectId' : self.subjectId,
-                    'subjectType' : self.subjectType,
-                      'actions' : self.actions }
 
-        resp = requests.request(method,
-                                url,
-                                headers=headers,
-                                data=data,
-                                timeout=12)
+class AsyncPostPermissionApi(AsyncForgeApi):
+    """This class provides the asynchronous batch API calls changing the permissions of Autodesk BIM 360 Document Management folders."""
 
-        if resp.status_code == 200:
-            cont = resp.json()
-            return cont
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/',
+                 timeout=12, poller=None, **kwargs):
+        """
+        Initialize the AsyncPostPermissionApi class and attach an authentication token for the Autodesk Forge API.
 
-        if resp.status_code == 400:
-            raise ConnectionError(resp.content)
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the BIM 360 Document Management API.
+                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 12.
+            poller (Poller, optional): Poller repeating batch requests that are answered with 429 Too Many Requests or
+                503 Service Unavailable, honouring their Retry-After header.
+                Defaults to None, in which case a Poller with the default backoff settings is used.
+            kwargs: Additional keyword arguments passed on to AsyncForgeApi, such as rate_limiter.
 
-        if resp.status_code == 401:
-            raise ConnectionError("Renew authorization token.")
+        Returns:
+            None.
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
+        self.poller = Poller() if poller is None else poller
 
-        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
-                              " and message : {}".format(resp.content))
+    async def post_folder_permissions(self, project_id, folder_id, operation, subjects,
+                                      endpoint=r':project_id/folders/:folder_id/permissions:batch-:operation'):
+        """
+        Send a POST projects/:project_id/folders/:folder_id/permissions:batch-:operation request for multiple subjects at once.
 
+        A request that is answered with 429 Too Many Requests or 503 Service Unavailable is repeated by the poller.
 
-    def get_folder_permission_batch_delete(self, token, project_id, folder_id,
-                   url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-delete'):
-        """
-        Deletes all the permissions assigned to specified users, roles, and companies.
-        Note that you cannot delete permission for project admins, who are always assigned full permissions.
-        Send a POST bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-delete request to BIM 360 Document Management folder, returns No response!
         Args:
-            token (str): Authentication token for Autodesk Forge API.
             project_id (str): The project id for the project the folder is in.
             folder_id (str): The folder id for the folder.
-            url (str, optional): url endpoint for the post projects/:project_id/folders/:folder_id/permissions:batch-delete request.
-                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/:project_id/folders/:folder_id/permissions:batch-delete'.
+            operation (str): One of 'create', 'update' or 'delete'.
+            subjects (list(dict)): The payload items, with subjectId, subjectType and, except to delete, actions.
+            endpoint (str, optional): endpoint for the POST projects/:project_id/folders/:folder_id/permissions:batch-:operation request.
+                Defaults to r':project_id/folders/:folder_id/permissions:batch-:operation'.
+
         Raises:
-            ValueError: If any of token and self.token, project_id or folder_id are of NoneType.
+            ValueError: If any of self.token, project_id or folder_id are of NoneType, or the operation is unknown.
             ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+            TimeoutError: If the request is still throttled when the deadline of the poller has passed.
+
         Returns:
-            dict(JsonApiObject): JsonApi Folder object in the form of a dict.
+            dict(JsonApiObject): The results of the operation in the form of a dict, empty if there is no response body.
         """
-        method = 'POST'
-
-        if (self.token is None and token is None):
+        if self.token is None:
             raise ValueError("Please give a authorization token.")
 
-        if self.token is not None:
-            token = self.token
-
         if project_id is None:
             raise ValueError("Please enter a project id.")
 
@@ -195,28 +279,29 @@ class PostPermissionApi():
         if folder_id is None:
             raise ValueError("Please enter a folder id.")
 
-        headers = {'Authorization' : "Bearer {}".format(token),
-                   'Content-Type' : 'application/json'}
-        url = url.replace(':project_id', project_id).replace(':folder_id', folder_id)
-        data = { 'subjectId' : self.subjectId,
-                  'subjectType' : self.subjectType}
+        if operation not in OPERATIONS:
+            raise ValueError("Operation must be one of {}.".format(', '.join(OPERATIONS)))
 
-        resp = requests.request(method,
-                                url,
-                                headers=headers,
-                                data=data,
-                                timeout=12)
+        headers = {'Authorization' : "Bearer {}".format(self.token)}
+        endpoint = endpoint.replace(':project_id', project_id).replace(':folder_id', folder_id)
+        endpoint = endpoint.replace(':operation', operation)
 
-        if resp.status_code == 200:
-            cont = resp.json()
-            return cont
+        async def send():
+            try:
+                return await self.http.post(endpoint, headers=headers, json=subjects)
+            except aiohttp.ClientResponseError as e:
+                if e.status in RETRY_STATUSES:
+                    return AsyncResponse(e.status, dict(e.headers or {}), b'', str(e.request_info.real_url))
+                raise
 
-        if resp.status_code == 400:
-            raise ConnectionError(resp.content)
+        resp = await self.poller.poll_async(send, is_pending=lambda resp: resp.status_code in RETRY_STATUSES)
 
-        if resp.status_code == 401:
-            raise ConnectionError("Renew authorization token.")
+        if resp.status_code == 204 or (resp.status_code == 200 and not resp.content):
+            return {}
 
-        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
-                              " and message : {}".format(resp.content))
+        if resp.status_code == 200:
+            return resp.json()
 
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(endpoint))
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to projects on the Autodesk Forge BIM360 platform."""
 from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from PyForge.Paginator import JsonApiPaginator
 
 
 class ProjectsApi(ForgeApi):
@@ -8,7 +10,7 @@ class ProjectsApi(ForgeApi):
 
     def __init__(self, token,
                  base_url=r'https://developer.api.autodesk.com/project/v1/hubs/',
-                 timeout=1):
+                 timeout=1, **kwargs):
         """
         Initialize the ProjectsApi class and attach an authentication token for the Autodesk Forge API.
 
@@ -17,10 +19,11 @@ class ProjectsApi(ForgeApi):
             base_url (str, optional): Base URL for calls to the projects API.
                 Defaults to r'https://developer.api.autodesk.com/project/v1/hubs/'
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
         Returns:
             None.
         """
-        super().__init__(token=token, base_url=base_url, timeout=timeout)
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
 
     def get_account_projects(self, account_id, limit=100,
                              endpoint=r':hub_id/projects'):
@@ -30,11 +33,8 @@ class ProjectsApi(ForgeApi):
         Args:
             account_id (str): The account id // hub id for the BIM360 account. They are related in the form hub_id = "b." + account_id
             limit (int, optional): Size of the response array. Defaults to 100.
-            offset (int, optional): Offset of the response array. Defaults to 0.
-            sort (list, optional): List of string field names to sort in ascending order, Prepending a field with - sorts in descending order. Defaults to [].
-            field (list, optional): List of string field names to include in the response array. Defaults to [].
-            endpoint (str, optional):  endpoint for the GET accounts/:account_id/projects request.
-                Defaults to r':account_id/projects'.
+            endpoint (str, optional):  endpoint for the GET hubs/:hub_id/projects request.
+                Defaults to r':hub_id/projects'.
         Raises:
             ValueError: If any self.token and account_id are of NoneType.
             ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
@@ -42,6 +42,31 @@ class ProjectsApi(ForgeApi):
         Returns:
             list(dict(JsonApiObject)): List of project JsonApi objects in the form of dicts.
         """
+        data = []
+
+        for page in self.iter_account_projects(account_id, limit=limit, endpoint=endpoint):
+            data += page
+
+        return data
+
+    def iter_account_projects(self, account_id, limit=100, prefetch=True,
+                              endpoint=r':hub_id/projects'):
+        """
+        Lazily iterate over the pages of a GET hubs/:hub_id/projects request to the BIM360 API.
+
+        Args:
+            account_id (str): The account id // hub id for the BIM360 account. They are related in the form hub_id = "b." + account_id
+            limit (int, optional): Size of the pages. Defaults to 100.
+            prefetch (bool, optional): Fetch the next page while the current page is being processed. Defaults to True.
+            endpoint (str, optional):  endpoint for the GET hubs/:hub_id/projects request.
+                Defaults to r':hub_id/projects'.
+        Raises:
+            ValueError: If any self.token and account_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Yields:
+            list(dict(JsonApiObject)): List of project JsonApi objects of the page in the form of dicts.
+        """
         try:
             token = self.token
         except AttributeError:
@@ -63,42 +88,78 @@ class ProjectsApi(ForgeApi):
 
         params.update({'page[limit]' : limit})
 
-        next_page = -1
-        data = []
+        for cont in JsonApiPaginator(self.http, endpoint, headers=headers, params=params, prefetch=prefetch):
+            yield cont['data']
 
-        while next_page != 0:
+class AsyncProjectsApi(AsyncForgeApi):
+    """This class provides the asynchronous API calls for Autodesk BIM360 projects."""
 
-            if next_page > 0:
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/project/v1/hubs/',
+                 timeout=1):
+        """
+        Initialize the AsyncProjectsApi class and attach an authentication token for the Autodesk Forge API.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the projects API.
+                Defaults to r'https://developer.api.autodesk.com/project/v1/hubs/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+        Returns:
+            None.
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout)
 
-                params.update({'page[number]' : str(next_page)})
+    async def get_account_projects(self, account_id, limit=100,
+                                   endpoint=r':hub_id/projects'):
+        """
+        Send a GET hubs/:hub_id/projects request to the BIM360 API, returns the projects available to the Autodesk account on the given account.
 
-                resp = self.http.get(endpoint, headers=headers, params=params)
+        Args:
+            account_id (str): The account id // hub id for the BIM360 account. They are related in the form hub_id = "b." + account_id
+            limit (int, optional): Size of the response array. Defaults to 100.
+            endpoint (str, optional):  endpoint for the GET hubs/:hub_id/projects request.
+                Defaults to r':hub_id/projects'.
+        Raises:
+            ValueError: If any self.token and account_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
 
-            else:
+        Returns:
+            list(dict(JsonApiObject)): List of project JsonApi objects in the form of dicts.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncProjectsApi.")
 
-                resp = self.http.get(endpoint, headers=headers, params=params)
+        if account_id is None:
+            raise ValueError("Please enter a account id.")
 
-            if resp.status_code == 200:
+        if not account_id.startswith("b."):
+            account_id = "b.{}".format(account_id)
 
-                cont = resp.json()
-                data += cont['data']
+        endpoint = endpoint.replace(':hub_id', account_id)
 
-                try:
-                    match = re.search(r'page%5Bnumber%5D=(\d+)', cont['links']['next']['href'])
+        headers = {'Authorization' : "Bearer {}".format(token)}
 
-                    if match is not None:
-                        next_page = int(match.groups()[0])
-                    else:
-                        return data
+        params = {'page[limit]' : limit}
 
-                except KeyError:
+        data = []
 
-                    return data
+        while True:
 
-            else:
-                if resp.status_code == 401:
-                    raise ConnectionError("Renew authorization token.")
+            resp = await self.http.get(endpoint, headers=headers, params=params)
 
+            if resp.status_code != 200:
                 raise ConnectionError("Request failed with code {}".format(resp.status_code) +
                                       " and message : {}".format(resp.content) +
                                       " for endpoint: {}".format(endpoint))
+
+            cont = resp.json()
+            data += cont['data']
+
+            endpoint = JsonApiPaginator.next_link(cont)
+            params = None
+
+            if endpoint is None:
+                return data
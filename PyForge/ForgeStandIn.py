@@ -0,0 +1,1162 @@
+# -*- coding: utf-8 -*-
+"""Module containing a local stand-in for the Autodesk Forge endpoints PyForge calls, for offline benchmarks and load tests."""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote, urlencode
+from PyForge.Endpoints import endpoint_template
+
+DEFAULT_PAGE_LIMIT = 200
+
+FOLDER_ID = re.compile(r'^urn:adsk\.wipprod:fs\.folder:co\.(\d+)_r((?:-\d+)*)$')
+VERSION_ID = re.compile(r'^urn:adsk\.wipprod:fs\.file:vf\.(\d+)_r((?:-\d+)*)_i(\d+)\?version=(\d+)$')
+
+ACTIONS = (['VIEW', 'COLLABORATE'],
+           ['VIEW', 'DOWNLOAD', 'COLLABORATE'],
+           ['PUBLISH', 'VIEW', 'DOWNLOAD', 'COLLABORATE'],
+           ['PUBLISH', 'VIEW', 'DOWNLOAD', 'COLLABORATE', 'EDIT', 'CONTROL'])
+
+
+class StandInData():
+    """Deterministic synthetic hubs, projects, folders, items, versions, companies, users, permissions and model derivatives.
+
+    Folders, items and versions are not stored, their ids encode their position in the folder tree of their project, so
+    large trees cost no memory. Only permission changes are kept.
+    """
+
+    def __init__(self, projects=10, depth=3, fanout=4, items=5, versions=2, companies=50, users=200, objects=500,
+                 seed=0):
+        """
+        Initialize the StandInData class with the scale of the synthetic data.
+
+        Args:
+            projects (int, optional): Number of projects in the hub. Defaults to 10.
+            depth (int, optional): Number of folder levels below the project files folder of every project. Defaults to 3.
+            fanout (int, optional): Number of subfolders per folder above the deepest level. Defaults to 4.
+            items (int, optional): Number of items per folder. Defaults to 5.
+            versions (int, optional): Number of versions per item. Defaults to 2.
+            companies (int, optional): Number of companies in the account. Defaults to 50.
+            users (int, optional): Number of users per project. Defaults to 200.
+            objects (int, optional): Number of objects per model view. Defaults to 500.
+            seed (int, optional): Seed of the generated ids and values. Defaults to 0.
+
+        Returns:
+            None.
+        """
+        self.projects = projects
+        self.depth = depth
+        self.fanout = fanout
+        self.items = items
+        self.versions = versions
+        self.companies = companies
+        self.users = users
+        self.objects = objects
+        self.seed = seed
+        self.account_id = self._make_uuid(0xacc0)
+        self.hub_id = "b.{}".format(self.account_id)
+        self._permissions = {}
+        self._lock = threading.Lock()
+
+    def _make_uuid(self, number):
+        """
+        Make a deterministic uuid from a number.
+
+        Args:
+            number (int): The number.
+
+        Returns:
+            str: The uuid.
+        """
+        return "{:08x}-0000-4000-8000-{:012x}".format(self.seed & 0xffffffff, number)
+
+    def _hash(self, *parts):
+        """
+        Get a deterministic hash of the given parts.
+
+        Args:
+            parts: The parts, converted to str.
+
+        Returns:
+            int: A 64-bit hash.
+        """
+        text = '|'.join(str(part) for part in (self.seed,) + parts)
+        return int.from_bytes(hashlib.blake2b(text.encode('utf8'), digest_size=8).digest(), 'big')
+
+    def project_number(self, project_id):
+        """
+        Get the number of a project from its id, with or without the 'b.' prefix.
+
+        Args:
+            project_id (str): The project id.
+
+        Returns:
+            int: The number of the project, None if the project does not exist.
+        """
+        if project_id.startswith('b.'):
+            project_id = project_id[2:]
+
+        try:
+            number = int(project_id[-12:], 16)
+        except ValueError:
+            return None
+
+        if number >= self.projects or project_id != self._make_uuid(number):
+            return None
+
+        return number
+
+    def hub(self):
+        """
+        Get the hub of the account.
+
+        Returns:
+            dict(JsonApiObject): The hub.
+        """
+        return {'type' : 'hubs', 'id' : self.hub_id,
+                'attributes' : {'name' : "Stand-in Account", 'region' : 'US',
+                                'extension' : {'type' : 'hubs:autodesk.bim360:Account', 'version' : '1.0'}}}
+
+    def project(self, number):
+        """
+        Get a project.
+
+        Args:
+            number (int): The number of the project.
+
+        Returns:
+            dict(JsonApiObject): The project.
+        """
+        return {'type' : 'projects', 'id' : "b.{}".format(self._make_uuid(number)),
+                'attributes' : {'name' : "Project {:04d}".format(number),
+                                'extension' : {'type' : 'projects:autodesk.bim360:Project', 'version' : '1.0'}},
+                'relationships' : {'hub' : {'data' : {'type' : 'hubs', 'id' : self.hub_id}},
+                                   'rootFolder' : {'data' : {'type' : 'folders', 'id' : self.folder_id(number, ())}}}}
+
+    def folder_id(self, number, path):
+        """
+        Get the id of a folder.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The positions of the folder and its ancestors below the project files folder.
+
+        Returns:
+            str: The folder id.
+        """
+        return "urn:adsk.wipprod:fs.folder:co.{}_r{}".format(number, ''.join("-{}".format(i) for i in path))
+
+    def parse_folder_id(self, folder_id):
+        """
+        Get the project number and path of a folder from its id.
+
+        Args:
+            folder_id (str): The folder id.
+
+        Returns:
+            tuple(int, tuple(int)): The number of the project and the path of the folder, None if the folder does not exist.
+        """
+        match = FOLDER_ID.match(folder_id)
+
+        if match is None:
+            return None
+
+        number = int(match.group(1))
+        path = tuple(int(i) for i in match.group(2).split('-')[1:])
+
+        if number >= self.projects or len(path) > self.depth or any(i >= self.fanout for i in path):
+            return None
+
+        return number, path
+
+    def folder(self, number, path):
+        """
+        Get a folder.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+
+        Returns:
+            dict(JsonApiObject): The folder.
+        """
+        name = "Project Files" if not path else "Folder {}".format('.'.join(str(i + 1) for i in path))
+        modified = self._modified_time(number, path)
+        folder = {'type' : 'folders', 'id' : self.folder_id(number, path),
+                  'attributes' : {'name' : name, 'displayName' : name, 'objectCount' : self.items,
+                                  'createTime' : '2020-01-01T00:00:00.0000000Z',
+                                  'lastModifiedTime' : modified, 'lastModifiedTimeRollup' : modified,
+                                  'extension' : {'type' : 'folders:autodesk.bim360:Folder', 'version' : '1.0'}}}
+
+        if path:
+            folder['relationships'] = {'parent' : {'data' : {'type' : 'folders',
+                                                             'id' : self.folder_id(number, path[:-1])}}}
+
+        return folder
+
+    def subfolders(self, number, path):
+        """
+        Get the subfolders of a folder.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+
+        Returns:
+            list(dict(JsonApiObject)): The subfolders.
+        """
+        if len(path) >= self.depth:
+            return []
+
+        return [self.folder(number, path + (i,)) for i in range(self.fanout)]
+
+    def item(self, number, path, index):
+        """
+        Get an item and its tip version.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder the item is in.
+            index (int): The position of the item in the folder.
+
+        Returns:
+            tuple(dict(JsonApiObject), dict(JsonApiObject)): The item and its tip version.
+        """
+        key = "{}_r{}_i{}".format(number, ''.join("-{}".format(i) for i in path), index)
+        name = "Model {}-{}.rvt".format('.'.join(str(i + 1) for i in path) or '0', index + 1)
+        tip = self.version(number, path, index, self.versions)
+        item = {'type' : 'items', 'id' : "urn:adsk.wipprod:dm.lineage:{}".format(key),
+                'attributes' : {'displayName' : name, 'createTime' : '2020-01-01T00:00:00.0000000Z',
+                                'lastModifiedTime' : tip['attributes']['lastModifiedTime'],
+                                'extension' : {'type' : 'items:autodesk.bim360:File', 'version' : '1.0'}},
+                'relationships' : {'tip' : {'data' : {'type' : 'versions', 'id' : tip['id']}},
+                                   'parent' : {'data' : {'type' : 'folders', 'id' : self.folder_id(number, path)}}}}
+        return item, tip
+
+    def items_of(self, number, path):
+        """
+        Get the items of a folder with their tip versions.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+
+        Returns:
+            list(tuple(dict(JsonApiObject), dict(JsonApiObject))): The items and their tip versions.
+        """
+        return [self.item(number, path, index) for index in range(self.items)]
+
+    def version(self, number, path, index, version_number):
+        """
+        Get a version of an item.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder the item is in.
+            index (int): The position of the item in the folder.
+            version_number (int): The version number, starting at 1.
+
+        Returns:
+            dict(JsonApiObject): The version.
+        """
+        key = "{}_r{}_i{}".format(number, ''.join("-{}".format(i) for i in path), index)
+        version_id = "urn:adsk.wipprod:fs.file:vf.{}?version={}".format(key, version_number)
+        name = "Model {}-{}.rvt".format('.'.join(str(i + 1) for i in path) or '0', index + 1)
+        urn = base64.urlsafe_b64encode(version_id.encode('utf8')).decode('utf8').rstrip('=')
+        return {'type' : 'versions', 'id' : version_id,
+                'attributes' : {'name' : name, 'displayName' : name, 'versionNumber' : version_number,
+                                'createTime' : '2020-01-01T00:00:00.0000000Z',
+                                'lastModifiedTime' : '2021-01-{:02d}T00:00:00.0000000Z'.format(version_number % 28 + 1),
+                                'storageSize' : self._hash(version_id) % 100000000,
+                                'extension' : {'type' : 'versions:autodesk.bim360:File', 'version' : '1.0'}},
+                'relationships' : {'item' : {'data' : {'type' : 'items',
+                                                       'id' : "urn:adsk.wipprod:dm.lineage:{}".format(key)}},
+                                   'derivatives' : {'data' : {'type' : 'derivatives', 'id' : urn}}}}
+
+    def parse_version_id(self, version_id):
+        """
+        Get a version from its id.
+
+        Args:
+            version_id (str): The version id.
+
+        Returns:
+            dict(JsonApiObject): The version, None if it does not exist.
+        """
+        match = VERSION_ID.match(version_id)
+
+        if match is None:
+            return None
+
+        folder = self.parse_folder_id("urn:adsk.wipprod:fs.folder:co.{}_r{}".format(match.group(1), match.group(2)))
+        index = int(match.group(3))
+        version_number = int(match.group(4))
+
+        if folder is None or index >= self.items or not 1 <= version_number <= self.versions:
+            return None
+
+        return self.version(folder[0], folder[1], index, version_number)
+
+    def search(self, number, path, names=None):
+        """
+        Get the tip versions of the items in a folder and its subfolders.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+            names (list(str), optional): Only get the versions whose name is one of these. Defaults to None.
+
+        Returns:
+            list(tuple(dict(JsonApiObject), dict(JsonApiObject))): The items and their tip versions.
+        """
+        results = []
+        stack = [path]
+
+        while stack:
+            path = stack.pop()
+            for item, tip in self.items_of(number, path):
+                if names is None or tip['attributes']['name'] in names:
+                    results.append((item, tip))
+            if len(path) < self.depth:
+                stack.extend(path + (i,) for i in reversed(range(self.fanout)))
+
+        return results
+
+    def company(self, index):
+        """
+        Get a company of the account.
+
+        Args:
+            index (int): The position of the company.
+
+        Returns:
+            dict: The company.
+        """
+        return {'id' : self._make_uuid(0xc0000000 + index), 'account_id' : self.account_id,
+                'name' : "Company {:04d}".format(index), 'trade' : ('Architecture', 'Structural', 'MEP')[index % 3],
+                'country' : 'Netherlands', 'erp_id' : None, 'tax_id' : None}
+
+    def user(self, number, index):
+        """
+        Get a user of a project.
+
+        Args:
+            number (int): The number of the project.
+            index (int): The position of the user.
+
+        Returns:
+            dict: The user.
+        """
+        company = index % max(self.companies, 1)
+        return {'id' : self._make_uuid(0xa0000000 + index), 'email' : "user{:05d}@example.com".format(index),
+                'name' : "User {:05d}".format(index), 'firstName' : 'User', 'lastName' : "{:05d}".format(index),
+                'autodeskId' : "AD{:08d}".format(index), 'status' : 'active',
+                'companyId' : self.company(company)['id'] if self.companies else None,
+                'accessLevels' : {'accountAdmin' : False, 'projectAdmin' : index == 0, 'executive' : False},
+                'projectId' : self._make_uuid(number)}
+
+    def business_units(self):
+        """
+        Get the business units structure of the account.
+
+        Returns:
+            dict: The business units.
+        """
+        units = [{'id' : self._make_uuid(0xb0000000 + i), 'account_id' : self.account_id,
+                  'parent_id' : self._make_uuid(0xb0000000) if i else None, 'name' : "Business Unit {}".format(i),
+                  'description' : '', 'path' : "Business Unit 0" + ("/Business Unit {}".format(i) if i else '')}
+                 for i in range(4)]
+        return {'business_units' : units}
+
+    def permissions(self, number, path):
+        """
+        Get the permissions on a folder, including the changes posted to the stand-in.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+
+        Returns:
+            list(dict): The permissions.
+        """
+        folder_id = self.folder_id(number, path)
+
+        with self._lock:
+            changed = self._permissions.get(folder_id)
+            if changed is not None:
+                return [dict(permission) for permission in changed.values()]
+
+        return list(self._default_permissions(number, path).values())
+
+    def change_permissions(self, number, path, operation, subjects):
+        """
+        Apply a batch of permission changes to a folder.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+            operation (str): One of 'create', 'update' or 'delete'.
+            subjects (list(dict)): The payload items, with subjectId, subjectType and, except to delete, actions.
+
+        Returns:
+            dict: The results and errors of the changes.
+        """
+        folder_id = self.folder_id(number, path)
+        results = []
+        errors = []
+
+        with self._lock:
+            permissions = self._permissions.get(folder_id)
+            if permissions is None:
+                permissions = self._permissions[folder_id] = self._default_permissions(number, path)
+
+            for subject in subjects:
+                subject_id = subject.get('subjectId')
+                if not subject_id or subject.get('subjectType') not in ('USER', 'COMPANY', 'ROLE'):
+                    errors.append({'subjectId' : subject_id, 'code' : 'BAD_INPUT', 'title' : "Invalid subject."})
+                elif operation == 'delete':
+                    permissions.pop(subject_id, None)
+                elif operation == 'update' and subject_id not in permissions:
+                    errors.append({'subjectId' : subject_id, 'code' : 'NOT_FOUND', 'title' : "Subject has no permission."})
+                else:
+                    permission = {'subjectId' : subject_id, 'subjectType' : subject['subjectType'],
+                                  'actions' : list(subject.get('actions') or []), 'inheritActions' : []}
+                    permissions[subject_id] = permission
+                    results.append(dict(permission))
+
+        return {'results' : results, 'errors' : errors}
+
+    def _default_permissions(self, number, path):
+        """
+        Get the generated permissions on a folder, inherited down the folder tree.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+
+        Returns:
+            dict(str, dict): The permissions by subject id.
+        """
+        permissions = {}
+
+        for level in range(len(path) + 1):
+            inherited = level < len(path)
+            for k in range(3):
+                index = self._hash('permission', number, path[:level], k) % max(self.users, 1)
+                user = self.user(number, index)
+                actions = ACTIONS[self._hash('actions', number, path[:level], k) % len(ACTIONS)]
+                permission = permissions.setdefault(user['id'], {
+                    'subjectId' : user['id'], 'autodeskId' : user['autodeskId'], 'name' : user['name'],
+                    'email' : user['email'], 'subjectType' : 'USER', 'subjectStatus' : 'ACTIVE',
+                    'actions' : [], 'inheritActions' : []})
+                key = 'inheritActions' if inherited else 'actions'
+                permission[key] = sorted(set(permission[key]) | set(actions))
+
+        return permissions
+
+    def _modified_time(self, number, path):
+        """
+        Get the last modified time of a folder.
+
+        Args:
+            number (int): The number of the project.
+            path (tuple(int)): The path of the folder.
+
+        Returns:
+            str: The time in ISO 8601 format.
+        """
+        return '2021-{:02d}-{:02d}T00:00:00.0000000Z'.format(self._hash(number, path) % 12 + 1,
+                                                            self._hash(path, number) % 28 + 1)
+
+    def manifest(self, urn):
+        """
+        Get the manifest of a model.
+
+        Args:
+            urn (str): The base64 encoded urn of the model.
+
+        Returns:
+            dict: The manifest.
+        """
+        guids = self.view_guids(urn)
+        return {'type' : 'manifest', 'urn' : urn, 'status' : 'success', 'progress' : 'complete', 'region' : 'US',
+                'hasThumbnail' : 'true',
+                'derivatives' : [{'name' : 'model.rvt', 'hasThumbnail' : 'true', 'status' : 'success',
+                                  'progress' : 'complete', 'outputType' : 'svf',
+                                  'children' : [{'guid' : guid, 'type' : 'geometry', 'role' : role, 'name' : role,
+                                                 'status' : 'success', 'progress' : 'complete',
+                                                 'children' : [{'guid' : "{}-svf".format(guid), 'type' : 'resource',
+                                                                'role' : 'graphics', 'mime' : 'application/autodesk-svf',
+                                                                'urn' : "urn:adsk.viewing:fs.file:{}/output/{}.svf".format(urn, role)}]}
+                                                for guid, role in zip(guids, ('3d', '2d'))]}]}
+
+    def view_guids(self, urn):
+        """
+        Get the guids of the model views of a model.
+
+        The base64 padding of the urn is ignored, so the padded urns sent by ModelDerivativeApi and the unpadded derivative
+        ids of the versions give the same views.
+
+        Args:
+            urn (str): The base64 encoded urn of the model, with or without padding.
+
+        Returns:
+            list(str): The guids of the 3D and the 2D view.
+        """
+        urn = urn.rstrip('=')
+        return ["{:08x}-{:04x}-4{:03x}-8{:03x}-{:012x}".format(self._hash(urn, view) & 0xffffffff, view, view, view,
+                                                                self._hash(view, urn) & 0xffffffffffff)
+                for view in (3, 2)]
+
+    def metadata(self, urn):
+        """
+        Get the model views of a model.
+
+        Args:
+            urn (str): The base64 encoded urn of the model.
+
+        Returns:
+            dict: The metadata.
+        """
+        return {'data' : {'type' : 'metadata',
+                          'metadata' : [{'name' : name, 'role' : role, 'guid' : guid}
+                                        for guid, name, role in zip(self.view_guids(urn), ('{3D}', 'Sheet'), ('3d', '2d'))]}}
+
+    def object_tree(self, urn, guid):
+        """
+        Get the object tree of a model view.
+
+        Args:
+            urn (str): The base64 encoded urn of the model.
+            guid (str): The guid of the model view.
+
+        Returns:
+            dict: The object tree, None if the model view does not exist.
+        """
+        if guid not in self.view_guids(urn):
+            return None
+
+        categories = []
+        per_category = max(self.objects // 10, 1)
+
+        for c in range(0, self.objects, per_category):
+            objects = [{'objectid' : i + 2, 'name' : "Element [{}]".format(i + 1000)}
+                       for i in range(c, min(c + per_category, self.objects))]
+            categories.append({'objectid' : 100000 + len(categories), 'name' : "Category {}".format(len(categories)),
+                               'objects' : objects})
+
+        return {'data' : {'type' : 'objects',
+                          'objects' : [{'objectid' : 1, 'name' : 'Model', 'objects' : categories}]}}
+
+    def properties(self, urn, guid):
+        """
+        Get the properties of the objects of a model view.
+
+        Args:
+            urn (str): The base64 encoded urn of the model.
+            guid (str): The guid of the model view.
+
+        Returns:
+            dict: The properties, None if the model view does not exist.
+        """
+        if guid not in self.view_guids(urn):
+            return None
+
+        collection = []
+
+        for i in range(self.objects):
+            value = self._hash(urn.rstrip('='), i)
+            collection.append({'objectid' : i + 2, 'name' : "Element [{}]".format(i + 1000),
+                               'externalId' : "{:08x}-{:04x}".format(value & 0xffffffff, i),
+                               'properties' : {'Identity Data' : {'Mark' : str(i), 'Type Name' : "Type {}".format(value % 40),
+                                                                  'Comments' : ''},
+                                               'Dimensions' : {'Length' : "{} mm".format(value % 10000),
+                                                               'Volume' : "{:.3f} m^3".format((value % 100000) / 1000)},
+                                               'Constraints' : {'Level' : "Level {}".format(value % 8),
+                                                                'Offset' : "{} mm".format(value % 500)}}})
+
+        return {'data' : {'type' : 'properties', 'collection' : collection}}
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded http server that does not report the connections its clients reset or abandon."""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        """
+        Report an error raised while handling a request, unless the client closed the connection.
+
+        Args:
+            request (socket.socket): The connection of the request.
+            client_address (tuple): The address of the client.
+
+        Returns:
+            None.
+        """
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class ForgeStandIn():
+    """Local threaded http server standing in for the Autodesk Forge endpoints, with latency and fault injection.
+
+    Point the base_url of any Api class at the url of the stand-in followed by the path of its default base url, e.g.
+    FoldersApi(token, base_url=stand_in.url + 'data/v1/projects/').
+    """
+
+    def __init__(self, data=None, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, throttle_rate=0.0,
+                 error_rate=0.0, retry_after=1, processing_polls=2, require_auth=True, seed=0):
+        """
+        Initialize the ForgeStandIn class with its data and the faults to be injected.
+
+        Args:
+            data (StandInData, optional): The data served. Defaults to None, in which case StandInData() is used.
+            host (str, optional): Address the server listens on. Defaults to '127.0.0.1'.
+            port (int, optional): Port the server listens on, 0 to pick a free port. Defaults to 0.
+            latency (float, optional): Time in s added to every response. Defaults to 0.0.
+            jitter (float, optional): Maximum random time in s added on top of the latency. Defaults to 0.0.
+            throttle_rate (float, optional): Fraction of the requests answered with 429 Too Many Requests. Defaults to 0.0.
+            error_rate (float, optional): Fraction of the requests answered with a 500, 502 or 503 error. Defaults to 0.0.
+            retry_after (int, optional): Value of the Retry-After header of the 429 responses in s. Defaults to 1.
+            processing_polls (int, optional): Number of 202 Accepted responses for the object tree and properties of a
+                model view before they are served. Defaults to 2.
+            require_auth (bool, optional): Answer requests without a bearer token with 401 Unauthorized. Defaults to True.
+            seed (int, optional): Seed of the fault injection. Defaults to 0.
+
+        Raises:
+            ValueError: If a rate is not between 0 and 1.
+
+        Returns:
+            None.
+        """
+        if not 0 <= throttle_rate <= 1 or not 0 <= error_rate <= 1:
+            raise ValueError("Throttle and error rates must be between 0 and 1.")
+
+        self.data = StandInData() if data is None else data
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.processing_polls = processing_polls
+        self.require_auth = require_auth
+        self._random = random.Random(seed)
+        self._polls = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.server = StandInServer((host, port), self._make_handler())
+
+    @property
+    def url(self):
+        """
+        Get the url of the stand-in, ending with '/'.
+
+        Returns:
+            str: The url, e.g. 'http://127.0.0.1:8000/'.
+        """
+        host, port = self.server.server_address[:2]
+        return "http://{}:{}/".format(host, port)
+
+    def start(self):
+        """
+        Start serving in a daemon thread.
+
+        Returns:
+            ForgeStandIn: This instance.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the socket.
+
+        Returns:
+            None.
+        """
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self):
+        """
+        Get the number of requests answered, per endpoint template and status code.
+
+        Returns:
+            dict(str, dict(int, int)): Per 'METHOD template' the number of responses by status code.
+        """
+        with self._lock:
+            return {key : dict(counts) for key, counts in self._counts.items()}
+
+    def reset_stats(self):
+        """
+        Drop the request counts and the 202 Accepted progress of the model views.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._counts.clear()
+            self._polls.clear()
+
+    def _count(self, method, path, status):
+        """
+        Count an answered request.
+
+        Args:
+            method (str): HTTP method of the request.
+            path (str): Path of the request.
+            status (int): Status code of the response.
+
+        Returns:
+            None.
+        """
+        key = "{} {}".format(method, endpoint_template(path))
+
+        with self._lock:
+            counts = self._counts.setdefault(key, {})
+            counts[status] = counts.get(status, 0) + 1
+
+    def _inject(self):
+        """
+        Draw the latency and fault of a request.
+
+        Returns:
+            tuple(float, int): The delay in s and the status code of the injected fault, None if there is none.
+        """
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            draw = self._random.random()
+            status = None
+            if draw < self.throttle_rate:
+                status = 429
+            elif draw < self.throttle_rate + self.error_rate:
+                status = self._random.choice((500, 502, 503))
+        return delay, status
+
+    def _processing(self, key):
+        """
+        Check if a model view is still being processed, counting the poll.
+
+        Args:
+            key (tuple): The urn, guid and kind of the requested resource.
+
+        Returns:
+            bool: True if the request is to be answered with 202 Accepted.
+        """
+        with self._lock:
+            polls = self._polls.get(key, 0)
+            self._polls[key] = polls + 1
+        return polls < self.processing_polls
+
+    def _make_handler(self):
+        """
+        Make the request handler class serving this stand-in.
+
+        Returns:
+            type: The BaseHTTPRequestHandler subclass.
+        """
+        stand_in = self
+
+        class Handler(StandInHandler):
+            pass
+
+        Handler.stand_in = stand_in
+        return Handler
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler routing the Autodesk Forge endpoints to the data of a ForgeStandIn."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, with Nagle's algorithm every response would wait for a delayed ACK.
+    disable_nagle_algorithm = True
+    stand_in = None
+
+    ROUTES = [('POST', re.compile(r'^/authentication/v\d+/(?:authenticate|token)$'), 'authenticate'),
+              ('GET', re.compile(r'^/project/v1/hubs$'), 'hubs'),
+              ('GET', re.compile(r'^/project/v1/hubs/([^/]+)/projects$'), 'projects'),
+              ('GET', re.compile(r'^/data/v1/projects/([^/]+)/folders/([^/]+)$'), 'folder'),
+              ('GET', re.compile(r'^/data/v1/projects/([^/]+)/folders/([^/]+)/contents$'), 'contents'),
+              ('GET', re.compile(r'^/data/v1/projects/([^/]+)/folders/([^/]+)/search$'), 'search'),
+              ('GET', re.compile(r'^/data/v1/projects/([^/]+)/versions/([^/]+)$'), 'version'),
+              ('POST', re.compile(r'^/bim360/docs/v1/projects/([^/]+)/versions:batch-get$'), 'versions_batch'),
+              ('GET', re.compile(r'^/bim360/docs/v1/projects/([^/]+)/folders/([^/]+)/permissions$'), 'permissions'),
+              ('POST', re.compile(r'^/bim360/docs/v1/projects/([^/]+)/folders/([^/]+)/permissions:batch-(create|update|delete)$'),
+               'change_permissions'),
+              ('GET', re.compile(r'^/bim360/docs/v1/projects/([^/]+)/folders/([^/]+)/custom-attribute-definitions$'),
+               'attribute_definitions'),
+              ('GET', re.compile(r'^/bim360/admin/v1/projects/([^/]+)/users$'), 'users'),
+              ('GET', re.compile(r'^/hq/v1/accounts/([^/]+)/companies$'), 'companies'),
+              ('GET', re.compile(r'^/hq/v1/accounts/([^/]+)/business_units_structure$'), 'business_units'),
+              ('GET', re.compile(r'^/modelderivative/v2/designdata/([^/]+)/manifest$'), 'manifest'),
+              ('GET', re.compile(r'^/modelderivative/v2/designdata/([^/]+)/manifest/(.+)$'), 'derivative'),
+              ('GET', re.compile(r'^/modelderivative/v2/designdata/([^/]+)/metadata$'), 'metadata'),
+              ('GET', re.compile(r'^/modelderivative/v2/designdata/([^/]+)/metadata/([^/]+)$'), 'object_tree'),
+              ('GET', re.compile(r'^/modelderivative/v2/designdata/([^/]+)/metadata/([^/]+)/properties$'), 'properties')]
+
+    def log_message(self, format, *args):
+        """Silence the request log of BaseHTTPRequestHandler."""
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method):
+        """
+        Route a request to its handler method, after injecting latency and faults.
+
+        Args:
+            method (str): HTTP method of the request.
+
+        Returns:
+            None.
+        """
+        url = urlparse(self.path)
+        self.query = {key : values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        self.body = self.rfile.read(length) if length else b''
+
+        delay, fault = self.stand_in._inject()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if fault == 429:
+            return self._send_json(url.path, {'developerMessage' : "Rate limit exceeded."}, 429,
+                                   {'Retry-After' : str(self.stand_in.retry_after)})
+
+        if fault is not None:
+            return self._send_json(url.path, {'developerMessage' : "Injected server error."}, fault)
+
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.match(url.path)
+            if match is None or route_method != method:
+                continue
+
+            if (name != 'authenticate' and self.stand_in.require_auth and
+                    not self.headers.get('Authorization', '').startswith('Bearer ')):
+                return self._send_json(url.path, {'developerMessage' : "The Authorization header is missing."}, 401)
+
+            result = getattr(self, '_' + name)(*(unquote(group) for group in match.groups()))
+
+            if result is None:
+                return self._send_json(url.path, {'developerMessage' : "The requested resource does not exist."}, 404)
+
+            return self._send_json(url.path, *result) if isinstance(result, tuple) else self._send_json(url.path, result)
+
+        self._send_json(url.path, {'developerMessage' : "Unknown endpoint."}, 404)
+
+    def _send_json(self, path, cont, status=200, headers=None):
+        """
+        Send a response with a JSON body, or raw bytes.
+
+        Args:
+            path (str): Path of the request, for the request counts.
+            cont: The JSON document, or bytes to be sent as they are.
+            status (int, optional): Status code of the response. Defaults to 200.
+            headers (dict, optional): Additional response headers. Defaults to None.
+
+        Returns:
+            None.
+        """
+        if isinstance(cont, bytes):
+            body, content_type = cont, 'application/octet-stream'
+        else:
+            body, content_type = json.dumps(cont).encode('utf8'), 'application/vnd.api+json'
+
+        # Counted before sending, so the counts include every response a client has received.
+        self.stand_in._count(self.command, path, status)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _next_link(self, number, limit):
+        """
+        Make the JsonApi links of a page, with a next link if there is a next page.
+
+        Args:
+            number (int): Number of the next page, None if there is none.
+            limit (int): Size of the pages.
+
+        Returns:
+            dict: The links.
+        """
+        if number is None:
+            return {}
+
+        query = {key : value for key, value in self.query.items() if not key.startswith('page[')}
+        query.update({'page[number]' : number, 'page[limit]' : limit})
+        href = "http://{}{}?{}".format(self.headers.get('Host'), urlparse(self.path).path, urlencode(query))
+        return {'next' : {'href' : href}}
+
+    def _page(self, entries):
+        """
+        Get the page of a list of entries requested with page[number] and page[limit].
+
+        Args:
+            entries (list): All entries.
+
+        Returns:
+            tuple(list, dict): The entries of the page and the links of the page.
+        """
+        limit = int(self.query.get('page[limit]', DEFAULT_PAGE_LIMIT))
+        number = int(self.query.get('page[number]', 0))
+        start = number * limit
+        has_next = start + limit < len(entries)
+        return entries[start:start + limit], self._next_link(number + 1 if has_next else None, limit)
+
+    def _window(self, entries):
+        """
+        Get the window of a list of entries requested with limit and offset.
+
+        Args:
+            entries (list): All entries.
+
+        Returns:
+            list: The entries of the window.
+        """
+        limit = int(self.query.get('limit', 100))
+        offset = int(self.query.get('offset', 0))
+        return entries[offset:offset + limit]
+
+    def _project_folder(self, project_id, folder_id):
+        """
+        Get the project number and path of a folder, checking it is in the given project.
+
+        Args:
+            project_id (str): The project id, with or without the 'b.' prefix.
+            folder_id (str): The folder id.
+
+        Returns:
+            tuple(int, tuple(int)): The number of the project and the path of the folder, None if they do not exist.
+        """
+        number = self.stand_in.data.project_number(project_id)
+        folder = self.stand_in.data.parse_folder_id(folder_id)
+
+        if number is None or folder is None or folder[0] != number:
+            return None
+
+        return folder
+
+    def _authenticate(self):
+        return {'access_token' : "stand-in-{:016x}".format(random.getrandbits(64)), 'token_type' : 'Bearer',
+                'expires_in' : 3599}
+
+    def _hubs(self):
+        return {'jsonapi' : {'version' : '1.0'}, 'data' : [self.stand_in.data.hub()]}
+
+    def _projects(self, hub_id):
+        data = self.stand_in.data
+
+        if hub_id != data.hub_id:
+            return None
+
+        projects, links = self._page([data.project(number) for number in range(data.projects)])
+        return {'jsonapi' : {'version' : '1.0'}, 'links' : links, 'data' : projects}
+
+    def _folder(self, project_id, folder_id):
+        folder = self._project_folder(project_id, folder_id)
+        return None if folder is None else {'jsonapi' : {'version' : '1.0'}, 'data' : self.stand_in.data.folder(*folder)}
+
+    def _contents(self, project_id, folder_id):
+        folder = self._project_folder(project_id, folder_id)
+
+        if folder is None:
+            return None
+
+        types = self.query.get('filter[type]', 'folders,items').split(',')
+        entries = []
+        if 'folders' in types:
+            entries += [(subfolder, None) for subfolder in self.stand_in.data.subfolders(*folder)]
+        if 'items' in types:
+            entries += self.stand_in.data.items_of(*folder)
+
+        page, links = self._page(entries)
+        return {'jsonapi' : {'version' : '1.0'}, 'links' : links, 'data' : [entry for entry, tip in page],
+                'included' : [tip for entry, tip in page if tip is not None]}
+
+    def _search(self, project_id, folder_id):
+        folder = self._project_folder(project_id, folder_id)
+
+        if folder is None:
+            return None
+
+        names = self.query.get('filter[name]')
+        page, links = self._page(self.stand_in.data.search(*folder, names=names.split(',') if names else None))
+        return {'jsonapi' : {'version' : '1.0'}, 'links' : links, 'data' : [tip for item, tip in page],
+                'included' : [item for item, tip in page]}
+
+    def _version(self, project_id, version_id):
+        version = self.stand_in.data.parse_version_id(version_id)
+        return None if version is None else {'jsonapi' : {'version' : '1.0'}, 'data' : version}
+
+    def _versions_batch(self, project_id):
+        if self.stand_in.data.project_number(project_id) is None:
+            return None
+
+        urns = json.loads(self.body or b'{}').get('urns', [])
+
+        if len(urns) > 50:
+            return {'developerMessage' : "At most 50 urns are allowed."}, 400
+
+        results = []
+        errors = []
+
+        for urn in urns:
+            version = self.stand_in.data.parse_version_id(urn)
+            if version is None:
+                errors.append({'urn' : urn, 'code' : 'NOT_FOUND', 'title' : "Version not found."})
+            else:
+                attributes = version['attributes']
+                results.append({'urn' : urn, 'itemUrn' : version['relationships']['item']['data']['id'],
+                                'name' : attributes['name'], 'title' : attributes['displayName'],
+                                'revisionNumber' : attributes['versionNumber'], 'customAttributes' : []})
+
+        return {'results' : results, 'errors' : errors}
+
+    def _permissions(self, project_id, folder_id):
+        folder = self._project_folder(project_id, folder_id)
+        return None if folder is None else self.stand_in.data.permissions(*folder)
+
+    def _change_permissions(self, project_id, folder_id, operation):
+        folder = self._project_folder(project_id, folder_id)
+
+        if folder is None:
+            return None
+
+        subjects = json.loads(self.body or b'[]')
+
+        if not isinstance(subjects, list):
+            return {'developerMessage' : "The payload must be a list of subjects."}, 400
+
+        cont = self.stand_in.data.change_permissions(*folder, operation, subjects)
+        return (b'', 204) if operation == 'delete' and not cont['errors'] else cont
+
+    def _attribute_definitions(self, project_id, folder_id):
+        if self._project_folder(project_id, folder_id) is None:
+            return None
+
+        return {'results' : [{'id' : 1000 + i, 'name' : "Attribute {}".format(i), 'type' : 'string'} for i in range(3)],
+                'pagination' : {'limit' : 200, 'offset' : 0, 'totalResults' : 3}}
+
+    def _users(self, project_id):
+        data = self.stand_in.data
+        number = data.project_number(project_id)
+
+        if number is None:
+            return None
+
+        users = [data.user(number, index) for index in range(data.users)]
+        window = self._window(users)
+        return {'pagination' : {'limit' : int(self.query.get('limit', 100)), 'offset' : int(self.query.get('offset', 0)),
+                                'totalResults' : len(users)},
+                'results' : window}
+
+    def _companies(self, account_id):
+        data = self.stand_in.data
+
+        if account_id != data.account_id:
+            return None
+
+        return self._window([data.company(index) for index in range(data.companies)])
+
+    def _business_units(self, account_id):
+        data = self.stand_in.data
+        return data.business_units() if account_id == data.account_id else None
+
+    def _manifest(self, urn):
+        return self.stand_in.data.manifest(urn)
+
+    def _derivative(self, urn, derivative_urn):
+        return hashlib.sha256((urn + derivative_urn).encode('utf8')).digest() * 4096
+
+    def _metadata(self, urn):
+        return self.stand_in.data.metadata(urn)
+
+    def _object_tree(self, urn, guid):
+        if guid in self.stand_in.data.view_guids(urn) and self.stand_in._processing((urn, guid, 'tree')):
+            return {'result' : 'success'}, 202
+        return self.stand_in.data.object_tree(urn, guid)
+
+    def _properties(self, urn, guid):
+        if guid in self.stand_in.data.view_guids(urn) and self.stand_in._processing((urn, guid, 'properties')):
+            return {'result' : 'success'}, 202
+        return self.stand_in.data.properties(urn, guid)
+
+
+def main(args=None):
+    """
+    Run a stand-in from the command line until it is interrupted.
+
+    Args:
+        args (list(str), optional): The command line arguments. Defaults to None, in which case sys.argv is used.
+
+    Returns:
+        None.
+    """
+    parser = argparse.ArgumentParser(prog='python -m PyForge.ForgeStandIn',
+                                     description="Serve synthetic Autodesk Forge data for offline benchmarks.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--projects', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--items', type=int, default=5)
+    parser.add_argument('--versions', type=int, default=2)
+    parser.add_argument('--companies', type=int, default=50)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--objects', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.0, help="Time in s added to every response.")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Maximum random time in s added to the latency.")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Fraction of requests answered with 429.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 5xx.")
+    parser.add_argument('--processing-polls', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    options = parser.parse_args(args)
+
+    data = StandInData(projects=options.projects, depth=options.depth, fanout=options.fanout, items=options.items,
+                       versions=options.versions, companies=options.companies, users=options.users,
+                       objects=options.objects, seed=options.seed)
+    stand_in = ForgeStandIn(data, host=options.host, port=options.port, latency=options.latency, jitter=options.jitter,
+                            throttle_rate=options.throttle_rate, error_rate=options.error_rate,
+                            processing_polls=options.processing_polls, seed=options.seed)
+
+    print("Serving the Autodesk Forge stand-in on {}".format(stand_in.url))
+    print("Hub id: {}, account id: {}".format(data.hub_id, data.account_id))
+
+    try:
+        stand_in.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
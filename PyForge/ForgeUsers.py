@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to users on the Autodesk Forge BIM360 platform."""
 from PyForge.ForgeApi import ForgeApi
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from PyForge.Paginator import OffsetPaginator
 
 
 class UsersApi(ForgeApi):
@@ -8,7 +10,7 @@ class UsersApi(ForgeApi):
 
     def __init__(self, token,
                  base_url=r'https://developer.api.autodesk.com/bim360/admin/v1/',
-                 timeout=1):
+                 timeout=1, **kwargs):
         """
         Initialize the UsersApi class and attach an authentication token for the Autodesk Forge API.
 
@@ -17,18 +19,21 @@ class UsersApi(ForgeApi):
             base_url (str, optional): Base URL for calls to the users API.
                 Defaults to r'https://developer.api.autodesk.com/bim360/admin/v1/'
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
 
         Returns:
             None.
 
         """
-        self.token = token
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
 
     def get_project_users(self, project_id=None, region='US', accept_language="de", filters={},
-                          limit=100, offset=0, sort=[], fields=[],
+                          limit=100, offset=0, sort=[], fields=[], max_workers=8,
                           endpoint=r'projects/:projectId/users'):
         """
-        Send a GET projects/:projectId/users request to the BIM360 API, returns the users assigned to the project.
+        Send GET projects/:projectId/users requests to the BIM360 API, returns the users assigned to the project.
+
+        After the first window of results the remaining windows are requested concurrently.
 
         Args:
             project_id (str, optional): The project id for the BIM360 project. Defaults to None.
@@ -39,11 +44,13 @@ class UsersApi(ForgeApi):
             offset (int, optional): Offset of the response array. Defaults to 0.
             sort (list, optional): List of string field names to sort in ascending order, Prepending a field with - sorts in descending order. Defaults to [].
             fields (list, optional): List of string field names to include in the response array. Defaults to [].
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
             endpoint (str, optional):  endpoint for the GET projects/:projectId/users request.
                 Defaults to r'projects/:projectId/users'
 
         Raises:
             ValueError: If self.token, project_id are of NoneType.
+            TypeError: If the response does not contain a list of users.
             ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
 
         Returns:
@@ -71,7 +78,6 @@ class UsersApi(ForgeApi):
         params = {}
 
         params.update({'limit' : limit})
-        params.update({'offset' : offset})
 
         params.update(self.make_filters(filters))
 
@@ -82,36 +88,28 @@ class UsersApi(ForgeApi):
             fields = ",".join(fields)
             params.update({'field' : fields})
 
-        resp = self.http.get(endpoint, headers=headers, params=params)
+        def fetch_window(window_offset):
+            window_params = dict(params, offset=window_offset)
 
-        if resp.status_code == 200:
-            cont = resp.json()['results']
+            resp = self.http.get(endpoint, headers=headers, params=window_params)
+
+            if resp.status_code == 200:
+                cont = resp.json()
+
+                if isinstance(cont.get('results'), list):
+                    return cont['results'], cont.get('pagination', {}).get('totalResults')
 
-            if isinstance(cont, list):
-
-                if len(cont) == limit:
-                    cont += self.get_account_projects(token=token,
-                                                      project_id=project_id,
-                                                      region=region,
-                                                      accept_language=accept_language,
-                                                      filters=filters,
-                                                      limit=limit,
-                                                      offset=offset+limit,
-                                                      sort=sort,
-                                                      fields=fields,
-                                                      url=url)
-
-                return cont
-            else:
                 raise TypeError(f"Invalid response type for endpoint: {endpoint}\n" +
                                 f"with content: {resp.content}")
 
-        if resp.status_code == 401:
-            raise ConnectionError("Renew authorization token.")
+            if resp.status_code == 401:
+                raise ConnectionError("Renew authorization token.")
+
+            raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                  " and message : {}".format(resp.content) +
+                                  " for endpoint: {}".format(endpoint))
 
-        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
-                              " and message : {}".format(resp.content) +
-                              " for endpoint: {}".format(endpoint))
+        return OffsetPaginator(fetch_window, limit=limit, offset=offset, max_workers=max_workers).fetch_all()
 
     def make_filters(self, filters):
         """
@@ -138,3 +136,105 @@ class UsersApi(ForgeApi):
                 return {}
 
         raise TypeError("filters parameter has the wrong type: {}".format(type(filters)))
+
+
+class AsyncUsersApi(AsyncForgeApi):
+    """This class provides the asynchronous API calls for Autodesk BIM360 users."""
+
+    make_filters = UsersApi.make_filters
+
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/bim360/admin/v1/',
+                 timeout=1):
+        """
+        Initialize the AsyncUsersApi class and attach an authentication token for the Autodesk Forge API.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the users API.
+                Defaults to r'https://developer.api.autodesk.com/bim360/admin/v1/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+
+        Returns:
+            None.
+
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout)
+
+    async def get_project_users(self, project_id=None, region='US', accept_language="de", filters={},
+                                limit=100, offset=0, sort=[], fields=[],
+                                endpoint=r'projects/:projectId/users'):
+        """
+        Send a GET projects/:projectId/users request to the BIM360 API, returns the users assigned to the project.
+
+        Args:
+            project_id (str, optional): The project id for the BIM360 project. Defaults to None.
+            region (str, optional): The BIM360 server region to be adressed, can be US or EMEA. Defaults to US.
+            accept_language (str, optional): The language in which the response is to be returned. Defaults to de.
+            filters (dict, optional): A dict of filters in the form {filtertype : List(str filter entries)}. Defaults to {}.
+            limit (int, optional): Size of the response array. Defaults to 100.
+            offset (int, optional): Offset of the response array. Defaults to 0.
+            sort (list, optional): List of string field names to sort in ascending order, Prepending a field with - sorts in descending order. Defaults to [].
+            fields (list, optional): List of string field names to include in the response array. Defaults to [].
+            endpoint (str, optional):  endpoint for the GET projects/:projectId/users request.
+                Defaults to r'projects/:projectId/users'
+
+        Raises:
+            ValueError: If self.token, project_id are of NoneType.
+            TypeError: If the response does not contain a list of users.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            list(dict(JsonApiObject)): List of users JsonApi objects in the form of dicts.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncUsersApi.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if project_id.startswith("b."):
+            project_id = project_id[2:]
+
+        endpoint = endpoint.replace(':projectId', project_id)
+
+        headers = {'Authorization' : "Bearer {}".format(token),
+                   'Accept-Language' : accept_language,
+                   'Region' : region}
+
+        params = {'limit' : limit}
+
+        params.update(self.make_filters(filters))
+
+        if sort:
+            params.update({'sort' : ",".join(sort)})
+        if fields:
+            params.update({'field' : ",".join(fields)})
+
+        data = []
+
+        while True:
+
+            params.update({'offset' : offset})
+
+            resp = await self.http.get(endpoint, headers=headers, params=params)
+
+            if resp.status_code != 200:
+                raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                                      " and message : {}".format(resp.content) +
+                                      " for endpoint: {}".format(endpoint))
+
+            cont = resp.json()['results']
+
+            if not isinstance(cont, list):
+                raise TypeError(f"Invalid response type for endpoint: {endpoint}\n" +
+                                f"with content: {resp.content}")
+
+            data += cont
+
+            if len(cont) < limit:
+                return data
+
+            offset += limit
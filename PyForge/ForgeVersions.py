@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 """Module containing classes related to item versions on the Autodesk Forge BIM360 platform."""
+from concurrent.futures import ThreadPoolExecutor
 from PyForge.ForgeApi import ForgeApi
-from urllib.parse import quote_plus
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from urllib.parse import quote_plus, urljoin
+
+MAX_BATCH_SIZE = 50 # maximum number of version urns per versions:batch-get request
 
 
 class VersionsApi(ForgeApi):
@@ -9,7 +13,7 @@ class VersionsApi(ForgeApi):
 
     def __init__(self, token,
                  base_url=r'https://developer.api.autodesk.com/data/v1/projects/',
-                 timeout=1):
+                 timeout=1, docs_base_url=r'https://developer.api.autodesk.com/bim360/docs/v1/projects/', **kwargs):
         """
         Initialize the VersionsApi class and attach an authentication token for the Autodesk Forge API.
 
@@ -18,11 +22,15 @@ class VersionsApi(ForgeApi):
             base_url (str, optional): Base URL for calls to the versions API.
                 Defaults to r'https://developer.api.autodesk.com/data/v1/projects/'
             timeout (float, optional): Default timeout for API calls. Defaults to 1.
+            docs_base_url (str, optional): Base URL for calls to the BIM 360 Document Management API, used by get_versions.
+                Defaults to r'https://developer.api.autodesk.com/bim360/docs/v1/projects/'
+            kwargs: Additional keyword arguments passed on to ForgeApi, such as registry.
 
         Returns:
             None.
         """
-        super().__init__(token=token, base_url=base_url, timeout=timeout)
+        self.docs_base_url = docs_base_url
+        super().__init__(token=token, base_url=base_url, timeout=timeout, **kwargs)
 
     def get_version(self, project_id, version_id,
                     endpoint=r':project_id/versions/:version_id'):
@@ -73,4 +81,144 @@ class VersionsApi(ForgeApi):
 
         raise ConnectionError("Request failed with code {}".format(resp.status_code) +
                               " and message : {}".format(resp.content) +
-                              " for endpoint: {}".format(endpoint))
\ No newline at end of file
+                              " for endpoint: {}".format(endpoint))
+
+
+    def get_versions(self, project_id, version_ids, chunk_size=MAX_BATCH_SIZE, max_workers=8,
+                     endpoint=r':project_id/versions:batch-get'):
+        """
+        Send POST projects/:project_id/versions:batch-get requests to the BIM360 Document Management API, returns the versions corresponding to the version ids.
+
+        The version ids are split into chunks of at most chunk_size ids, which are sent concurrently.
+
+        Args:
+            project_id: The project id for the project the versions are in.
+            version_ids (list(str)): Version ids (urns) of the versions to be obtained.
+            chunk_size (int, optional): Number of version ids per request, at most MAX_BATCH_SIZE. Defaults to MAX_BATCH_SIZE.
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to 8.
+            endpoint (str, optional): endpoint for the POST projects/:project_id/versions:batch-get request, relative to
+                self.docs_base_url. Defaults to r':project_id/versions:batch-get'.
+
+        Raises:
+            ValueError: If self.token or project_id are of NoneType, or chunk_size is not between 1 and MAX_BATCH_SIZE.
+
+        Returns:
+            tuple(dict, dict): The versions by version id, and the exceptions of the missing or failed version ids by version id.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the VersionsApi.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if project_id.startswith("b."):
+            project_id = project_id[2:]
+
+        if not 1 <= chunk_size <= MAX_BATCH_SIZE:
+            raise ValueError("Chunk size must be between 1 and {}.".format(MAX_BATCH_SIZE))
+
+        endpoint = urljoin(self.docs_base_url, endpoint.replace(':project_id', project_id))
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+
+        version_ids = list(dict.fromkeys(version_ids))
+        chunks = [version_ids[i:i + chunk_size] for i in range(0, len(version_ids), chunk_size)]
+
+        def batch_get(chunk):
+            return self.http.post(endpoint, headers=headers, json={'urns' : chunk})
+
+        results = {}
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(chunk, executor.submit(batch_get, chunk)) for chunk in chunks]
+
+            for chunk, future in futures:
+                try:
+                    cont = future.result().json()
+                except Exception as e:
+                    errors.update((version_id, e) for version_id in chunk)
+                    continue
+
+                for result in cont.get('results', []):
+                    results[result['urn']] = result
+
+                for error in cont.get('errors', []):
+                    errors[error.get('urn')] = ConnectionError("Version batch-get failed with code {}".format(error.get('code')) +
+                                                               " and message : {}".format(error.get('title', error.get('detail'))))
+
+                for version_id in chunk:
+                    if version_id not in results and version_id not in errors:
+                        errors[version_id] = ConnectionError("Version {} not returned".format(version_id) +
+                                                             " for endpoint: {}".format(endpoint))
+
+        return results, errors
+
+
+class AsyncVersionsApi(AsyncForgeApi):
+    """This class provides the asynchronous API calls for Autodesk BIM360 versions."""
+
+    def __init__(self, token,
+                 base_url=r'https://developer.api.autodesk.com/data/v1/projects/',
+                 timeout=1):
+        """
+        Initialize the AsyncVersionsApi class and attach an authentication token for the Autodesk Forge API.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            base_url (str, optional): Base URL for calls to the versions API.
+                Defaults to r'https://developer.api.autodesk.com/data/v1/projects/'
+            timeout (float, optional): Default timeout for API calls. Defaults to 1.
+
+        Returns:
+            None.
+        """
+        super().__init__(token=token, base_url=base_url, timeout=timeout)
+
+    async def get_version(self, project_id, version_id,
+                          endpoint=r':project_id/versions/:version_id'):
+        """
+        Send a GET projects/:project_id/versions/:version_id request to the BIM360 API, returns the version corresponding to the version id.
+
+        Args:
+            project_id: The project id for the project the folder is in.
+            version_id (str): Version id of the version to be obtained
+            endpoint (str, optional): endpoint for the GET projects/:project_id/versions/:version_id request.
+            Defaults to r':project_id/versions/:version_id'.
+
+        Raises:
+            ValueError: If self.token, project_id or version_id are of NoneType.
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            dict(JsonApiObject): Version JsonApi object in the form of a dict.
+        """
+        try:
+            token = self.token
+        except AttributeError:
+            raise ValueError("Please initialise the AsyncVersionsApi.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if not project_id.startswith("b."):
+            project_id = "b.{}".format(project_id)
+
+        if version_id is None:
+            raise ValueError("Please enter a version id.")
+
+        endpoint = endpoint.replace(':project_id', project_id).replace(':version_id', quote_plus(version_id))
+
+        headers = {'Authorization' : "Bearer {}".format(token)}
+
+        resp = await self.http.get(endpoint, headers=headers)
+
+        if resp.status_code == 200:
+            cont = resp.json()
+            return cont['data']
+
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(endpoint))
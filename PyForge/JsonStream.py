@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Module containing the incremental JSON parser used to stream large responses of the Autodesk Forge platform."""
+import codecs
+import json
+import re
+
+STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+WHITESPACE = ' \t\r\n'
+NUMBER_CONTINUATION = '.eE+-' # characters that can only follow a number that was cut off at the end of a chunk
+
+
+class JsonArrayStream():
+    """Incremental parser yielding the elements of a JSON array nested in a streamed JSON document one at a time."""
+
+    def __init__(self, chunks, path=('data', 'collection')):
+        """
+        Initialize the JsonArrayStream class with the chunks of the document and the path to the array.
+
+        Args:
+            chunks (iterable(bytes)): The UTF-8 encoded JSON document in chunks, e.g. requests.Response.iter_content().
+            path (tuple(str), optional): Keys of the nested objects leading to the array. Defaults to ('data', 'collection').
+
+        Returns:
+            None.
+        """
+        self.path = list(path)
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._eof = False
+
+    def __iter__(self):
+        """
+        Iterate over the elements of the array, only keeping the element being decoded and one chunk in memory.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+
+        Yields:
+            The decoded elements of the array.
+        """
+        pos = self._find_array()
+
+        if pos is None:
+            return
+
+        decoder = json.JSONDecoder()
+
+        while True:
+            pos = self._skip(pos, WHITESPACE + ',')
+
+            if pos is None:
+                raise ValueError("Unexpected end of document inside the array.")
+
+            if self._buffer[pos] == ']':
+                return
+
+            try:
+                item, end = decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                pos = self._read(pos, grow=True)
+                continue
+
+            if (end == len(self._buffer) or self._buffer[end] in NUMBER_CONTINUATION) and not self._eof:
+                pos = self._read(pos, grow=True)
+                continue
+
+            yield item
+
+            pos = end
+
+    def _read(self, keep_from, grow=False):
+        """
+        Read the next chunk into the buffer, dropping everything before the given position.
+
+        Args:
+            keep_from (int): Position in the buffer from which the content has to be kept.
+            grow (bool, optional): Keep reading until the kept content has at least doubled, so a single large element is
+                not decoded once per chunk. Defaults to False.
+
+        Returns:
+            int: The new position of keep_from in the buffer, which is always 0.
+        """
+        kept = self._buffer[keep_from:]
+        target = 2 * len(kept) if grow else 0
+        parts = [kept]
+        size = len(kept)
+
+        while not self._eof and (size == len(kept) or size < target):
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                parts.append(self._decoder.decode(b'', final=True))
+                self._eof = True
+                break
+            text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            parts.append(text)
+            size += len(text)
+
+        self._buffer = ''.join(parts)
+        return 0
+
+    def _skip(self, pos, characters):
+        """
+        Skip the given characters, reading more chunks when the end of the buffer is reached.
+
+        Args:
+            pos (int): Position in the buffer to start skipping from.
+            characters (str): The characters to be skipped.
+
+        Returns:
+            int: Position of the first other character, or None if the document ended.
+        """
+        while True:
+            while pos < len(self._buffer) and self._buffer[pos] in characters:
+                pos += 1
+
+            if pos < len(self._buffer):
+                return pos
+
+            if self._eof:
+                return None
+
+            pos = self._read(pos)
+
+    def _find_array(self):
+        """
+        Tokenize the start of the document until the array at self.path is opened.
+
+        Returns:
+            int: Position of the first character after the opening bracket of the array, or None if there is no such array.
+        """
+        stack = []
+        pos = 0
+
+        while True:
+            pos = self._skip(pos, WHITESPACE)
+
+            if pos is None:
+                return None
+
+            char = self._buffer[pos]
+
+            if char == '"':
+                match = STRING_PATTERN.match(self._buffer, pos)
+                if match is None:
+                    if self._eof:
+                        raise ValueError("Unterminated string in document.")
+                    pos = self._read(pos)
+                    continue
+                if stack and stack[-1][0] == '{' and stack[-1][2]:
+                    stack[-1][1] = json.loads(match.group())
+                pos = match.end()
+            elif char == ':':
+                stack[-1][2] = False
+                pos += 1
+            elif char == ',':
+                if stack[-1][0] == '{':
+                    stack[-1][2] = True
+                pos += 1
+            elif char in '{[':
+                if (char == '[' and all(frame[0] == '{' for frame in stack)
+                        and [frame[1] for frame in stack] == self.path):
+                    return pos + 1
+                stack.append([char, None, char == '{'])
+                pos += 1
+            elif char in '}]':
+                stack.pop()
+                pos += 1
+                if not stack:
+                    return None
+            else:
+                pos += 1
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Module containing the pagination engines for paginated endpoints of the Autodesk Forge platform."""
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JsonApiPaginator():
+    """Lazy iterator over the pages of a JsonApi endpoint, prefetching the next page while the current one is processed."""
+
+    def __init__(self, http, endpoint, headers=None, params=None, prefetch=True):
+        """
+        Initialize the JsonApiPaginator class with the request for the first page.
+
+        Args:
+            http (requests.Session): Session used to send the requests.
+            endpoint (str): endpoint of the first page.
+            headers (dict, optional): Request headers sent with every page request. Defaults to None.
+            params (dict, optional): Query parameters of the first page. Defaults to None.
+            prefetch (bool, optional): Fetch page N+1 in the background while page N is being processed. Defaults to True.
+
+        Returns:
+            None.
+        """
+        self.http = http
+        self.endpoint = endpoint
+        self.headers = headers
+        self.params = params
+        self.prefetch = prefetch
+
+    def __iter__(self):
+        """
+        Iterate over the pages, following the links.next.href of every page until there is no next page.
+
+        Raises:
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Yields:
+            dict: The JsonApi document of every page.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        future = None
+
+        try:
+            cont = self.get_page(self.endpoint, self.params)
+
+            while True:
+                next_url = self.next_link(cont)
+
+                if next_url is not None and executor is not None:
+                    future = executor.submit(self.get_page, next_url)
+
+                yield cont
+
+                if next_url is None:
+                    return
+
+                if future is not None:
+                    cont = future.result()
+                    future = None
+                else:
+                    cont = self.get_page(next_url)
+        finally:
+            if future is not None:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def get_page(self, url, params=None):
+        """
+        Send the GET request for a single page.
+
+        Args:
+            url (str): Url of the page, relative to the base url of the session or absolute.
+            params (dict, optional): Query parameters, the next links of the Forge API already contain them. Defaults to None.
+
+        Raises:
+            ConnectionError: Different Connectionerrors based on retrieved ApiErrors from the Forge API.
+
+        Returns:
+            dict: The JsonApi document of the page.
+        """
+        resp = self.http.get(url, headers=self.headers, params=params)
+
+        if resp.status_code == 200:
+            return resp.json()
+
+        if resp.status_code == 401:
+            raise ConnectionError("Renew authorization token.")
+
+        raise ConnectionError("Request failed with code {}".format(resp.status_code) +
+                              " and message : {}".format(resp.content) +
+                              " for endpoint: {}".format(url))
+
+    @staticmethod
+    def next_link(cont):
+        """
+        Get the url of the next page from a JsonApi document.
+
+        Args:
+            cont (dict): JsonApi document of a page.
+
+        Returns:
+            str: Url of the next page, or None if this is the last page.
+        """
+        try:
+            return cont['links']['next']['href']
+        except (KeyError, TypeError):
+            return None
+
+
+class OffsetPaginator():
+    """Collects all windows of a limit/offset endpoint, fetching the windows after the first one concurrently."""
+
+    def __init__(self, fetch_window, limit=100, offset=0, max_workers=8):
+        """
+        Initialize the OffsetPaginator class with the function fetching a single window.
+
+        Args:
+            fetch_window (callable): Function taking an offset and returning the list of results in the window starting at
+                that offset, and the total number of results or None if the endpoint does not report it.
+            limit (int, optional): Size of the windows. Defaults to 100.
+            offset (int, optional): Offset of the first window. Defaults to 0.
+            max_workers (int, optional): Maximum number of windows fetched concurrently. Defaults to 8.
+
+        Returns:
+            None.
+        """
+        self.fetch_window = fetch_window
+        self.limit = limit
+        self.offset = offset
+        self.max_workers = max_workers
+
+    def fetch_all(self):
+        """
+        Fetch the first window and then all remaining windows concurrently, merging the results in order.
+
+        If the endpoint reports the total number of results all remaining windows are requested at once. Otherwise windows
+        are requested in waves of max_workers windows until a window is not full, so the last wave may contain a few
+        requests for empty windows.
+
+        Returns:
+            list: The results of all windows, in offset order.
+        """
+        results, total = self.fetch_window(self.offset)
+
+        if len(results) < self.limit:
+            return results
+
+        next_offset = self.offset + self.limit
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            if total is not None:
+                for window in executor.map(self._fetch_results, range(next_offset, total, self.limit)):
+                    results += window
+                return results
+
+            while True:
+                offsets = [next_offset + i * self.limit for i in range(self.max_workers)]
+
+                for window in executor.map(self._fetch_results, offsets):
+                    results += window
+                    if len(window) < self.limit:
+                        return results
+
+                next_offset += self.max_workers * self.limit
+
+    def _fetch_results(self, offset):
+        """
+        Fetch the results of the window starting at the given offset.
+
+        Args:
+            offset (int): Offset of the window.
+
+        Returns:
+            list: The results in the window.
+        """
+        return self.fetch_window(offset)[0]
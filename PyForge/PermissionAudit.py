@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Module containing the project-wide folder permission audit for the BIM 360 Document Management API."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from PyForge.ForgePermissionGet import PermissionApi
+
+
+class PermissionAudit():
+    """This class holds the permissions on all folders of a project, indexed by folder and by subject."""
+
+    def __init__(self, project_id=None, folders=None, errors=None):
+        """
+        Initialize the PermissionAudit class with the permissions per folder.
+
+        Args:
+            project_id (str, optional): The project id for the project the folders are in. Defaults to None.
+            folders (dict(str, dict), optional): Per folder id the folder 'name', 'path' and 'permissions', the permission
+                list returned by PermissionApi.get_folder_permission. Defaults to None.
+            errors (dict(str, str), optional): Error messages of the folders whose permissions could not be fetched, by
+                folder id. Defaults to None.
+
+        Returns:
+            None.
+        """
+        self.project_id = project_id
+        self.folders = dict(folders or {})
+        self.errors = dict(errors or {})
+        self.subjects = {}
+        self.reindex()
+
+    @classmethod
+    def from_tree(cls, token, project_id, tree, max_workers=8, permission_api=None):
+        """
+        Audit the permissions of all folders in a populated FolderTree, fetching them concurrently.
+
+        Args:
+            token (str): Authentication token for Autodesk Forge API.
+            project_id (str): The project id for the project the folders are in.
+            tree (FolderTree): The root of the populated folder tree, see FolderTree.populate.
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to 8.
+            permission_api (PermissionApi, optional): PermissionApi instance to reuse for the requests. A new one is created
+                if None. Defaults to None.
+
+        Raises:
+            ValueError: Is raised if token or project_id are NoneType.
+
+        Returns:
+            PermissionAudit: The audit, with the folders whose permissions could not be fetched in errors.
+        """
+        if token is None:
+            raise ValueError("Please give a authorization token.")
+
+        if project_id is None:
+            raise ValueError("Please enter a project id.")
+
+        if permission_api is None:
+            permission_api = PermissionApi(token)
+
+        nodes = list(tree.walk())
+
+        def get_permissions(node):
+            try:
+                return permission_api.get_folder_permission(project_id, node.folder['id']), None
+            except Exception as e:
+                return None, "{}: {}".format(type(e).__name__, e)
+
+        folders = {}
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for node, (permissions, error) in zip(nodes, executor.map(get_permissions, nodes)):
+                folder_id = node.folder['id']
+                if error is None:
+                    folders[folder_id] = {'name' : node.name, 'path' : node.path, 'permissions' : permissions}
+                else:
+                    errors[folder_id] = error
+
+        return cls(project_id, folders, errors)
+
+    def reindex(self):
+        """
+        Rebuild the subject index from the permissions per folder.
+
+        Returns:
+            None.
+        """
+        self.subjects = {}
+
+        for folder_id, folder in self.folders.items():
+            for permission in folder['permissions']:
+                subject = self.subjects.get(permission['subjectId'])
+                if subject is None:
+                    subject = self.subjects[permission['subjectId']] = {
+                        'subjectType' : permission.get('subjectType'),
+                        'name' : permission.get('name'),
+                        'email' : permission.get('email'),
+                        'folders' : {}}
+                subject['folders'][folder_id] = self.get_actions(permission)
+
+    @staticmethod
+    def get_actions(permission):
+        """
+        Get the actions a permission grants on its folder, both assigned and inherited from a parent folder.
+
+        Args:
+            permission (dict): The permission, as returned by PermissionApi.get_folder_permission.
+
+        Returns:
+            list(str): The sorted actions.
+        """
+        return sorted(set(permission.get('actions') or []) | set(permission.get('inheritActions') or []))
+
+    def get_folders(self, subject_id, action=None):
+        """
+        Get the folders a user, role or company can reach.
+
+        Args:
+            subject_id (str): The subject id of the user, role or company.
+            action (str, optional): Only get the folders on which the subject has this action, e.g. 'DOWNLOAD'.
+                Defaults to None.
+
+        Returns:
+            dict(str, list(str)): The actions of the subject by folder id, empty if the subject has no permissions.
+        """
+        subject = self.subjects.get(subject_id)
+
+        if subject is None:
+            return {}
+
+        return {folder_id : actions for folder_id, actions in subject['folders'].items()
+                if action is None or action in actions}
+
+    def get_subjects(self, folder_id):
+        """
+        Get the users, roles and companies that have permissions on a folder.
+
+        Args:
+            folder_id (str): The folder id for the folder.
+
+        Returns:
+            dict(str, list(str)): The actions by subject id, empty if the folder is not part of the audit.
+        """
+        folder = self.folders.get(folder_id)
+
+        if folder is None:
+            return {}
+
+        return {permission['subjectId'] : self.get_actions(permission) for permission in folder['permissions']}
+
+    def find_subjects(self, name=None, email=None, subject_type=None):
+        """
+        Find the subject ids of the users, roles and companies matching all given criteria.
+
+        Args:
+            name (str, optional): The name of the subject, case insensitive. Defaults to None.
+            email (str, optional): The email of the user, case insensitive. Defaults to None.
+            subject_type (str, optional): The type of subject. Possible values: USER, COMPANY, ROLE. Defaults to None.
+
+        Returns:
+            list(str): The subject ids.
+        """
+        def matches(value, expected):
+            return expected is None or (value or '').lower() == expected.lower()
+
+        return [subject_id for subject_id, subject in self.subjects.items()
+                if matches(subject['name'], name) and matches(subject['email'], email)
+                and matches(subject['subjectType'], subject_type)]
+
+    def save(self, path):
+        """
+        Save the audit to a JSON file, so it can be reloaded with PermissionAudit.load.
+
+        Args:
+            path (str): Path of the file to be written.
+
+        Returns:
+            None.
+        """
+        with open(path, 'w', encoding='utf8') as file:
+            json.dump({'project_id' : self.project_id, 'folders' : self.folders, 'errors' : self.errors}, file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an audit saved with PermissionAudit.save.
+
+        Args:
+            path (str): Path of the saved file.
+
+        Returns:
+            PermissionAudit: The audit, with the subject index rebuilt.
+        """
+        with open(path, encoding='utf8') as file:
+            data = json.load(file)
+
+        return cls(data.get('project_id'), data.get('folders'), data.get('errors'))
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Module containing the polling engine for long running requests on the Autodesk Forge platform."""
+import asyncio
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+DEFAULT_INITIAL_DELAY = 1.0 # seconds
+DEFAULT_MAX_DELAY = 30.0 # seconds
+DEFAULT_DEADLINE = 900.0 # seconds
+
+
+class Poller():
+    """Repeats requests with exponential backoff and jitter for as long as the Forge API answers with 202 Accepted."""
+
+    def __init__(self, initial_delay=DEFAULT_INITIAL_DELAY, max_delay=DEFAULT_MAX_DELAY, multiplier=2, jitter=0.5,
+                 deadline=DEFAULT_DEADLINE):
+        """
+        Initialize the Poller class with its backoff settings.
+
+        Args:
+            initial_delay (float, optional): Delay in s before the first repetition. Defaults to DEFAULT_INITIAL_DELAY.
+            max_delay (float, optional): Maximum delay in s between two repetitions. Defaults to DEFAULT_MAX_DELAY.
+            multiplier (float, optional): Factor the delay grows with after every repetition. Defaults to 2.
+            jitter (float, optional): Fraction of the delay that is randomised, to spread out concurrent pollers. Defaults to 0.5.
+            deadline (float, optional): Time in s after the first request at which polling is given up. Defaults to DEFAULT_DEADLINE.
+
+        Returns:
+            None.
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+
+    @staticmethod
+    def is_pending(resp):
+        """
+        Check if a response indicates that the requested resource is still being prepared.
+
+        Args:
+            resp (requests.Response): The response to be checked.
+
+        Returns:
+            bool: True if the response has status code 202.
+        """
+        return resp.status_code == 202
+
+    def next_delay(self, attempt, resp=None):
+        """
+        Get the delay before the next repetition of a request.
+
+        Args:
+            attempt (int): Number of repetitions that were already sent.
+            resp (requests.Response, optional): The last response, whose Retry-After header is honoured. Defaults to None.
+
+        Returns:
+            float: The delay in s.
+        """
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** attempt)
+        delay -= random.uniform(0, self.jitter * delay)
+
+        retry_after = self.retry_after(resp)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    @staticmethod
+    def retry_after(resp):
+        """
+        Get the delay requested by the Retry-After header of a response.
+
+        Args:
+            resp (requests.Response): The response, may be None.
+
+        Returns:
+            float: The requested delay in s, or None if the response has no valid Retry-After header.
+        """
+        if resp is None:
+            return None
+
+        value = resp.headers.get('Retry-After')
+
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def poll(self, send, is_pending=None):
+        """
+        Send a request and repeat it with backoff until it is no longer pending.
+
+        Args:
+            send (callable): Function without arguments sending the request and returning the response.
+            is_pending (callable, optional): Function checking if a response is still pending. Defaults to Poller.is_pending.
+
+        Raises:
+            TimeoutError: If the request is still pending when the deadline has passed.
+
+        Returns:
+            requests.Response: The first response that is not pending.
+        """
+        is_pending = self.is_pending if is_pending is None else is_pending
+        started = time.monotonic()
+        attempt = 0
+
+        resp = send()
+
+        while is_pending(resp):
+            delay = self.next_delay(attempt, resp)
+            self._check_deadline(started, delay)
+            resp.close()
+            time.sleep(delay)
+            attempt += 1
+            resp = send()
+
+        return resp
+
+    async def poll_async(self, send, is_pending=None):
+        """
+        Asynchronously send a request and repeat it with backoff until it is no longer pending.
+
+        Args:
+            send (callable): Coroutine function without arguments sending the request and returning the response.
+            is_pending (callable, optional): Function checking if a response is still pending. Defaults to Poller.is_pending.
+
+        Raises:
+            TimeoutError: If the request is still pending when the deadline has passed.
+
+        Returns:
+            AsyncResponse: The first response that is not pending.
+        """
+        is_pending = self.is_pending if is_pending is None else is_pending
+        started = time.monotonic()
+        attempt = 0
+
+        resp = await send()
+
+        while is_pending(resp):
+            delay = self.next_delay(attempt, resp)
+            self._check_deadline(started, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+            resp = await send()
+
+        return resp
+
+    def poll_many(self, sends, max_workers=8, is_pending=None):
+        """
+        Poll many requests at once from a single scheduler.
+
+        All pending requests are kept in one queue ordered by the time of their next repetition, which is sent by a
+        bounded pool of worker threads, so no thread sleeps for an individual request.
+
+        Args:
+            sends (dict): Functions without arguments sending the requests, by key.
+            max_workers (int, optional): Maximum number of requests in flight at the same time. Defaults to 8.
+            is_pending (callable, optional): Function checking if a response is still pending. Defaults to Poller.is_pending.
+
+        Returns:
+            dict: For every key the first response that is not pending, or the exception raised while polling it.
+        """
+        is_pending = self.is_pending if is_pending is None else is_pending
+        results = {}
+        condition = threading.Condition()
+        in_flight = [0]
+        now = time.monotonic()
+        queue = [(now, seq, key, 0, now) for seq, key in enumerate(sends)]
+        counter = [len(queue)]
+
+        def on_done(key, attempt, started, future):
+            with condition:
+                in_flight[0] -= 1
+                try:
+                    resp = future.result()
+                    if is_pending(resp):
+                        delay = self.next_delay(attempt, resp)
+                        self._check_deadline(started, delay)
+                        resp.close()
+                        heapq.heappush(queue, (time.monotonic() + delay, counter[0], key, attempt + 1, started))
+                        counter[0] += 1
+                    else:
+                        results[key] = resp
+                except Exception as e:
+                    results[key] = e
+                condition.notify()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            with condition:
+                while queue or in_flight[0]:
+                    now = time.monotonic()
+
+                    if queue and queue[0][0] <= now and in_flight[0] < max_workers:
+                        due, seq, key, attempt, started = heapq.heappop(queue)
+                        in_flight[0] += 1
+                        future = executor.submit(sends[key])
+                        future.add_done_callback(lambda f, k=key, a=attempt, s=started: on_done(k, a, s, f))
+                        continue
+
+                    timeout = None
+                    if queue and in_flight[0] < max_workers:
+                        timeout = max(queue[0][0] - now, 0)
+                    condition.wait(timeout)
+
+        return results
+
+    def _check_deadline(self, started, delay):
+        """
+        Check if another repetition after the given delay still fits within the deadline.
+
+        Args:
+            started (float): time.monotonic() of the first request.
+            delay (float): Delay in s before the next repetition.
+
+        Raises:
+            TimeoutError: If the repetition would be sent after the deadline.
+
+        Returns:
+            None.
+        """
+        if time.monotonic() + delay - started > self.deadline:
+            raise TimeoutError("Request still pending after {} s.".format(self.deadline))
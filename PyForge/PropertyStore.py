@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+"""Module containing the columnar store for object properties of the Autodesk Forge Model Derivative API."""
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+INT = 'int'
+FLOAT = 'float'
+CODE = 'code'
+OBJECT = 'object'
+
+
+class PropertyColumn():
+    """Sparse column holding the values of a single property for the objects that have it."""
+
+    __slots__ = ('category', 'name', 'kind', 'rows', 'values')
+
+    def __init__(self, category, name):
+        """
+        Initialize the PropertyColumn class for a property.
+
+        The column starts out typed after its first value: integers in an array('q'), floats in an array('d') and other
+        values as codes in an array('i') into the value table of the store. A column receiving a value of another type
+        is converted to codes, a column receiving a value that cannot be interned falls back to a list.
+
+        Args:
+            category (str): Display category of the property.
+            name (str): Display name of the property.
+
+        Returns:
+            None.
+        """
+        self.category = category
+        self.name = name
+        self.kind = None
+        self.rows = array('i')
+        self.values = None
+
+    def __len__(self):
+        """
+        Get the number of objects that have the property.
+
+        Returns:
+            int: The number of values in the column.
+        """
+        return len(self.rows)
+
+
+class PropertyStore():
+    """Columnar store of the object properties of a model view, interning categories, property names and values."""
+
+    def __init__(self):
+        """
+        Initialize an empty PropertyStore.
+
+        Returns:
+            None.
+        """
+        self.objectids = array('q')
+        self.external_ids = []
+        self.names = []
+        self.columns = []
+        self._columns = {}
+        self._rows = {}
+        self._object_columns = array('i')
+        self._offsets = array('q', [0])
+        self._values = []
+        self._codes = {}
+
+    def __len__(self):
+        """
+        Get the number of objects in the store.
+
+        Returns:
+            int: The number of objects.
+        """
+        return len(self.objectids)
+
+    @classmethod
+    def from_collection(cls, collection):
+        """
+        Build a PropertyStore from the collection returned by ModelDerivativeApi.get_object_properties.
+
+        Args:
+            collection (iterable(dict)): The objects, e.g. get_object_properties(...)['collection'] or the objects yielded
+                by ModelDerivativeApi.iter_object_properties.
+
+        Returns:
+            PropertyStore: The store holding all objects.
+        """
+        store = cls()
+        for obj in collection:
+            store.append(obj)
+        return store
+
+    def append(self, obj):
+        """
+        Add an object of the collection to the store.
+
+        Args:
+            obj (dict): Object with objectid, name, externalId and properties as returned by the Forge API.
+
+        Raises:
+            ValueError: If the object has no objectid or an object with the same objectid is already in the store.
+            TypeError: If the objectid is not an int or the properties are not a dict of dicts per category.
+
+        Returns:
+            None.
+        """
+        objectid = obj.get('objectid')
+
+        if objectid is None:
+            raise ValueError("Object has no objectid.")
+
+        if type(objectid) is not int:
+            raise TypeError("Objectid must be an int, not {}.".format(type(objectid).__name__))
+
+        if objectid in self._rows:
+            raise ValueError("Object {} is already in the store.".format(objectid))
+
+        properties = obj.get('properties') or {}
+
+        if not isinstance(properties, dict):
+            raise TypeError("Properties of object {} must be a dict.".format(objectid))
+
+        for category, values in properties.items():
+            if not isinstance(values, dict):
+                raise TypeError("Category {} of object {} must be a dict.".format(category, objectid))
+
+        row = len(self.objectids)
+        self.objectids.append(objectid)
+        self._rows[objectid] = row
+        self.external_ids.append(obj.get('externalId'))
+        self.names.append(obj.get('name'))
+
+        for category, values in properties.items():
+            for name, value in values.items():
+                index = self._columns.get((category, name))
+                if index is None:
+                    index = len(self.columns)
+                    self._columns[(category, name)] = index
+                    self.columns.append(PropertyColumn(category, name))
+                self._append_value(self.columns[index], row, value)
+                self._object_columns.append(index)
+
+        self._offsets.append(len(self._object_columns))
+
+    def categories(self):
+        """
+        Get the display categories of the properties in the store.
+
+        Returns:
+            list(str): The categories, in order of first appearance.
+        """
+        return list(dict.fromkeys(column.category for column in self.columns))
+
+    def get_column(self, category, name):
+        """
+        Get the column of a property.
+
+        Args:
+            category (str): Display category of the property.
+            name (str): Display name of the property.
+
+        Raises:
+            KeyError: If no object has the property.
+
+        Returns:
+            PropertyColumn: The column.
+        """
+        return self.columns[self._columns[(category, name)]]
+
+    def column_values(self, category, name):
+        """
+        Get the values of a property for all objects in the store.
+
+        Args:
+            category (str): Display category of the property.
+            name (str): Display name of the property.
+
+        Raises:
+            KeyError: If no object has the property.
+
+        Returns:
+            list: The value per object in store order, None for objects without the property.
+        """
+        column = self.get_column(category, name)
+        values = [None] * len(self.objectids)
+        for row, value in zip(column.rows, self._decode(column)):
+            values[row] = value
+        return values
+
+    def to_numpy(self, category, name):
+        """
+        Get the values of a property as a NumPy array with a null mask.
+
+        Integer and float columns give a typed array, other columns an object array.
+
+        Args:
+            category (str): Display category of the property.
+            name (str): Display name of the property.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            KeyError: If no object has the property.
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray): The value per object in store order, and a boolean mask that is True
+            for the objects without the property.
+        """
+        if numpy is None:
+            raise ImportError("PropertyStore.to_numpy requires numpy to be installed.")
+
+        column = self.get_column(category, name)
+        rows = numpy.frombuffer(column.rows, dtype=numpy.int32)
+        mask = numpy.ones(len(self.objectids), dtype=bool)
+        mask[rows] = False
+
+        if column.kind == INT:
+            values = numpy.zeros(len(self.objectids), dtype=numpy.int64)
+            values[rows] = numpy.frombuffer(column.values, dtype=numpy.int64)
+        elif column.kind == FLOAT:
+            values = numpy.full(len(self.objectids), numpy.nan)
+            values[rows] = numpy.frombuffer(column.values, dtype=numpy.float64)
+        else:
+            values = numpy.empty(len(self.objectids), dtype=object)
+            for row, value in zip(column.rows, self._decode(column)):
+                values[row] = value
+
+        return values, mask
+
+    def find(self, category, name, value):
+        """
+        Find the objects whose property has the given value.
+
+        Args:
+            category (str): Display category of the property.
+            name (str): Display name of the property.
+            value: The value to look for.
+
+        Returns:
+            list(int): The objectids of the matching objects, in store order.
+        """
+        index = self._columns.get((category, name))
+
+        if index is None:
+            return []
+
+        column = self.columns[index]
+
+        if column.kind == CODE:
+            code = self._codes.get(self._intern_key(value))
+            if code is None:
+                return []
+            target, values = code, column.values
+        elif column.kind in [INT, FLOAT] and type(value) is (int if column.kind == INT else float):
+            target, values = value, column.values
+        elif column.kind == OBJECT:
+            target, values = value, column.values
+        else:
+            return []
+
+        if numpy is not None and column.kind != OBJECT:
+            matches = numpy.flatnonzero(numpy.frombuffer(values, dtype=self._dtype(values)) == target)
+            return [self.objectids[column.rows[i]] for i in matches]
+
+        return [self.objectids[row] for row, v in zip(column.rows, values) if self._same_value(v, target)]
+
+    def get_object(self, objectid):
+        """
+        Get a single object in the shape returned by the Forge API.
+
+        Args:
+            objectid (int): The objectid of the object.
+
+        Raises:
+            KeyError: If the object is not in the store.
+
+        Returns:
+            dict: The object with objectid, name, externalId and properties.
+        """
+        return self._build_object(self._rows[objectid])
+
+    def to_collection(self):
+        """
+        Convert the store back to the collection shape returned by ModelDerivativeApi.get_object_properties.
+
+        Categories without any property are not stored and therefore not restored.
+
+        Returns:
+            list(dict): The objects with objectid, name, externalId and properties.
+        """
+        decoded = [list(zip(column.rows, self._decode(column))) for column in self.columns]
+        positions = [0] * len(self.columns)
+        collection = []
+
+        for row in range(len(self.objectids)):
+            properties = {}
+            for index in self._object_columns[self._offsets[row]:self._offsets[row + 1]]:
+                column = self.columns[index]
+                value = decoded[index][positions[index]][1]
+                positions[index] += 1
+                properties.setdefault(column.category, {})[column.name] = value
+            collection.append(self._make_object(row, properties))
+
+        return collection
+
+    def nbytes(self):
+        """
+        Estimate the memory used by the arrays of the store, excluding the interned strings.
+
+        Returns:
+            int: The size in bytes.
+        """
+        size = self.objectids.itemsize * len(self.objectids)
+        size += self._object_columns.itemsize * len(self._object_columns)
+        size += self._offsets.itemsize * len(self._offsets)
+        for column in self.columns:
+            size += column.rows.itemsize * len(column.rows)
+            if isinstance(column.values, array):
+                size += column.values.itemsize * len(column.values)
+        return size
+
+    def _append_value(self, column, row, value):
+        """
+        Append a value to a column, converting the column if the value does not fit its current type.
+
+        Args:
+            column (PropertyColumn): The column.
+            row (int): Row of the object in the store.
+            value: The value.
+
+        Returns:
+            None.
+        """
+        if column.kind is None:
+            if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+                column.kind, column.values = INT, array('q')
+            elif type(value) is float:
+                column.kind, column.values = FLOAT, array('d')
+            elif self._is_internable(value):
+                column.kind, column.values = CODE, array('i')
+            else:
+                column.kind, column.values = OBJECT, []
+
+        if column.kind == INT and not (type(value) is int and -2 ** 63 <= value < 2 ** 63):
+            self._convert(column)
+        elif column.kind == FLOAT and type(value) is not float:
+            self._convert(column)
+
+        if column.kind == CODE and not self._is_internable(value):
+            column.values = self._decode(column)
+            column.kind = OBJECT
+
+        if column.kind == CODE:
+            column.values.append(self._intern(value))
+        else:
+            column.values.append(value)
+
+        column.rows.append(row)
+
+    def _convert(self, column):
+        """
+        Convert an integer or float column to codes.
+
+        Args:
+            column (PropertyColumn): The column.
+
+        Returns:
+            None.
+        """
+        column.values = array('i', [self._intern(value) for value in column.values])
+        column.kind = CODE
+
+    def _decode(self, column):
+        """
+        Get the values of a column as Python objects.
+
+        Args:
+            column (PropertyColumn): The column.
+
+        Returns:
+            list: The values, in the order of column.rows.
+        """
+        if column.kind == CODE:
+            values = self._values
+            return [values[code] for code in column.values]
+        return list(column.values)
+
+    @staticmethod
+    def _is_internable(value):
+        """
+        Check if a value can be stored in the value table.
+
+        Args:
+            value: The value.
+
+        Returns:
+            bool: True if the value is hashable.
+        """
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    @staticmethod
+    def _intern_key(value):
+        """
+        Get the key of a value in the value table, keeping values of different types such as 1, 1.0 and True apart, also
+        inside tuples and frozensets.
+
+        Args:
+            value: The value.
+
+        Returns:
+            tuple: The key.
+        """
+        if type(value) in (tuple, frozenset):
+            return (type(value), type(value)(PropertyStore._intern_key(item) for item in value))
+        return (type(value), value)
+
+    @staticmethod
+    def _same_value(a, b):
+        """
+        Compare two values of an object column, keeping values of different types such as 1, 1.0 and True apart, also
+        inside lists, tuples and dicts.
+
+        Args:
+            a: The first value.
+            b: The second value.
+
+        Returns:
+            bool: True if the values are equal and of the same types.
+        """
+        if type(a) is not type(b):
+            return False
+        if isinstance(a, (list, tuple)):
+            return len(a) == len(b) and all(PropertyStore._same_value(x, y) for x, y in zip(a, b))
+        if isinstance(a, dict):
+            return a.keys() == b.keys() and all(PropertyStore._same_value(value, b[key]) for key, value in a.items())
+        return a == b
+
+    def _intern(self, value):
+        """
+        Get the code of a value in the value table, adding the value if it is new.
+
+        Args:
+            value: The value.
+
+        Returns:
+            int: The code.
+        """
+        key = self._intern_key(value)
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self._values)
+            self._codes[key] = code
+            self._values.append(value)
+        return code
+
+    @staticmethod
+    def _dtype(values):
+        """
+        Get the NumPy dtype matching an array.
+
+        Args:
+            values (array.array): The array.
+
+        Returns:
+            numpy.dtype: The dtype.
+        """
+        return {'q' : numpy.int64, 'd' : numpy.float64, 'i' : numpy.int32}[values.typecode]
+
+    def _build_object(self, row):
+        """
+        Build a single object from its row.
+
+        Args:
+            row (int): Row of the object in the store.
+
+        Returns:
+            dict: The object.
+        """
+        properties = {}
+        for index in self._object_columns[self._offsets[row]:self._offsets[row + 1]]:
+            column = self.columns[index]
+            position = bisect_left(column.rows, row)
+            value = column.values[position]
+            if column.kind == CODE:
+                value = self._values[value]
+            properties.setdefault(column.category, {})[column.name] = value
+        return self._make_object(row, properties)
+
+    def _make_object(self, row, properties):
+        """
+        Assemble an object in the shape returned by the Forge API.
+
+        Args:
+            row (int): Row of the object in the store.
+            properties (dict): The properties by category.
+
+        Returns:
+            dict: The object.
+        """
+        return {'objectid' : self.objectids[row],
+                'name' : self.names[row],
+                'externalId' : self.external_ids[row],
+                'properties' : properties}
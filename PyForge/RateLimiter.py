@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Module containing the client side rate limiter for the PyForge package."""
+import asyncio
+import threading
+import time
+from PyForge.Endpoints import endpoint_family
+
+# Conservative requests per second and burst size per endpoint family. These are not published Autodesk Forge quotas,
+# which differ per endpoint and per app; adjust them with RateLimiter.set_limit to the quotas of your app.
+DEFAULT_LIMITS = {'data/v1' : (5.0, 50),
+                  'project/v1' : (5.0, 50),
+                  'modelderivative' : (2.0, 20),
+                  'hq' : (10.0, 100),
+                  'bim360/admin' : (5.0, 50),
+                  'bim360/docs' : (5.0, 50)}
+
+
+class TokenBucket():
+    """Thread-safe token bucket handing out reservations, so callers can wait with time.sleep or asyncio.sleep alike."""
+
+    def __init__(self, rate, burst=None):
+        """
+        Initialize the TokenBucket class with a full bucket.
+
+        Args:
+            rate (float): Number of tokens added per second.
+            burst (int, optional): Maximum number of tokens in the bucket. Defaults to None, in which case it is max(rate, 1).
+
+        Raises:
+            ValueError: If the rate or burst is not positive.
+
+        Returns:
+            None.
+        """
+        burst = max(rate, 1) if burst is None else burst
+
+        if rate <= 0 or burst <= 0:
+            raise ValueError("Rate and burst of a token bucket must be positive.")
+
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens from the bucket, going into debt if there are not enough.
+
+        Args:
+            tokens (float, optional): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: Time in s the caller has to wait before using the tokens.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - tokens
+            self._updated = now
+            return max(-self._tokens / self.rate, 0.0)
+
+
+class RateLimiter():
+    """Thread- and asyncio-safe rate limiter with a token bucket per Autodesk Forge endpoint family."""
+
+    def __init__(self, limits=None, default_limit=None):
+        """
+        Initialize the RateLimiter class with the limits per endpoint family.
+
+        Args:
+            limits (dict(str, tuple(float, int)), optional): Requests per second and burst size per endpoint family, see
+                PyForge.Endpoints.endpoint_family. Defaults to None, in which case DEFAULT_LIMITS is used.
+            default_limit (tuple(float, int), optional): Requests per second and burst size for the families without a limit
+                of their own. Defaults to None, in which case those families are not limited.
+
+        Returns:
+            None.
+        """
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.default_limit = default_limit
+        self._buckets = {}
+        self._waits = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, family, rate, burst=None):
+        """
+        Set the limit of an endpoint family, replacing its bucket.
+
+        Args:
+            family (str): The endpoint family, e.g. 'modelderivative'.
+            rate (float): Requests per second, None to remove the limit.
+            burst (int, optional): Maximum number of requests sent at once. Defaults to None, in which case it is max(rate, 1).
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            if rate is None:
+                self.limits.pop(family, None)
+            else:
+                self.limits[family] = (rate, burst)
+            self._buckets.pop(family, None)
+
+    def reserve(self, url):
+        """
+        Reserve a request to the given url.
+
+        Args:
+            url (str): Url of the request.
+
+        Returns:
+            float: Time in s the caller has to wait before sending the request.
+        """
+        family = endpoint_family(url)
+        bucket = self._buckets.get(family)
+
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    limit = self.limits.get(family, self.default_limit)
+                    bucket = TokenBucket(*limit) if limit is not None else False
+                    self._buckets[family] = bucket
+
+        if bucket is False:
+            return 0.0
+
+        delay = bucket.reserve()
+
+        if delay > 0:
+            with self._lock:
+                count, total = self._waits.get(family, (0, 0.0))
+                self._waits[family] = (count + 1, total + delay)
+
+        return delay
+
+    def acquire(self, url):
+        """
+        Wait until a request to the given url may be sent.
+
+        Args:
+            url (str): Url of the request.
+
+        Returns:
+            float: Time in s that was waited.
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url):
+        """
+        Asynchronously wait until a request to the given url may be sent.
+
+        Args:
+            url (str): Url of the request.
+
+        Returns:
+            float: Time in s that was waited.
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self):
+        """
+        Get the number of requests that had to wait and the total time waited, per endpoint family.
+
+        Returns:
+            dict(str, dict): Per family the number of waits and the waited time in s.
+        """
+        with self._lock:
+            return {family : {'waits' : count, 'waited' : total} for family, (count, total) in self._waits.items()}
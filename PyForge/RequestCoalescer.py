@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Module containing the single-flight coalescing of identical concurrent requests for the PyForge package."""
+import copy
+import hashlib
+import threading
+from concurrent.futures import Future
+
+
+class RequestCoalescer():
+    """Thread-safe merging of identical concurrent GET requests into a single request whose response every caller gets."""
+
+    def __init__(self):
+        """
+        Initialize the RequestCoalescer class without requests in flight.
+
+        Returns:
+            None.
+        """
+        self.leaders = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(request):
+        """
+        Get the key of a request, equal for requests with the same url, query parameters and headers.
+
+        The headers, including the authorization header, are hashed so requests for different authorization scopes are
+        never merged and no token is kept in the key.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+
+        Returns:
+            tuple(str, str, str): The method, the url including the query string and the hash of the headers.
+        """
+        headers = sorted((name.lower(), value) for name, value in request.headers.items())
+        digest = hashlib.sha256(repr(headers).encode('utf8')).hexdigest()
+        return (request.method, request.url, digest)
+
+    def send(self, send, request, **kwargs):
+        """
+        Send a request, or wait for an identical request that is already in flight and share its response.
+
+        Args:
+            send (callable): Function sending a prepared request, e.g. requests.Session.send.
+            request (requests.PreparedRequest): The request, its response must be read up front.
+            kwargs: Keyword arguments passed on to the send function.
+
+        Raises:
+            Exception: The exception raised while sending the request, for the caller that sent it and all waiters.
+
+        Returns:
+            requests.Response: The response, a copy of it for the callers that waited.
+        """
+        key = self.make_key(request)
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return self.copy_response(future.result(), request)
+
+        try:
+            resp = send(request, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(resp)
+            return resp
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def stats(self):
+        """
+        Get the counters of the coalescer.
+
+        Returns:
+            dict: The number of requests that were sent, that were merged into another request and that are in flight.
+        """
+        with self._lock:
+            return {'sent' : self.leaders, 'coalesced' : self.coalesced, 'in_flight' : len(self._in_flight)}
+
+    @staticmethod
+    def copy_response(resp, request):
+        """
+        Copy a fully read response for another caller, so callers cannot change each other's response.
+
+        Args:
+            resp (requests.Response): The response of the request that was sent.
+            request (requests.PreparedRequest): The request of the caller receiving the copy.
+
+        Returns:
+            requests.Response: The copy.
+        """
+        copied = copy.copy(resp)
+        copied.headers = resp.headers.copy()
+        copied.history = list(resp.history)
+        copied.request = request
+        copied.raw = None
+        return copied
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Module containing the request instrumentation for the PyForge package."""
+import threading
+from bisect import bisect_left
+from PyForge.Endpoints import endpoint_template
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0) # seconds
+
+
+class EndpointMetrics():
+    """Counters and latency histogram of the requests to a single endpoint template."""
+
+    __slots__ = ('requests', 'errors', 'status', 'retries', 'bytes', 'cache_hits', 'latency_sum', 'latency_buckets')
+
+    def __init__(self, buckets):
+        """
+        Initialize the EndpointMetrics class with empty counters.
+
+        Args:
+            buckets (tuple(float)): Upper bounds of the latency histogram buckets in s.
+
+        Returns:
+            None.
+        """
+        self.requests = 0
+        self.errors = 0
+        self.status = {}
+        self.retries = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(buckets) + 1)
+
+
+class RequestMetrics():
+    """Thread-safe per endpoint template request counts, status classes, retries, response bytes and latency histograms."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Initialize the RequestMetrics class with the latency histogram buckets.
+
+        Args:
+            buckets (tuple(float), optional): Upper bounds of the latency histogram buckets in s, in increasing order.
+                Defaults to DEFAULT_BUCKETS.
+
+        Returns:
+            None.
+        """
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status_code=None, elapsed=0.0, retries=0, nbytes=0, from_cache=False):
+        """
+        Record a finished request.
+
+        Args:
+            method (str): HTTP method of the request.
+            url (str): Url of the request, grouped by its endpoint template.
+            status_code (int, optional): Status code of the response, None if no response was received. Defaults to None.
+            elapsed (float, optional): Time in s from sending the request until the response was received. Defaults to 0.0.
+            retries (int, optional): Number of retries urllib3 made for the request. Defaults to 0.
+            nbytes (int, optional): Size of the response body. Defaults to 0.
+            from_cache (bool, optional): The response was served from a cache. Defaults to False.
+
+        Returns:
+            None.
+        """
+        key = (method, endpoint_template(url))
+        bucket = bisect_left(self.buckets, elapsed)
+        status = "{}xx".format(status_code // 100) if status_code is not None else None
+
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics(self.buckets)
+
+            metrics.requests += 1
+            if status is None:
+                metrics.errors += 1
+            else:
+                metrics.status[status] = metrics.status.get(status, 0) + 1
+            metrics.retries += retries
+            metrics.bytes += nbytes
+            metrics.cache_hits += from_cache
+            metrics.latency_sum += elapsed
+            metrics.latency_buckets[bucket] += 1
+
+    def record_response(self, request, resp, elapsed):
+        """
+        Record a request from its requests.Response.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            resp (requests.Response): The response, None if no response was received.
+            elapsed (float): Time in s from sending the request until the response was received.
+
+        Returns:
+            None.
+        """
+        if resp is None:
+            self.record(request.method, request.url, elapsed=elapsed)
+            return
+
+        retries = 0
+        retry = getattr(resp.raw, 'retries', None)
+        if retry is not None:
+            retries = len(retry.history)
+
+        if resp._content_consumed and isinstance(resp._content, bytes):
+            nbytes = len(resp._content)
+        else:
+            nbytes = int(resp.headers.get('Content-Length', 0) or 0)
+
+        self.record(request.method, request.url, resp.status_code, elapsed, retries, nbytes,
+                    getattr(resp, 'from_cache', False))
+
+    def reset(self):
+        """
+        Drop all recorded metrics.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """
+        Get a copy of the recorded metrics.
+
+        Returns:
+            dict(str, dict): Per 'METHOD template' the number of requests, requests without response (errors), responses per
+            status class, urllib3 retries, response bytes and cache hits, and the latency histogram with cumulative bucket
+            counts by upper bound, the total latency and the count.
+        """
+        snapshot = {}
+
+        with self._lock:
+            for (method, template), metrics in self._endpoints.items():
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(self.buckets + (float('inf'),), metrics.latency_buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+
+                snapshot["{} {}".format(method, template)] = {
+                    'method' : method,
+                    'endpoint' : template,
+                    'requests' : metrics.requests,
+                    'errors' : metrics.errors,
+                    'status' : dict(metrics.status),
+                    'retries' : metrics.retries,
+                    'bytes' : metrics.bytes,
+                    'cache_hits' : metrics.cache_hits,
+                    'latency' : {'buckets' : buckets, 'sum' : metrics.latency_sum, 'count' : metrics.requests}}
+
+        return snapshot
+
+    def to_prometheus(self, prefix='pyforge'):
+        """
+        Export the recorded metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names. Defaults to 'pyforge'.
+
+        Returns:
+            str: The metrics.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def header(name, kind, text):
+            lines.append("# HELP {}_{} {}".format(prefix, name, text))
+            lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+
+        def labels(entry, **extra):
+            pairs = [('method', entry['method']), ('endpoint', entry['endpoint'])] + list(extra.items())
+            return ','.join('{}="{}"'.format(name, self._escape(value)) for name, value in pairs)
+
+        header('requests_total', 'counter', "Requests sent, by status class of the response.")
+        for entry in snapshot.values():
+            for status, count in sorted(entry['status'].items()):
+                lines.append("{}_requests_total{{{}}} {}".format(prefix, labels(entry, status=status), count))
+            if entry['errors']:
+                lines.append("{}_requests_total{{{}}} {}".format(prefix, labels(entry, status='error'), entry['errors']))
+
+        for name, field, text in [('request_retries_total', 'retries', "Retries made by urllib3."),
+                                  ('response_bytes_total', 'bytes', "Bytes in response bodies."),
+                                  ('cache_hits_total', 'cache_hits', "Responses served from a cache.")]:
+            header(name, 'counter', text)
+            for entry in snapshot.values():
+                lines.append("{}_{}{{{}}} {}".format(prefix, name, labels(entry), entry[field]))
+
+        header('request_duration_seconds', 'histogram', "Time from sending a request until its response was received.")
+        for entry in snapshot.values():
+            for bound, count in entry['latency']['buckets'].items():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append("{}_request_duration_seconds_bucket{{{}}} {}".format(prefix, labels(entry, le=le), count))
+            lines.append("{}_request_duration_seconds_sum{{{}}} {}".format(prefix, labels(entry), entry['latency']['sum']))
+            lines.append("{}_request_duration_seconds_count{{{}}} {}".format(prefix, labels(entry), entry['latency']['count']))
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _escape(value):
+        """
+        Escape a Prometheus label value.
+
+        Args:
+            value (str): The label value.
+
+        Returns:
+            str: The escaped value.
+        """
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Module containing the in-memory http response cache for the PyForge package."""
+import threading
+import time
+from collections import OrderedDict
+from PyForge.Endpoints import endpoint_template
+from PyForge.RequestCoalescer import RequestCoalescer
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Time to live in seconds per endpoint template for lookups that rarely change.
+DEFAULT_TTLS = {'/project/v1/hubs' : 300.0,
+                '/project/v1/hubs/:id/projects' : 300.0,
+                '/data/v1/projects/:id/folders/:id' : 60.0,
+                '/hq/v1/accounts/:id/business_units_structure' : 600.0}
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ResponseCache():
+    """Thread-safe in-memory cache of GET responses with a time to live per endpoint template and LRU eviction."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttls=None, default_ttl=0):
+        """
+        Initialize the ResponseCache class with the times to live per endpoint template.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached responses. Defaults to DEFAULT_MAX_ENTRIES.
+            ttls (dict(str, float), optional): Time to live in s per endpoint template, see
+                PyForge.Endpoints.endpoint_template. A key also matches templates ending with it.
+                Defaults to None, in which case DEFAULT_TTLS is used.
+            default_ttl (float, optional): Time to live in s for the other endpoints, 0 to not cache them. Defaults to 0.
+
+        Raises:
+            ValueError: If max_entries is smaller than 1.
+
+        Returns:
+            None.
+        """
+        if max_entries < 1:
+            raise ValueError("Maximum number of entries must be at least 1.")
+
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._resolved = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def get_ttl(self, url):
+        """
+        Get the time to live of responses for the given url.
+
+        Args:
+            url (str): Url of the request.
+
+        Returns:
+            float: The time to live in s, 0 if responses for the url are not cached.
+        """
+        template = endpoint_template(url)
+        ttl = self._resolved.get(template)
+
+        if ttl is None:
+            matches = [key for key in self.ttls if template == key or template.endswith(key)]
+            ttl = self.ttls[max(matches, key=len)] if matches else self.default_ttl
+            self._resolved[template] = ttl
+
+        return ttl
+
+    def send(self, send, request, **kwargs):
+        """
+        Answer a GET request from the cache, or send it using the given send function and cache the response.
+
+        Args:
+            send (callable): Function sending a prepared request, e.g. requests.Session.send.
+            request (requests.PreparedRequest): The GET request, its response must be read up front.
+            kwargs: Keyword arguments passed on to the send function.
+
+        Returns:
+            requests.Response: The response, a copy with from_cache set to True if it was served from the cache.
+        """
+        ttl = self.get_ttl(request.url)
+
+        if not ttl:
+            return send(request, **kwargs)
+
+        key = RequestCoalescer.make_key(request)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                resp = RequestCoalescer.copy_response(entry[1], request)
+                resp.from_cache = True
+                return resp
+            self.misses += 1
+
+        resp = send(request, **kwargs)
+
+        if resp.status_code == 200:
+            with self._lock:
+                self._entries[key] = (time.monotonic() + ttl, resp)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            resp = RequestCoalescer.copy_response(resp, request)
+
+        return resp
+
+    def invalidate(self, prefix=''):
+        """
+        Remove the cached responses for urls starting with the given prefix.
+
+        Args:
+            prefix (str, optional): Prefix of the urls, e.g. 'https://developer.api.autodesk.com/data/v1/projects/b.abc'.
+                Defaults to '', which clears the cache.
+
+        Returns:
+            int: Number of removed responses.
+        """
+        return self._invalidate(lambda url: url.startswith(prefix))
+
+    def invalidate_containing(self, text):
+        """
+        Remove the cached responses for urls containing the given text, e.g. a project or folder id.
+
+        Args:
+            text (str): Text the urls contain.
+
+        Returns:
+            int: Number of removed responses.
+        """
+        return self._invalidate(lambda url: text in url)
+
+    def invalidate_for(self, request):
+        """
+        Remove the cached responses a request with an unsafe method may have made stale.
+
+        These are the responses for the url of the request, its descendants, the resource the url belongs to and, for a
+        custom method such as .../folders/:id/permissions:batch-update, the collection it acts on, so the POST invalidates
+        both the cached folder and its cached permissions.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+
+        Returns:
+            int: Number of removed responses.
+        """
+        if request.method in SAFE_METHODS:
+            return 0
+
+        url = request.url.split('?', 1)[0]
+        parent, name = url.rsplit('/', 1)
+        collection = parent + '/' + name.split(':', 1)[0]
+
+        return self._invalidate(lambda cached: cached.split('?', 1)[0] in (url, parent, collection)
+                                or cached.startswith(url + '/') or cached.startswith(url + '?'))
+
+    def add_invalidation_hook(self, hook):
+        """
+        Register a function called with the urls of the removed responses after every invalidation.
+
+        Args:
+            hook (callable): Function taking a list of urls.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def stats(self):
+        """
+        Get the counters of the cache.
+
+        Returns:
+            dict: The number of entries, hits, misses, evictions and invalidated responses.
+        """
+        with self._lock:
+            return {'entries' : len(self._entries), 'hits' : self.hits, 'misses' : self.misses,
+                    'evictions' : self.evictions, 'invalidations' : self.invalidations}
+
+    def _invalidate(self, matches):
+        """
+        Remove the cached responses whose url matches and call the invalidation hooks.
+
+        Args:
+            matches (callable): Function taking the url of a cached response and returning True if it is to be removed.
+
+        Returns:
+            int: Number of removed responses.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if matches(key[1])]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            hooks = list(self._hooks)
+
+        urls = [key[1] for key in keys]
+
+        if urls:
+            for hook in hooks:
+                hook(urls)
+
+        return len(urls)
@@ -1,8 +1,18 @@
 # -*- coding: utf-8 -*-
 """Module containing the timeout http adapter for the PyForge package."""
+import threading
+from collections import deque
 from requests.adapters import HTTPAdapter
+from PyForge.Endpoints import endpoint_template
 
 DEFAULT_TIMEOUT = 0.5 # seconds
+DEFAULT_MAX_READ_TIMEOUT = 300.0 # seconds
+DEFAULT_BYTES_PER_SECOND = 1048576.0
+
+# (connect, read) timeouts in seconds for endpoints whose responses are generated on request and can take long.
+DEFAULT_TEMPLATE_TIMEOUTS = {'/metadata/:id' : (3.05, 60.0),
+                             '/metadata/:id/properties' : (3.05, 120.0),
+                             '/manifest/:id' : (3.05, 60.0)}
 
 class TimeoutHttpAdapter(HTTPAdapter):
     """Implementation of the HTTPAdapter class implementing default timeouts."""
@@ -37,3 +47,138 @@ class TimeoutHttpAdapter(HTTPAdapter):
         if timeout is None:
             kwargs["timeout"] = self.timeout
         return super().send(request, **kwargs)
+
+
+class TimeoutPolicy():
+    """Thread-safe connect and read timeouts per endpoint template, optionally adapted to the observed latencies."""
+
+    def __init__(self, connect=DEFAULT_TIMEOUT, read=DEFAULT_TIMEOUT, templates=None, adaptive=False, percentile=0.99,
+                 multiplier=3.0, min_read=DEFAULT_TIMEOUT, max_read=DEFAULT_MAX_READ_TIMEOUT, min_samples=20,
+                 window=200, bytes_per_second=DEFAULT_BYTES_PER_SECOND):
+        """
+        Initialize the TimeoutPolicy class with the default timeouts and the timeouts per endpoint template.
+
+        In adaptive mode the read timeout of an endpoint template is derived from the latencies observed for it, once there
+        are enough of them: the given percentile of the latencies times the multiplier, plus the time needed to transfer
+        the size hint of the request, if any, limited to [min_read, max_read]. An adapted read timeout never drops below the
+        configured read timeout of the endpoint template, so it only extends the timeouts of slow endpoints.
+
+        Args:
+            connect (float, optional): Default connect timeout in s. Defaults to DEFAULT_TIMEOUT.
+            read (float, optional): Default read timeout in s. Defaults to DEFAULT_TIMEOUT.
+            templates (dict(str, tuple(float, float)), optional): (connect, read) timeouts per endpoint template, see
+                PyForge.Endpoints.endpoint_template. A key also matches templates ending with it, e.g.
+                '/metadata/:id/properties'. Defaults to None, in which case DEFAULT_TEMPLATE_TIMEOUTS is used.
+            adaptive (bool, optional): Derive the read timeouts from the observed latencies. Defaults to False.
+            percentile (float, optional): Percentile of the observed latencies used in adaptive mode. Defaults to 0.99.
+            multiplier (float, optional): Factor applied to the percentile in adaptive mode. Defaults to 3.0.
+            min_read (float, optional): Lower bound of adaptive read timeouts in s. Defaults to DEFAULT_TIMEOUT.
+            max_read (float, optional): Upper bound of adaptive read timeouts in s. Defaults to DEFAULT_MAX_READ_TIMEOUT.
+            min_samples (int, optional): Number of observed latencies needed before a read timeout is adapted. Defaults to 20.
+            window (int, optional): Number of most recent latencies kept per endpoint template. Defaults to 200.
+            bytes_per_second (float, optional): Assumed minimum transfer rate for size hints. Defaults to DEFAULT_BYTES_PER_SECOND.
+
+        Returns:
+            None.
+        """
+        self.connect = connect
+        self.read = read
+        self.templates = dict(DEFAULT_TEMPLATE_TIMEOUTS if templates is None else templates)
+        self.adaptive = adaptive
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_read = min_read
+        self.max_read = max_read
+        self.min_samples = min_samples
+        self.window = window
+        self.bytes_per_second = bytes_per_second
+        self._resolved = {}
+        self._latencies = {}
+        self._adapted = {}
+        self._lock = threading.Lock()
+
+    def get_timeout(self, url, size_hint=None):
+        """
+        Get the timeouts for a request to the given url.
+
+        Args:
+            url (str): Url of the request.
+            size_hint (int, optional): Expected size of the response in bytes. Defaults to None.
+
+        Returns:
+            tuple(float, float): The connect and read timeouts in s.
+        """
+        template = endpoint_template(url)
+        connect, read = self._resolve(template)
+
+        if self.adaptive:
+            adapted = self._adapted.get(template)
+            if adapted is not None:
+                read = max(read, adapted)
+
+        if size_hint:
+            read += size_hint / self.bytes_per_second
+            if self.adaptive:
+                read = min(read, self.max_read)
+
+        return connect, read
+
+    def observe(self, url, elapsed):
+        """
+        Record the latency of a request, used to adapt the read timeout of its endpoint template in adaptive mode.
+
+        Args:
+            url (str): Url of the request.
+            elapsed (float): Time in s from sending the request until the response was received.
+
+        Returns:
+            None.
+        """
+        if not self.adaptive:
+            return
+
+        template = endpoint_template(url)
+
+        with self._lock:
+            latencies = self._latencies.get(template)
+            if latencies is None:
+                latencies = self._latencies[template] = deque(maxlen=self.window)
+            latencies.append(elapsed)
+
+            if len(latencies) >= self.min_samples:
+                ordered = sorted(latencies)
+                value = ordered[min(int(self.percentile * len(ordered)), len(ordered) - 1)]
+                self._adapted[template] = min(max(value * self.multiplier, self.min_read), self.max_read)
+
+    def stats(self):
+        """
+        Get the adapted read timeouts.
+
+        Returns:
+            dict(str, dict): Per endpoint template the number of observed latencies and the adapted read timeout in s.
+        """
+        with self._lock:
+            return {template : {'samples' : len(latencies), 'read' : self._adapted.get(template)}
+                    for template, latencies in self._latencies.items()}
+
+    def _resolve(self, template):
+        """
+        Get the configured timeouts of an endpoint template.
+
+        Args:
+            template (str): The endpoint template.
+
+        Returns:
+            tuple(float, float): The connect and read timeouts in s.
+        """
+        timeouts = self._resolved.get(template)
+
+        if timeouts is None:
+            matches = [key for key in self.templates if template == key or template.endswith(key)]
+            if matches:
+                timeouts = self.templates[max(matches, key=len)]
+            else:
+                timeouts = (self.connect, self.read)
+            self._resolved[template] = timeouts
+
+        return timeouts
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Module containing the cached authentication token provider for the PyForge package."""
+import threading
+import time
+import requests
+from requests.auth import AuthBase
+
+DEFAULT_REFRESH_MARGIN = 60 # seconds
+
+
+class TokenProvider(AuthBase):
+    """Thread-safe cache of an Autodesk Forge access token, refreshing it before it expires and after a 401 response."""
+
+    def __init__(self, negotiator, legs=2, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        """
+        Initialize the TokenProvider class with the negotiator used to obtain new tokens.
+
+        Args:
+            negotiator (OAuth2Negotiator): Negotiator used to obtain access tokens from the Forge authentication server.
+            legs (int, optional): Indicates if 2- or 3-legged authentication is used. Defaults to 2.
+            refresh_margin (float, optional): Time in s before the token expires at which it is refreshed.
+                Defaults to DEFAULT_REFRESH_MARGIN.
+
+        Returns:
+            None.
+        """
+        self.negotiator = negotiator
+        self.legs = legs
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """
+        Get the cached access token, so the provider can be used wherever a token string is formatted.
+
+        A token is only obtained here if none is cached yet, refreshing is left to the authentication of the request.
+
+        Returns:
+            str: Autodesk Forge access token.
+        """
+        token = self._token
+        if token is None:
+            token = self.get_token()
+        return token
+
+    def __call__(self, r):
+        """
+        Attach the current access token to a prepared request and register the 401 replay hook.
+
+        Args:
+            r (requests.PreparedRequest): The request to be authenticated.
+
+        Returns:
+            requests.PreparedRequest: The authenticated request.
+        """
+        r.headers['Authorization'] = "Bearer {}".format(self.get_token())
+        r.register_hook('response', self.handle_401)
+        return r
+
+    def get_token(self):
+        """
+        Get a valid access token, refreshing it when it is about to expire.
+
+        Only one caller refreshes the token at a time. While a token that has not yet expired is being refreshed
+        other callers keep using it, once it has expired they wait for the refresh to finish.
+
+        Raises:
+            ConnectionError: If no token could be obtained and no valid token is cached.
+
+        Returns:
+            str: Autodesk Forge access token.
+        """
+        token = self._token
+        now = time.monotonic()
+
+        if token is not None and now < self._refresh_at:
+            return token
+
+        if token is not None and now < self._expires_at:
+            if not self._lock.acquire(blocking=False):
+                return token
+            try:
+                if self._is_fresh():
+                    return self._token
+                return self._refresh()
+            except (ConnectionError, requests.RequestException):
+                return token
+            finally:
+                self._lock.release()
+
+        with self._lock:
+            if self._is_fresh():
+                return self._token
+            return self._refresh()
+
+    def renew_token(self, stale_token=None):
+        """
+        Replace a token that was rejected by the Forge API, unless another caller already did so.
+
+        Args:
+            stale_token (str, optional): The rejected token. The cached token is always renewed if None. Defaults to None.
+
+        Returns:
+            str: Autodesk Forge access token.
+        """
+        with self._lock:
+            if stale_token is not None and self._token is not None and self._token != stale_token:
+                return self._token
+            return self._refresh()
+
+    def invalidate(self):
+        """
+        Drop the cached token so the next caller obtains a new one.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+            self._refresh_at = 0.0
+
+    def handle_401(self, r, **kwargs):
+        """
+        Response hook replaying a request once with a renewed token if it was rejected with a 401.
+
+        Args:
+            r (requests.Response): The response to the request.
+            kwargs: The keyword arguments the request was sent with.
+
+        Returns:
+            requests.Response: The original response, or the response to the replayed request.
+        """
+        if r.status_code != 401 or getattr(r.request, 'token_replayed', False):
+            return r
+
+        stale_token = r.request.headers.get('Authorization', '')[len('Bearer '):]
+        token = self.renew_token(stale_token)
+
+        r.content
+        r.close()
+
+        prep = r.request.copy()
+        prep.headers['Authorization'] = "Bearer {}".format(token)
+        prep.token_replayed = True
+
+        _r = r.connection.send(prep, **kwargs)
+        _r.history.append(r)
+        _r.request = prep
+
+        return _r
+
+    def _is_fresh(self):
+        """
+        Check if the cached token is valid for longer than the refresh margin.
+
+        Returns:
+            bool: True if the cached token does not need to be refreshed.
+        """
+        return self._token is not None and time.monotonic() < self._refresh_at
+
+    def _refresh(self):
+        """
+        Obtain a new token from the negotiator, the caller must hold the lock.
+
+        The refresh margin is capped at half the lifetime of the token, so short-lived tokens are not refreshed on every call.
+
+        Returns:
+            str: Autodesk Forge access token.
+        """
+        requested_at = time.monotonic()
+        token, expires_in = self.negotiator.get_token(legs=self.legs)
+        expires_in = float(expires_in)
+        self._token = token
+        self._expires_at = requested_at + expires_in
+        self._refresh_at = self._expires_at - min(self.refresh_margin, expires_in / 2)
+        return token
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Module containing the registry of shared http transports for the PyForge package."""
+import threading
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from PyForge.RateLimiter import RateLimiter
+from PyForge.RequestCoalescer import RequestCoalescer
+from PyForge.RequestMetrics import RequestMetrics
+from PyForge.ResponseCache import ResponseCache
+from PyForge.TimeoutHttpAdapter import TimeoutHttpAdapter
+
+DEFAULT_POOL_SIZE = 32
+
+
+class TransportRegistry():
+    """Thread-safe registry sharing one pooled http adapter per host, the request metrics and the rate limiter between all ForgeApi instances."""
+
+    def __init__(self, default_pool_size=DEFAULT_POOL_SIZE, pool_sizes=None, metrics=None, rate_limiter=None):
+        """
+        Initialize the TransportRegistry class with the connection pool sizes to be used.
+
+        Args:
+            default_pool_size (int, optional): Maximum number of pooled connections per host. Defaults to DEFAULT_POOL_SIZE.
+            pool_sizes (dict(str, int), optional): Pool sizes for specific hosts in the form {host : pool_size}. Defaults to None.
+            metrics (RequestMetrics, optional): Metrics recorded by the sessions using the registry.
+                Defaults to None, in which case a new RequestMetrics instance is created.
+            rate_limiter (RateLimiter, optional): Rate limiter pacing the sessions using the registry that opt in with
+                rate_limiter=True.
+                Defaults to None, in which case a new RateLimiter with the default limits is created.
+
+        Returns:
+            None.
+        """
+        self.default_pool_size = default_pool_size
+        self._pool_sizes = dict(pool_sizes or {})
+        self.metrics = RequestMetrics() if metrics is None else metrics
+        self.rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self.coalescer = RequestCoalescer()
+        self.response_cache = ResponseCache()
+        self._adapters = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def set_pool_size(self, host, pool_size):
+        """
+        Set the maximum number of pooled connections for the given host.
+
+        An adapter that already exists for the host gets a new connection pool of the given size, the idle connections of
+        its old pool are closed.
+
+        Args:
+            host (str): Host name, optionally with port, e.g. 'developer.api.autodesk.com'.
+            pool_size (int): Maximum number of pooled connections to the host.
+
+        Raises:
+            ValueError: If the pool size is smaller than 1.
+
+        Returns:
+            None.
+        """
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1.")
+
+        with self._lock:
+            self._pool_sizes[host] = pool_size
+            adapter = self._adapters.get(host)
+            if adapter is not None:
+                old_poolmanager = adapter.poolmanager
+                pools = [old_poolmanager.pools.get(key) for key in old_poolmanager.pools.keys()]
+                adapter.init_poolmanager(adapter._pool_connections, pool_size, block=adapter._pool_block)
+                # urllib3 2 no longer closes the pools a PoolManager clears, so their idle connections are closed here.
+                old_poolmanager.clear()
+                for pool in pools:
+                    if pool is not None:
+                        pool.close()
+
+    def get_pool_size(self, host):
+        """
+        Get the maximum number of pooled connections for the given host.
+
+        Args:
+            host (str): Host name, optionally with port.
+
+        Returns:
+            int: The pool size for the host.
+        """
+        return self._pool_sizes.get(host, self.default_pool_size)
+
+    def get_adapter(self, url):
+        """
+        Get the shared adapter for the host of the given url, creating it on first use.
+
+        Args:
+            url (str): Url of the host the adapter is used for.
+
+        Returns:
+            TimeoutHttpAdapter: The adapter shared by all sessions talking to the host.
+        """
+        host = urlparse(url).netloc
+
+        with self._lock:
+            adapter = self._adapters.get(host)
+
+            if adapter is None:
+                retries = Retry(total=6, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+                adapter = TimeoutHttpAdapter(max_retries=retries, pool_maxsize=self.get_pool_size(host))
+                self._adapters[host] = adapter
+                self._counters[host] = {'adapters_created' : 1, 'adapter_reuses' : 0}
+            else:
+                self._counters[host]['adapter_reuses'] += 1
+
+            return adapter
+
+    def stats(self):
+        """
+        Get the reuse counters of the registered transports.
+
+        Returns:
+            dict(str, dict): Per host the pool size, the number of times the adapter was created and reused, the number of
+            connections opened and requests sent over its current connection pools and the number of requests that reused a connection.
+        """
+        stats = {}
+
+        with self._lock:
+            for host, adapter in self._adapters.items():
+                connections = 0
+                requests = 0
+                pools = adapter.poolmanager.pools
+
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is not None:
+                        connections += pool.num_connections
+                        requests += pool.num_requests
+
+                host_stats = dict(self._counters[host])
+                host_stats.update({'pool_size' : self.get_pool_size(host),
+                                   'connections' : connections,
+                                   'requests' : requests,
+                                   'connection_reuses' : max(requests - connections, 0)})
+                stats[host] = host_stats
+
+        return stats
+
+    def close(self):
+        """
+        Close all registered adapters and their connection pools.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+            self._counters.clear()
+
+
+default_registry = TransportRegistry()
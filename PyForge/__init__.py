@@ -1,15 +1,33 @@
 # -*- coding: utf-8 -*-
 """Python tools to communicate with the Autodesk Forge Api."""
 
-from PyForge.AuthNegotiator import OAuth2Negotiator
-from PyForge.FolderTree import FolderTree
+from PyForge.AccountCrawler import AccountCrawler
+from PyForge.AsyncForgeApi import AsyncForgeApi
+from PyForge.AuthNegotiator import OAuth2Negotiator, AsyncOAuth2Negotiator
+from PyForge.DiskCache import DiskCache
+from PyForge.Endpoints import endpoint_family, endpoint_template
+from PyForge.FolderTree import FolderTree, FolderIndex, FolderSnapshot
 from PyForge.ForgeApi import ForgeApi
-from PyForge.ForgeBusinessUnits import BusinessUnitsApi
-from PyForge.ForgeCompanies import CompaniesApi
-from PyForge.ForgeFolders import FoldersApi
-from PyForge.ForgeHubs import HubsApi
-from PyForge.ForgeModelDerivative import ModelDerivativeApi
-from PyForge.ForgeProjects import ProjectsApi
-from PyForge.ForgeUsers import UsersApi
-from PyForge.ForgeVersions import VersionsApi
-from PyForge.TimeoutHttpAdapter import TimeoutHttpAdapter
\ No newline at end of file
+from PyForge.ForgeBusinessUnits import BusinessUnitsApi, AsyncBusinessUnitsApi
+from PyForge.ForgeCompanies import CompaniesApi, AsyncCompaniesApi
+from PyForge.ForgeCostumAttribute import CustomAttributesApi, AsyncCustomAttributesApi
+from PyForge.ForgeFolders import FoldersApi, AsyncFoldersApi
+from PyForge.ForgeHubs import HubsApi, AsyncHubsApi
+from PyForge.ForgeModelDerivative import ModelDerivativeApi, AsyncModelDerivativeApi
+from PyForge.ForgePermissionBulk import BulkPermissionApi
+from PyForge.ForgePermissionGet import PermissionApi, AsyncPermissionApi
+from PyForge.ForgePermissionPost import PostPermissionApi, AsyncPostPermissionApi
+from PyForge.ForgeProjects import ProjectsApi, AsyncProjectsApi
+from PyForge.ForgeStandIn import ForgeStandIn, StandInData
+from PyForge.ForgeUsers import UsersApi, AsyncUsersApi
+from PyForge.ForgeVersions import VersionsApi, AsyncVersionsApi
+from PyForge.PermissionAudit import PermissionAudit
+from PyForge.Poller import Poller
+from PyForge.PropertyStore import PropertyStore, PropertyColumn
+from PyForge.RateLimiter import RateLimiter, TokenBucket
+from PyForge.RequestCoalescer import RequestCoalescer
+from PyForge.RequestMetrics import RequestMetrics
+from PyForge.ResponseCache import ResponseCache
+from PyForge.TimeoutHttpAdapter import TimeoutHttpAdapter, TimeoutPolicy
+from PyForge.TokenProvider import TokenProvider
+from PyForge.TransportRegistry import TransportRegistry, default_registry
\ No newline at end of file
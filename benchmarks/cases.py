@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Benchmark cases for the client-side hot paths of PyForge.
+
+Every case is a setup function returning the callable to be timed, registered with the benchmark decorator.
+"""
+import base64
+import json
+from PyForge import FolderTree, FoldersApi, ModelDerivativeApi, UsersApi, TransportRegistry
+from PyForge.Endpoints import endpoint_template
+from PyForge.ForgeModelDerivative import make_endpoint
+from PyForge.ForgeStandIn import StandInData
+from fake_transport import mount
+
+CASES = {}
+
+URLS = ['https://developer.api.autodesk.com/data/v1/projects/b.{0:08x}-0000-4000-8000-000000000000/folders/'
+        'urn:adsk.wipprod:fs.folder:co.{0}_r-1-2/contents'.format(i) for i in range(500)] + \
+       ['https://developer.api.autodesk.com/modelderivative/v2/designdata/'
+        'dXJuOmFkc2sud2lwcHJvZDpmcy5maWxlOnZmLnt9P3ZlcnNpb249{0}/metadata/{0:08x}-0000-4000-8000-000000000000/'
+        'properties'.format(i) for i in range(500)]
+
+URNS = ['urn:adsk.wipprod:fs.file:vf.{:012x}?version={}'.format(i * 7919, i % 9 + 1) for i in range(1000)]
+
+
+def benchmark(name, threshold=None):
+    """
+    Register a benchmark case.
+
+    Args:
+        name (str): Name of the case, the key of its baseline.
+        threshold (float, optional): Allowed ratio of the measured time to the baseline before the case counts as a
+            regression. Defaults to None, in which case the default threshold of the runner is used.
+
+    Returns:
+        callable: Decorator registering the setup function of the case.
+    """
+    def register(setup):
+        CASES[name] = (setup, threshold)
+        return setup
+    return register
+
+
+def make_api(api_class, base_url, data):
+    """
+    Make an Api instance answered in-process by a FakeAdapter, with its own registry and without rate limiting.
+
+    Args:
+        api_class (type): The ForgeApi subclass.
+        base_url (str): Base URL of the Api.
+        data (StandInData): The synthetic data.
+
+    Returns:
+        ForgeApi: The Api instance.
+    """
+    api = api_class('token', base_url=base_url, registry=TransportRegistry(), rate_limiter=False)
+    mount(api, data)
+    return api
+
+
+def make_tree(fanout, depth):
+    """
+    Make an in-memory folder tree.
+
+    Args:
+        fanout (int): Number of children per folder above the deepest level.
+        depth (int): Number of levels below the root.
+
+    Returns:
+        FolderTree: The root, named 'Project Files'.
+    """
+    root = FolderTree({'id' : 'root', 'attributes' : {'name' : 'Project Files'}})
+    level = [root]
+
+    for d in range(depth):
+        next_level = []
+        for node in level:
+            for i in range(fanout):
+                folder_id = "{}-{}".format(node.folder['id'], i)
+                next_level.append(node.add_child({'id' : folder_id, 'attributes' : {'name' : "Folder {}".format(folder_id)}}))
+        level = next_level
+
+    return root
+
+
+@benchmark('endpoint_template')
+def bench_endpoint_template():
+    guid = '{:08x}-0000-4000-8000-000000000000'.format(0)
+
+    def run():
+        for urn in URNS:
+            make_endpoint(r':urn/metadata/:guid/properties', urn, guid=guid)
+
+    return run
+
+
+@benchmark('urn_encoding')
+def bench_urn_encoding():
+    def run():
+        for urn in URNS:
+            make_endpoint(r':urn', urn)
+
+    return run
+
+
+@benchmark('metrics_endpoint_template')
+def bench_metrics_endpoint_template():
+    template = endpoint_template.__wrapped__
+
+    def run():
+        for url in URLS:
+            template(url)
+
+    return run
+
+
+@benchmark('model_derivative_request', threshold=2.0)
+def bench_model_derivative_request():
+    api = ModelDerivativeApi('token', base_url='https://developer.api.autodesk.com/modelderivative/v2/designdata/',
+                             registry=TransportRegistry(), rate_limiter=False, metrics=False)
+    adapter = mount(api, StandInData())
+    urn = URNS[0]
+
+    def run():
+        api.get_manifest(urn)
+
+    run()
+    assert adapter.requests == 1
+    return run
+
+
+@benchmark('make_filter_param')
+def bench_make_filter_param():
+    api = FoldersApi('token', registry=TransportRegistry())
+    entries = ['items:autodesk.bim360:File', 'folders:autodesk.bim360:Folder', 'versions:autodesk.bim360:File'] * 30
+
+    def run():
+        for _ in range(100):
+            api.make_filter_param(entries, 'type')
+            api.make_filter_param('items:autodesk.bim360:File', 'extension.type')
+
+    return run
+
+
+@benchmark('make_filters')
+def bench_make_filters():
+    api = UsersApi('token', registry=TransportRegistry())
+    filters = {'email' : ["user{:03d}@example.com".format(i) for i in range(10)]}
+
+    def run():
+        for _ in range(100):
+            api.make_filters(filters)
+
+    return run
+
+
+@benchmark('properties_json_decode')
+def bench_properties_json_decode():
+    data = StandInData(objects=20000)
+    urn = base64.urlsafe_b64encode(URNS[0].encode('utf8')).decode('utf8')
+    payload = json.dumps(data.properties(urn, data.view_guids(urn)[0])).encode('utf8')
+
+    def run():
+        json.loads(payload)
+
+    return run
+
+
+@benchmark('folder_tree_populate', threshold=2.0)
+def bench_folder_tree_populate():
+    data = StandInData(projects=1, depth=3, fanout=8, items=0)
+    project_id = data.project(0)['id']
+    api = make_api(FoldersApi, 'https://developer.api.autodesk.com/data/v1/projects/', data)
+    root = data.folder(0, ())
+
+    def run():
+        tree = FolderTree(root)
+        tree.populate('token', project_id, breadth_first=True, folders_api=api)
+        assert len(tree.find_all('Folder 8.8.8')) == 1
+
+    return run
+
+
+@benchmark('folder_tree_search')
+def bench_folder_tree_search():
+    tree = make_tree(37, 3)
+    names = ["Folder root-{}-{}-{}".format(i, (i * 7) % 37, (i * 13) % 37) for i in range(37)]
+    tree.search_tree(names[0])
+
+    def run():
+        for name in names:
+            tree.search_tree(name)
+
+    return run
+
+
+@benchmark('folder_tree_index_build')
+def bench_folder_tree_index_build():
+    tree = make_tree(37, 3)
+
+    def run():
+        tree.reindex()
+        tree.search_tree("Folder root-36-36-36")
+
+    return run
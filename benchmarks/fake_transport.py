@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""In-process transport adapter answering PyForge requests from synthetic data, without sockets or threads."""
+import json
+import re
+from urllib.parse import urlparse, parse_qs, unquote, urlencode
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+CONTENTS = re.compile(r'/data/v1/projects/([^/]+)/folders/([^/]+)/contents$')
+MANIFEST = re.compile(r'/modelderivative/v2/designdata/([^/]+)/manifest$')
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter serving the folder contents, with JsonApi paging, and the manifests of a StandInData instance."""
+
+    def __init__(self, data, page_limit=200):
+        """
+        Initialize the FakeAdapter class with the data to be served.
+
+        Args:
+            data (StandInData): The synthetic data.
+            page_limit (int, optional): Size of the pages of folder contents. Defaults to 200.
+
+        Returns:
+            None.
+        """
+        super().__init__()
+        self.data = data
+        self.page_limit = page_limit
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        """
+        Answer a prepared request.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+
+        Returns:
+            requests.Response: The response, 404 for unknown routes.
+        """
+        self.requests += 1
+        url = urlparse(request.url)
+        query = {key : values[-1] for key, values in parse_qs(url.query).items()}
+
+        match = MANIFEST.search(url.path)
+        if match:
+            return self._make_response(request, 200, self.data.manifest(match.group(1)))
+
+        match = CONTENTS.search(url.path)
+        folder = self.data.parse_folder_id(unquote(match.group(2))) if match else None
+
+        if folder is None:
+            return self._make_response(request, 404, {'developerMessage' : "Unknown endpoint."})
+
+        types = query.get('filter[type]', 'folders,items').split(',')
+        entries = []
+        if 'folders' in types:
+            entries += [(subfolder, None) for subfolder in self.data.subfolders(*folder)]
+        if 'items' in types:
+            entries += self.data.items_of(*folder)
+
+        number = int(query.get('page[number]', 0))
+        start = number * self.page_limit
+        page = entries[start:start + self.page_limit]
+        cont = {'data' : [entry for entry, tip in page], 'included' : [tip for entry, tip in page if tip is not None],
+                'links' : {}}
+
+        if start + self.page_limit < len(entries):
+            query['page[number]'] = number + 1
+            cont['links']['next'] = {'href' : "{}://{}{}?{}".format(url.scheme, url.netloc, url.path, urlencode(query))}
+
+        return self._make_response(request, 200, cont)
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _make_response(request, status, cont):
+        """
+        Make a fully read response.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            status (int): Status code of the response.
+            cont (dict): The JSON document of the response.
+
+        Returns:
+            requests.Response: The response.
+        """
+        resp = Response()
+        resp.status_code = status
+        resp._content = json.dumps(cont).encode('utf8')
+        resp.headers = CaseInsensitiveDict({'Content-Type' : 'application/vnd.api+json',
+                                            'Content-Length' : str(len(resp._content))})
+        resp.encoding = 'utf-8'
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+
+def mount(api, data, page_limit=200):
+    """
+    Mount a FakeAdapter for the given data on the session of an Api instance.
+
+    Args:
+        api (ForgeApi): The Api instance.
+        data (StandInData): The synthetic data.
+        page_limit (int, optional): Size of the pages of folder contents. Defaults to 200.
+
+    Returns:
+        FakeAdapter: The mounted adapter.
+    """
+    adapter = FakeAdapter(data, page_limit)
+    api.http.mount('https://', adapter)
+    api.http.mount('http://', adapter)
+    return adapter
+
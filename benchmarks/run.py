@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Run the PyForge micro-benchmarks and compare them to the stored baseline.
+
+Usage:
+    python benchmarks/run.py                     compare all cases to benchmarks/baseline.json
+    python benchmarks/run.py -k folder_tree      only run the cases whose name contains 'folder_tree'
+    python benchmarks/run.py --update-baseline   store the measured times as the new baseline
+
+The exit code is 1 if a case is slower than its baseline by more than its threshold. Times are only compared if the
+baseline was measured on the same machine type with the same Python version, otherwise the exit code is 0.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+from cases import CASES # noqa: E402
+
+BASELINE = os.path.join(HERE, 'baseline.json')
+DEFAULT_THRESHOLD = 1.5
+MIN_TIME = 0.5 # seconds per repeat
+
+
+def measure(run, repeat=5, min_time=MIN_TIME):
+    """
+    Measure the time of a benchmark callable.
+
+    Args:
+        run (callable): The callable to be timed.
+        repeat (int, optional): Number of timed repeats. Defaults to 5.
+        min_time (float, optional): Minimum time in s of a repeat, setting the number of calls per repeat.
+            Defaults to MIN_TIME.
+
+    Returns:
+        float: The fastest time per call in s.
+    """
+    timer = timeit.Timer(run)
+    number = 1
+
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+
+    return min(timer.repeat(repeat, number)) / number
+
+
+def load_baseline(path):
+    """
+    Load the baseline times.
+
+    Args:
+        path (str): Path of the baseline file.
+
+    Returns:
+        dict: The baseline, with the 'results' in s per call by case name.
+    """
+    if not os.path.exists(path):
+        return {'results' : {}}
+
+    with open(path, encoding='utf8') as file:
+        return json.load(file)
+
+
+def main(args=None):
+    """
+    Run the benchmark cases from the command line.
+
+    Args:
+        args (list(str), optional): The command line arguments. Defaults to None, in which case sys.argv is used.
+
+    Returns:
+        int: The exit code, 1 if a case regressed compared to a baseline of the same machine type and Python version.
+    """
+    parser = argparse.ArgumentParser(description="Run the PyForge micro-benchmarks.")
+    parser.add_argument('-k', '--filter', default='', help="Only run the cases whose name contains this text.")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timed repeats per case.")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed ratio to the baseline for the cases without a threshold of their own.")
+    parser.add_argument('--baseline', default=BASELINE, help="Path of the baseline file.")
+    parser.add_argument('--update-baseline', action='store_true', help="Store the measured times as the baseline.")
+    options = parser.parse_args(args)
+
+    baseline = load_baseline(options.baseline)
+    results = {}
+    regressions = []
+
+    print("Times are absolute and machine specific, the baseline was measured on {} with Python {}.".format(
+        baseline.get('machine', '-'), baseline.get('python', '-')))
+    comparable = (baseline.get('machine'), baseline.get('python')) == (platform.machine(), platform.python_version())
+    if not comparable:
+        print("This is {} with Python {}, the times are not compared, update the baseline to compare them.".format(
+            platform.machine(), platform.python_version()))
+
+    print("{:<28} {:>12} {:>12} {:>8}".format('case', 'time', 'baseline', 'ratio'))
+
+    for name, (setup, threshold) in CASES.items():
+        if options.filter not in name:
+            continue
+
+        seconds = measure(setup(), repeat=options.repeat)
+        results[name] = seconds
+        reference = baseline['results'].get(name) if comparable else None
+
+        if reference is None:
+            print("{:<28} {:>10.3f}ms {:>12} {:>8}".format(name, seconds * 1e3, '-', '-'))
+            continue
+
+        ratio = seconds / reference
+        limit = threshold or options.threshold
+        flag = '  REGRESSION' if ratio > limit else ''
+        print("{:<28} {:>10.3f}ms {:>10.3f}ms {:>7.2f}x{}".format(name, seconds * 1e3, reference * 1e3, ratio, flag))
+
+        if ratio > limit:
+            regressions.append(name)
+
+    if options.update_baseline:
+        baseline['results'].update(results)
+        baseline['python'] = platform.python_version()
+        baseline['machine'] = platform.machine()
+        with open(options.baseline, 'w', encoding='utf8') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write('\n')
+        print("Baseline written to {}".format(options.baseline))
+        return 0
+
+    if regressions:
+        print("Regressions: {}".format(', '.join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
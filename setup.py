@@ -11,6 +11,7 @@ setup(
   download_url = 'https://github.com/eduardhendriksen/PyForge/archive/master.tar.gz',
   keywords = ['Autodesk Forge', 'API'],
   install_requires=['requests', 'requests-toolbelt'],
+  extras_require={'async': ['aiohttp']},
   classifiers=[
     'Development Status :: 3 - Alpha',
     'Intended Audience :: Developers',
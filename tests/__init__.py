@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Tests of the PyForge package, run against a local ForgeStandIn so they need no Autodesk Forge account."""
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Fixtures shared by the PyForge tests."""
+import pytest
+from PyForge import ForgeStandIn, StandInData
+
+
+@pytest.fixture(scope='session')
+def data():
+    """Small synthetic data set, served by the stand_in fixture."""
+    return StandInData(projects=2, depth=2, fanout=2, items=2, versions=2, companies=7, users=9, objects=20)
+
+
+@pytest.fixture(scope='session')
+def stand_in(data):
+    """ForgeStandIn serving the data fixture, without latency, faults or 202 Accepted responses."""
+    with ForgeStandIn(data, processing_polls=0) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture(scope='session')
+def urls(stand_in):
+    """Base urls of the Forge APIs on the stand_in fixture, by API."""
+    return {'project' : stand_in.url + 'project/v1/',
+            'hubs' : stand_in.url + 'project/v1/hubs/',
+            'data' : stand_in.url + 'data/v1/projects/',
+            'docs' : stand_in.url + 'bim360/docs/v1/projects/',
+            'admin' : stand_in.url + 'bim360/admin/v1/',
+            'hq' : stand_in.url + 'hq/v1/accounts/',
+            'derivative' : stand_in.url + 'modelderivative/v2/designdata/',
+            'authentication' : stand_in.url + 'authentication/v2/token'}
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Tests of the AccountCrawler, crawling the account of a ForgeStandIn."""
+import importlib
+import io
+import json
+import queue
+import threading
+import pytest
+from PyForge import AccountCrawler, HubsApi, ProjectsApi, FoldersApi, VersionsApi
+
+
+class UnserializableHubsApi():
+    """Hubs api listing a hub that can not be written as JSON."""
+
+    def get_hubs(self):
+        return [{'id' : 'hub', 'attributes' : {'name' : object()}}]
+
+
+def make_crawler(urls, **kwargs):
+    apis = {'hubs_api' : HubsApi('token', base_url=urls['project'], timeout=5),
+            'projects_api' : ProjectsApi('token', base_url=urls['hubs'], timeout=5),
+            'folders_api' : FoldersApi('token', base_url=urls['data'], timeout=5),
+            'versions_api' : VersionsApi('token', base_url=urls['data'], timeout=5)}
+    options = dict(apis, project_workers=2, folder_workers=4, version_workers=2, queue_size=4)
+    options.update(kwargs)
+    return AccountCrawler('token', **options)
+
+
+def crawl(crawler, output, timeout=30):
+    """Crawl in a thread, failing the test instead of hanging if the crawl does not finish."""
+    result = {}
+
+    def run():
+        try:
+            result['counts'] = crawler.crawl(output)
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    assert not thread.is_alive(), "Crawl did not finish."
+
+    if 'error' in result:
+        raise result['error']
+
+    return result['counts']
+
+
+def test_crawl_writes_every_object_once(urls, data):
+    output = io.StringIO()
+
+    counts = crawl(make_crawler(urls), output)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    folders = data.fanout + data.fanout ** 2
+    items = data.items * (1 + folders)
+
+    assert counts == {'hub' : 1, 'project' : data.projects, 'folder' : data.projects * folders,
+                      'item' : data.projects * items, 'version' : data.projects * items}
+    assert len(lines) == sum(counts.values())
+    assert lines[0]['type'] == 'hub' and lines[0]['hub_id'] == data.hub_id
+    assert len({line['data']['id'] for line in lines}) == len(lines)
+
+    item_ids = {line['data']['id'] for line in lines if line['type'] == 'item'}
+    assert {line['item_id'] for line in lines if line['type'] == 'version'} == item_ids
+
+
+def test_all_queues_are_bounded(monkeypatch, urls):
+    sizes = []
+    make = queue.Queue
+
+    def make_queue(maxsize=0):
+        sizes.append(maxsize)
+        return make(maxsize)
+
+    monkeypatch.setattr(importlib.import_module('PyForge.AccountCrawler').queue, 'Queue', make_queue)
+    counts = crawl(make_crawler(urls), io.StringIO())
+    monkeypatch.undo()
+
+    # A single folder worker with room for one waiting folder crawls the subfolders that do not fit itself.
+    assert crawl(make_crawler(urls, folder_workers=1, queue_size=1), io.StringIO()) == counts
+    assert sizes == [4, 4, 4, 4]
+
+
+def test_crawl_writes_to_a_path(tmp_path, urls, data):
+    path = str(tmp_path / 'crawl.jsonl')
+
+    counts = crawl(make_crawler(urls, hub_ids=[data.hub_id]), path)
+
+    with open(path, encoding='utf8') as f:
+        assert sum(1 for _ in f) == sum(counts.values())
+
+
+def test_crawl_skips_other_hubs(urls):
+    output = io.StringIO()
+
+    assert crawl(make_crawler(urls, hub_ids=['b.other']), output) == {}
+    assert output.getvalue() == ''
+
+
+def test_failed_stages_are_written_as_errors(urls, data):
+    output = io.StringIO()
+
+    counts = crawl(make_crawler(urls, projects_api=ProjectsApi('token', base_url=urls['data'], timeout=5)), output)
+
+    errors = [json.loads(line) for line in output.getvalue().splitlines() if '"error"' in line]
+    assert counts == {'hub' : 1, 'error' : 1}
+    assert errors[0]['stage'] == 'projects'
+    assert errors[0]['hub_id'] == data.hub_id
+
+
+def test_closed_output_raises(urls):
+    output = io.StringIO()
+    output.close()
+
+    with pytest.raises(ValueError):
+        crawl(make_crawler(urls), output)
+
+
+def test_unwritable_path_raises(tmp_path, urls):
+    with pytest.raises(OSError):
+        crawl(make_crawler(urls), str(tmp_path / 'missing' / 'crawl.jsonl'))
+
+
+def test_unserializable_line_raises(urls):
+    with pytest.raises(TypeError):
+        crawl(make_crawler(urls, hubs_api=UnserializableHubsApi()), io.StringIO())
+
+
+def test_writer_failure_aborts_a_running_crawl(urls):
+    class FailingOutput(io.StringIO):
+        """Text file failing after a few lines."""
+
+        def write(self, s):
+            if self.tell() > 2000:
+                raise OSError("Disk full.")
+            return super().write(s)
+
+    crawler = make_crawler(urls)
+
+    with pytest.raises(OSError):
+        crawl(crawler, FailingOutput())
+
+    output = io.StringIO()
+    assert sum(crawl(crawler, output).values()) == len(output.getvalue().splitlines())
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Tests of the asynchronous clients, which must return the same results as their synchronous counterparts."""
+import asyncio
+import pytest
+from PyForge import (OAuth2Negotiator, AsyncOAuth2Negotiator, AsyncForgeApi, AsyncHubsApi, HubsApi, AsyncProjectsApi, ProjectsApi, AsyncFoldersApi, FoldersApi,
+                     AsyncBusinessUnitsApi, BusinessUnitsApi, AsyncModelDerivativeApi, ModelDerivativeApi,
+                     AsyncPostPermissionApi, ForgeStandIn, StandInData, Poller)
+
+
+def run(coro):
+    """Run a coroutine on a new event loop, closing the shared connection pool afterwards."""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await AsyncForgeApi.close()
+    return asyncio.run(main())
+
+
+def test_hubs_and_projects(urls, data):
+    hubs = run(AsyncHubsApi('token', base_url=urls['project']).get_hubs())
+    projects = run(AsyncProjectsApi('token', base_url=urls['hubs']).get_account_projects(data.account_id))
+
+    assert hubs == HubsApi('token', base_url=urls['project']).get_hubs()
+    assert projects == ProjectsApi('token', base_url=urls['hubs']).get_account_projects(data.account_id)
+    assert [project['id'] for project in projects] == [data.project(number)['id'] for number in range(data.projects)]
+
+
+def test_folder_contents(urls, data):
+    project_id = data.project(0)['id']
+    folder_id = data.folder_id(0, ())
+
+    contents = run(AsyncFoldersApi('token', base_url=urls['data']).get_folder_contents(project_id, folder_id))
+
+    assert contents == FoldersApi('token', base_url=urls['data']).get_folder_contents(project_id, folder_id)
+
+
+def test_business_units_strip_the_hub_prefix(urls, data):
+    units = run(AsyncBusinessUnitsApi('token', base_url=urls['hq']).get_account_business_units(data.hub_id))
+
+    assert units == data.business_units()['business_units']
+    assert units == BusinessUnitsApi('token', base_url=urls['hq']).get_account_business_units(data.hub_id)
+    assert units == BusinessUnitsApi('token', base_url=urls['hq']).get_account_business_units(data.account_id)
+
+
+def test_object_properties(urls, data):
+    urn = data.version(0, (), 0, 1)['id']
+    api = ModelDerivativeApi('token', base_url=urls['derivative'])
+    guid = api.get_metadata_ids(urn)['metadata'][0]['guid']
+
+    properties = run(AsyncModelDerivativeApi('token', base_url=urls['derivative']).get_object_properties(urn, guid))
+
+    assert properties == api.get_object_properties(urn, guid)
+    assert len(properties['collection']) == data.objects
+
+
+def test_negotiators_share_the_scope_validation(urls):
+    negotiator = AsyncOAuth2Negotiator(urls['authentication'], 'client_id', 'client_secret', ['data:read', 'data:write'])
+
+    token, expires_in = run(negotiator.get_token())
+
+    assert token.startswith('stand-in-') and expires_in > 0
+    assert negotiator.scopes == OAuth2Negotiator.make_scopes(['data:read', 'data:write']) == 'data:read data:write'
+    for negotiator_class in (OAuth2Negotiator, AsyncOAuth2Negotiator):
+        with pytest.raises(TypeError):
+            negotiator_class(urls['authentication'], 'client_id', 'client_secret', [1])
+
+
+def test_throttled_permission_batches_are_retried():
+    with ForgeStandIn(StandInData(projects=1, depth=1, fanout=1, users=5), processing_polls=0, throttle_rate=0.5,
+                      retry_after=0, seed=1) as stand_in:
+        data = stand_in.data
+        api = AsyncPostPermissionApi('token', base_url=stand_in.url + 'bim360/docs/v1/projects/', timeout=5,
+                                     poller=Poller(initial_delay=0.01, jitter=0))
+        subjects = [{'subjectId' : "subject-{}".format(i), 'subjectType' : 'USER', 'actions' : ['VIEW']} for i in range(3)]
+
+        async def post_all():
+            return await asyncio.gather(*(api.post_folder_permissions(data.project(0)['id'], data.folder_id(0, (0,)),
+                                                                      'create', [subject]) for subject in subjects))
+
+        results = run(post_all())
+        stats = stand_in.stats()['POST /bim360/docs/v1/projects/:id/folders/:id/permissions:batch-create']
+
+    permissions = {permission['subjectId'] : permission for permission in data.permissions(0, (0,))}
+    assert all(result.get('errors') in (None, []) for result in results)
+    assert stats[200] == 3 and stats[429] > 0
+    assert all(permissions["subject-{}".format(i)]['actions'] == ['VIEW'] for i in range(3))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests of the benchmark cases, the in-process FakeAdapter and the benchmark runner."""
+import json
+import os
+import sys
+import pytest
+from PyForge import FoldersApi, TransportRegistry
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import cases # noqa: E402
+import run # noqa: E402
+from fake_transport import mount # noqa: E402
+
+
+@pytest.mark.parametrize('name', sorted(cases.CASES))
+def test_cases_run(name):
+    setup, threshold = cases.CASES[name]
+
+    setup()()
+
+    assert threshold is None or threshold > 1
+
+
+def test_cases_have_a_baseline():
+    assert set(run.load_baseline(run.BASELINE)['results']) == set(cases.CASES)
+
+
+def test_fake_adapter_pages_the_folder_contents(data):
+    api = FoldersApi('token', base_url='https://developer.api.autodesk.com/data/v1/projects/', registry=TransportRegistry(),
+                     rate_limiter=False)
+    adapter = mount(api, data, page_limit=1)
+    project_id = data.project(0)['id']
+
+    folder_data, folder_versions = api.get_folder_contents(project_id, data.folder_id(0, ()))
+
+    assert {data.folder_id(0, (i,)) for i in range(data.fanout)} <= {entry['id'] for entry in folder_data}
+    assert len(folder_data) == data.fanout + data.items
+    assert adapter.requests == len(folder_data)
+
+
+def test_runner_flags_regressions_and_updates_the_baseline(tmp_path, capsys):
+    path = str(tmp_path / 'baseline.json')
+
+    assert run.load_baseline(path) == {'results' : {}}
+    assert run.main(['-k', 'make_filters', '--repeat', '1', '--baseline', path, '--update-baseline']) == 0
+
+    with open(path, encoding='utf8') as file:
+        baseline = json.load(file)
+    assert list(baseline['results']) == ['make_filters']
+
+    baseline['results']['make_filters'] /= 1000
+    with open(path, 'w', encoding='utf8') as file:
+        json.dump(baseline, file)
+
+    assert run.main(['-k', 'make_filters', '--repeat', '1', '--baseline', path]) == 1
+    assert 'Regressions: make_filters' in capsys.readouterr().out
+
+
+def test_runner_does_not_compare_other_machines(tmp_path, capsys):
+    path = str(tmp_path / 'baseline.json')
+    with open(path, 'w', encoding='utf8') as file:
+        json.dump({'machine' : 'other', 'python' : '2.7.18', 'results' : {'make_filters' : 1e-12}}, file)
+
+    assert run.main(['-k', 'make_filters', '--repeat', '1', '--baseline', path]) == 0
+    out = capsys.readouterr().out
+    assert 'not compared' in out
+    assert 'REGRESSION' not in out
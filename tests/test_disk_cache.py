@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Tests of the DiskCache, against the ForgeStandIn and a local server answering conditional requests."""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from PyForge import DiskCache, ModelDerivativeApi, ForgeApi, TransportRegistry
+
+METADATA = 'GET /modelderivative/v2/designdata/:id/metadata'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Server answering every GET request with a body per path and the ETag of the server."""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.gets += 1
+
+        if self.headers.get('If-None-Match') == server.etag:
+            self.send_response(304)
+            self.send_header('ETag', server.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = (self.path * 10).encode('utf8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        if server.etag is not None:
+            self.send_header('ETag', server.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.etag = '"v1"'
+    server.gets = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache'))
+    yield cache
+    cache.close()
+
+
+def make_api(server, cache, token='token'):
+    api = ForgeApi(token, base_url="http://127.0.0.1:{}/".format(server.server_port), timeout=5,
+                   registry=TransportRegistry(), disk_cache=cache)
+    api.http.headers['Authorization'] = "Bearer {}".format(token)
+    return api
+
+
+def test_immutable_responses_are_served_from_disk(stand_in, urls, data, cache):
+    urn = data.version(1, (), 0, 1)['id']
+    api = ModelDerivativeApi('token', base_url=urls['derivative'], disk_cache=cache, registry=TransportRegistry())
+
+    first = api.get_metadata_ids(urn)
+    served = dict(stand_in.stats()[METADATA])
+
+    assert api.get_metadata_ids(urn) == first
+    assert stand_in.stats()[METADATA] == served
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['entries'] == 1
+
+    reopened = DiskCache(cache.directory)
+    api = ModelDerivativeApi('token', base_url=urls['derivative'], disk_cache=reopened, registry=TransportRegistry())
+    assert api.get_metadata_ids(urn) == first
+    assert stand_in.stats()[METADATA] == served
+    reopened.close()
+
+
+def test_immutable_entries_are_served_after_a_token_refresh(stand_in, urls, data, cache):
+    urn = data.version(1, (), 1, 1)['id']
+    registry = TransportRegistry()
+    first = ModelDerivativeApi('token', base_url=urls['derivative'], disk_cache=cache,
+                               registry=registry).get_metadata_ids(urn)
+    served = sum(stand_in.stats()[METADATA].values())
+
+    refreshed = ModelDerivativeApi('refreshed', base_url=urls['derivative'], disk_cache=cache, registry=registry)
+
+    assert refreshed.get_metadata_ids(urn) == first
+    assert sum(stand_in.stats()[METADATA].values()) == served
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['entries'] == 1
+
+
+def test_entries_are_not_shared_between_scopes(stand_in, urls, data, tmp_path):
+    urn = data.version(1, (1,), 0, 1)['id']
+    registry = TransportRegistry()
+    first = DiskCache(str(tmp_path / 'cache'), scope='client-a')
+    second = DiskCache(str(tmp_path / 'cache'), scope='client-b')
+    ModelDerivativeApi('token', base_url=urls['derivative'], disk_cache=first, registry=registry).get_metadata_ids(urn)
+    served = sum(stand_in.stats()[METADATA].values())
+
+    ModelDerivativeApi('token', base_url=urls['derivative'], disk_cache=second, registry=registry).get_metadata_ids(urn)
+
+    assert sum(stand_in.stats()[METADATA].values()) == served + 1
+    assert second.stats()['hits'] == 0
+    assert second.stats()['entries'] == 2
+    first.close()
+    second.close()
+
+
+def test_responses_with_an_etag_are_revalidated(server, cache):
+    api = make_api(server, cache)
+
+    first = api.http.get('a')
+    second = api.http.get('a')
+
+    assert second.content == first.content == b'/a' * 10
+    assert server.gets == 2
+    assert cache.stats()['revalidations'] == 1
+
+    server.etag = '"v2"'
+    assert api.http.get('a').content == first.content
+    assert server.gets == 3
+    assert cache.stats()['misses'] == 2
+
+
+def test_responses_without_validators_are_not_stored(server, cache):
+    server.etag = None
+    api = make_api(server, cache)
+
+    api.http.get('a')
+    api.http.get('a')
+
+    assert server.gets == 2
+    assert cache.stats()['entries'] == 0
+
+
+def test_least_recently_used_entries_are_evicted(server, tmp_path):
+    cache = DiskCache(str(tmp_path / 'small'), max_bytes=50)
+    api = make_api(server, cache)
+
+    api.http.get('a')
+    api.http.get('b')
+    api.http.get('a')
+    api.http.get('c')
+
+    assert cache.size() <= 50
+    assert cache.stats()['entries'] == 2
+    api.http.get('a')
+    assert cache.stats()['revalidations'] == 2
+    api.http.get('b')
+    assert cache.stats()['revalidations'] == 2
+    cache.close()
+
+
+def test_invalidate_removes_entries_by_prefix(server, cache):
+    api = make_api(server, cache)
+    base = api.http.base_url
+
+    for path in ['a/1', 'a/2', 'b/1']:
+        api.http.get(path)
+
+    assert cache.invalidate(base + 'a/') == 2
+    assert cache.stats()['entries'] == 1
+    assert cache.invalidate() == 1
+    assert cache.size() == 0
+
+
+def test_max_bytes_must_not_be_negative(tmp_path):
+    with pytest.raises(ValueError):
+        DiskCache(str(tmp_path), max_bytes=-1)
+
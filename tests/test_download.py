@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Tests of ModelDerivativeApi.download_derivative, against a local server answering HTTP Range requests."""
+import json
+import os
+import re
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+import requests
+from PyForge import ModelDerivativeApi, TransportRegistry
+
+CONTENT = bytes(range(256)) * 4000 + b'tail'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Derivative server, its behaviour set by the attributes of the server."""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(CONTENT)))
+        self.send_header('ETag', self.server.etag)
+        if self.server.ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+    def do_GET(self):
+        server = self.server
+        server.gets += 1
+        match = re.match(r'^bytes=(\d+)-(\d+)$', self.headers.get('Range', ''))
+
+        if match is None:
+            self.send_response(server.status)
+            self.send_header('Content-Length', str(len(CONTENT)))
+            self.end_headers()
+            self.wfile.write(CONTENT)
+            return
+
+        start, end = int(match.group(1)), int(match.group(2))
+        served = start - server.shift
+        body = CONTENT[served:end + 1 + server.surplus]
+        self.send_response(206)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Content-Range', "bytes {}-{}/{}".format(served, end, len(CONTENT)))
+        self.end_headers()
+
+        if server.fail_at is not None and start <= server.fail_at <= end:
+            server.fail_at = None
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.etag = '"v1"'
+    server.ranges = True
+    server.status = 200
+    server.shift = 0
+    server.surplus = 0
+    server.fail_at = None
+    server.gets = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api(server):
+    return ModelDerivativeApi('token', base_url="http://127.0.0.1:{}/".format(server.server_port), timeout=5,
+                              registry=TransportRegistry())
+
+
+def download(api, path, **kwargs):
+    kwargs.setdefault('segment_size', 100000)
+    kwargs.setdefault('chunk_size', 8192)
+    return api.download_derivative('urn:adsk.wipprod:fs.file:vf.model?version=1', 'urn:adsk.viewing:fs.file:x/model.svf',
+                                   str(path), **kwargs)
+
+
+def test_segments_are_joined(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+
+    assert download(api, path) == str(path)
+    assert path.read_bytes() == CONTENT
+    assert server.gets == len(range(0, len(CONTENT), 100000))
+    assert not os.path.exists(str(path) + '.part.json')
+
+
+def test_failed_download_is_resumed(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+    server.fail_at = 350000
+
+    with pytest.raises(requests.RequestException):
+        download(api, path, retries=0, max_workers=1)
+    assert not path.exists()
+    assert os.path.exists(str(path) + '.part.json')
+
+    server.gets = 0
+    download(api, path)
+
+    assert path.read_bytes() == CONTENT
+    assert server.gets == 1
+
+
+def test_changed_derivative_is_downloaded_again(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+    server.fail_at = 350000
+
+    with pytest.raises(requests.RequestException):
+        download(api, path, retries=0, max_workers=1)
+
+    server.etag = '"v2"'
+    server.gets = 0
+    download(api, path)
+
+    assert path.read_bytes() == CONTENT
+    assert server.gets == len(range(0, len(CONTENT), 100000))
+
+
+PROGRESS = {'size' : len(CONTENT), 'etag' : '"v1"', 'segment_size' : 100000, 'done' : {'0' : 100000}}
+
+
+@pytest.mark.parametrize('progress', [json.dumps(PROGRESS)[:-6], '[]', json.dumps(dict(PROGRESS, segment_size=0))],
+                         ids=['truncated', 'not-an-object', 'invalid'])
+def test_unusable_progress_starts_over(api, server, tmp_path, progress):
+    path = tmp_path / 'model.svf'
+    server.fail_at = 350000
+
+    with pytest.raises(requests.RequestException):
+        download(api, path, retries=0, max_workers=1)
+    (tmp_path / 'model.svf.part.json').write_text(progress)
+
+    server.gets = 0
+    download(api, path)
+
+    assert path.read_bytes() == CONTENT
+    assert server.gets == len(range(0, len(CONTENT), 100000))
+    assert os.listdir(str(tmp_path)) == ['model.svf']
+
+
+def test_content_range_must_match_the_request(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+    server.shift = 10
+
+    with pytest.raises(ConnectionError, match='Content-Range'):
+        download(api, path)
+    assert not path.exists()
+
+
+def test_surplus_bytes_fail_the_download(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+    server.surplus = 10
+
+    with pytest.raises(ConnectionError, match='more bytes'):
+        download(api, path)
+    assert not path.exists()
+
+
+def test_download_without_ranges(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+    server.ranges = False
+
+    download(api, path)
+
+    assert path.read_bytes() == CONTENT
+    assert server.gets == 1
+
+
+def test_download_without_ranges_requires_a_200(api, server, tmp_path):
+    path = tmp_path / 'model.svf'
+    server.ranges = False
+    server.status = 202
+
+    with pytest.raises(ConnectionError, match='202'):
+        download(api, path)
+    assert not path.exists()
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Tests of the FolderTree, populated from the folders of a ForgeStandIn project."""
+import importlib
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from PyForge import FolderTree, FoldersApi
+
+
+def dump(tree):
+    """Get the folder ids of a tree as nested tuples, in child order."""
+    return (tree.folder['id'], [dump(child) for child in tree.children])
+
+
+@pytest.fixture
+def folders_api(urls):
+    return FoldersApi('token', base_url=urls['data'], timeout=5)
+
+
+@pytest.fixture
+def project_id(data):
+    return data.project(0)['id']
+
+
+@pytest.fixture
+def tree(data, folders_api, project_id):
+    tree = FolderTree(data.folder(0, ()))
+    tree.populate('token', project_id, breadth_first=True, folders_api=folders_api)
+    return tree
+
+
+def test_populate_breadth_first_matches_depth_first(data, folders_api, project_id, tree):
+    depth_first = FolderTree(data.folder(0, ()))
+    depth_first.populate('token', project_id, folders_api=folders_api)
+
+    assert dump(tree) == dump(depth_first)
+    assert sum(1 for _ in tree.walk()) == 1 + data.fanout + data.fanout ** 2
+
+
+def requests_sent(stand_in):
+    """Get the total number of requests the stand-in has answered."""
+    return sum(sum(statuses.values()) for statuses in stand_in.stats().values())
+
+
+def test_find_by_id_and_path(data, tree):
+    for node in tree.walk():
+        assert tree.find_by_id(node.folder['id']) is node
+        assert tree.find_by_path(node.path) is node
+
+    folder = tree.find_by_path('Folder 1/Folder 1.2')
+
+    assert folder.folder['id'] == data.folder_id(0, (0, 1))
+    assert tree.find_by_path('/Folder 1/Folder 1.2/') is folder
+    assert tree.find_by_path('Folder 1').find_by_path('Folder 1.2') is folder
+    assert tree.find_by_path('Folder 1/Missing') is None
+    assert tree.find_by_id(data.folder_id(1, ())) is None
+
+
+def test_find_all_and_search_tree(tree):
+    first = tree.find_by_path('Folder 1')
+    second = tree.find_by_path('Folder 2')
+    duplicate = second.add_child({'id' : 'duplicate', 'attributes' : {'name' : 'Folder 1.1'}})
+
+    assert tree.find_all('Folder 1.1') == [tree.find_by_path('Folder 1/Folder 1.1'), duplicate]
+    assert second.find_all('Folder 1.1') == [duplicate]
+    assert first.find_all('Folder 1') == []
+    assert tree.search_tree('Folder 1.1') is tree.find_by_path('Folder 1/Folder 1.1')
+    assert second.search_tree('Folder 1.1') is duplicate
+    assert tree.search_tree('Missing') is None
+
+    second.remove_child(duplicate)
+
+    assert tree.find_by_id('duplicate') is None
+    assert tree.find_all('Folder 1.1') == [tree.find_by_path('Folder 1/Folder 1.1')]
+    with pytest.raises(ValueError):
+        first.remove_child(duplicate)
+
+
+def test_index_follows_moved_and_renamed_folders(tree):
+    moved = tree.find_by_path('Folder 1/Folder 1.2')
+    moved.parent.remove_child(moved)
+    tree.find_by_path('Folder 2').add_child(moved)
+
+    assert tree.find_by_path('Folder 2/Folder 1.2') is moved
+    assert tree.find_by_path('Folder 1/Folder 1.2') is None
+    assert moved.root is tree
+
+    folder = dict(moved.folder, attributes=dict(moved.folder['attributes'], name='Renamed'))
+    moved._update_folder(folder)
+
+    assert tree.find_by_path('Folder 2/Renamed') is moved
+    assert tree.find_all('Folder 1.2') == []
+
+
+def test_refresh_of_an_unchanged_tree_sends_one_request(stand_in, folders_api, project_id, tree):
+    sent = requests_sent(stand_in)
+
+    assert tree.refresh('token', project_id, folders_api=folders_api) == {'added' : [], 'removed' : [], 'updated' : []}
+    assert requests_sent(stand_in) == sent + 1
+
+
+def test_refresh_fetches_only_changed_folders(stand_in, folders_api, project_id, tree):
+    expected = dump(tree)
+    stale = tree.find_by_path('Folder 1')
+    missing = stale.children[1]
+    stale.remove_child(missing)
+    stale.add_child({'id' : 'deleted', 'attributes' : {'name' : 'Deleted'}})
+    for node in [tree, stale]:
+        node.folder['attributes']['lastModifiedTimeRollup'] = 'stale'
+    sent = requests_sent(stand_in)
+
+    changes = tree.refresh('token', project_id, folders_api=folders_api)
+
+    assert dump(tree) == expected
+    assert [node.folder['id'] for node in changes['updated']] == [tree.folder['id'], stale.folder['id']]
+    assert [node.path for node in changes['added']] == ['Folder 1/Folder 1.2']
+    assert [node.folder['id'] for node in changes['removed']] == ['deleted']
+    assert tree.find_by_id('deleted') is None
+    assert tree.find_by_path('Folder 1/Folder 1.2') is changes['added'][0]
+    # The root folder, the contents of the root and of 'Folder 1', and the contents of the added folder.
+    assert requests_sent(stand_in) == sent + 4
+
+
+def test_refresh_fetches_added_subtrees_level_by_level(monkeypatch, stand_in, folders_api, project_id, tree):
+    expected = dump(tree)
+    tree.remove_child(tree.find_by_path('Folder 2'))
+    tree.folder['attributes']['lastModifiedTimeRollup'] = 'stale'
+    executors = []
+
+    def executor(*args, **kwargs):
+        executors.append(kwargs)
+        return ThreadPoolExecutor(*args, **kwargs)
+
+    monkeypatch.setattr(importlib.import_module('PyForge.FolderTree'), 'ThreadPoolExecutor', executor)
+    sent = requests_sent(stand_in)
+
+    changes = tree.refresh('token', project_id, max_workers=3, folders_api=folders_api)
+
+    assert dump(tree) == expected
+    assert [node.path for node in changes['added']] == ['Folder 2']
+    assert executors == [{'max_workers' : 3}]
+    # The root folder, the contents of the root, of the added folder and of its two children.
+    assert requests_sent(stand_in) == sent + 5
+
+
+def test_snapshot_round_trip(tmp_path, tree):
+    path = str(tmp_path / 'tree.sqlite')
+    tree.save(path)
+
+    loaded = FolderTree.load(path)
+
+    assert loaded._children is None
+    assert dump(loaded) == dump(tree)
+    assert [node.folder for node in loaded.walk()] == [node.folder for node in tree.walk()]
+    assert [node.path for node in loaded.walk()] == [node.path for node in tree.walk()]
+
+
+def test_snapshot_loads_folders_on_demand(tmp_path, tree):
+    path = str(tmp_path / 'tree.sqlite')
+    tree.save(path)
+    target = tree.find_by_path('Folder 2/Folder 2.1')
+
+    loaded = FolderTree.load(path)
+    found = loaded.find_by_path('Folder 2/Folder 2.1')
+
+    assert found.folder == target.folder
+    assert found.path == target.path
+    assert loaded.find_by_path('Folder 1')._children is None
+    assert found._children is None
+    assert FolderTree.load(path).find_by_id(target.folder['id']).path == target.path
+    assert [node.path for node in FolderTree.load(path).find_all('Folder 1.2')] == ['Folder 1/Folder 1.2']
+    assert FolderTree.load(path).search_tree('Missing') is None
+
+
+def test_refresh_of_a_loaded_snapshot(tmp_path, stand_in, folders_api, project_id, tree):
+    path = str(tmp_path / 'tree.sqlite')
+    tree.save(path)
+    loaded = FolderTree.load(path)
+    sent = requests_sent(stand_in)
+
+    assert loaded.refresh('token', project_id, folders_api=folders_api)['updated'] == []
+    assert requests_sent(stand_in) == sent + 1
+    assert loaded._children is None
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.sqlite'
+    path.write_bytes(b'not a snapshot')
+
+    with pytest.raises(ValueError):
+        FolderTree.load(str(path))
+
+
+def test_load_opens_the_snapshot_read_only(tmp_path, tree):
+    path = tmp_path / 'tree.sqlite'
+    tree.save(str(path))
+    saved = path.read_bytes()
+
+    loaded = FolderTree.load(str(path))
+    folder = loaded.find_by_path('Folder 1')
+    loaded.close()
+
+    assert path.read_bytes() == saved
+    with pytest.raises(sqlite3.ProgrammingError):
+        folder.children
+    with pytest.raises(ValueError):
+        FolderTree.load(str(tmp_path / 'missing.sqlite'))
+    assert os.listdir(str(tmp_path)) == ['tree.sqlite']
+
+
+def test_close_of_a_tree_without_snapshot(tree):
+    tree.close()
+
+    assert tree.find_by_path('Folder 1').children
+
+
+def test_failed_save_keeps_the_previous_snapshot(tmp_path, monkeypatch, data, tree):
+    path = str(tmp_path / 'tree.sqlite')
+    tree.save(path)
+    expected = dump(tree)
+
+    def write_rows(db, rows):
+        db.execute("CREATE TABLE folders (id TEXT)")
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(FolderTree, '_write_rows', staticmethod(write_rows))
+    with pytest.raises(sqlite3.OperationalError):
+        FolderTree(data.folder(0, ())).save(path)
+
+    loaded = FolderTree.load(path)
+    assert dump(loaded) == expected
+    assert os.listdir(str(tmp_path)) == ['tree.sqlite']
+    loaded.close()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests of the JsonArrayStream incremental parser."""
+import json
+import pytest
+from PyForge import ModelDerivativeApi
+from PyForge.JsonStream import JsonArrayStream
+
+DOCUMENT = {'meta' : {'collection' : ['not this one'], 'data' : {'collection' : ['nor this one']}},
+            'data' : {'type' : 'properties', 'note' : 'a "quoted" \\ [bracket] {brace}',
+                      'collection' : [{'objectid' : 1, 'name' : 'Wall [123]', 'properties' : {'Mark' : 'Ä€漢 "x"'}},
+                                      {'objectid' : 2, 'nested' : [[1, 2], {'collection' : [3]}], 'empty' : {}},
+                                      12345678901234567890, -1.5e-3, 'text', True, None, []]}}
+
+
+def chunked(text, size):
+    """Split a document into UTF-8 encoded chunks of the given size."""
+    encoded = text.encode('utf8')
+    return [encoded[i:i + size] for i in range(0, len(encoded), size)]
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 1 << 20])
+def test_items_match_json_loads(size):
+    text = json.dumps(DOCUMENT, ensure_ascii=False, indent=1)
+
+    assert list(JsonArrayStream(chunked(text, size))) == DOCUMENT['data']['collection']
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 4, 5])
+def test_numbers_cut_at_a_chunk_boundary(size):
+    text = '{"data" : {"collection" : [-0.0015, 1e-07, 2.5E+10, 10, -3, 0.5]}}'
+
+    assert list(JsonArrayStream(chunked(text, size))) == [-0.0015, 1e-07, 2.5E+10, 10, -3, 0.5]
+
+
+def test_other_path():
+    text = json.dumps(DOCUMENT)
+
+    assert list(JsonArrayStream(chunked(text, 5), path=('meta', 'collection'))) == ['not this one']
+    assert list(JsonArrayStream(chunked(text, 5), path=('meta', 'data', 'collection'))) == ['nor this one']
+
+
+@pytest.mark.parametrize('text', ['{}', '{"data" : {"collection" : {}}}', '{"data" : []}', '[]'])
+def test_missing_array_yields_nothing(text):
+    assert list(JsonArrayStream(chunked(text, 3))) == []
+
+
+@pytest.mark.parametrize('text', ['{"data" : {"collection" : [1, 2', '{"data" : {"collection" : [{"a" : }]}}',
+                                  '{"data" : {"collection" : [1, 2}}'])
+def test_invalid_document_raises(text):
+    with pytest.raises(ValueError):
+        list(JsonArrayStream(chunked(text, 4)))
+
+
+def test_streamed_properties_match_the_collection(urls, data):
+    api = ModelDerivativeApi('token', base_url=urls['derivative'])
+    urn = data.version(0, (), 1, 2)['id']
+    guid = api.get_metadata_ids(urn)['metadata'][0]['guid']
+
+    objects = list(api.iter_object_properties(urn, guid, chunk_size=100))
+
+    assert objects == api.get_object_properties(urn, guid)['collection']
+    assert len(objects) == data.objects
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Tests of the pagination engines, against the paged endpoints of a ForgeStandIn."""
+import pytest
+from PyForge import ForgeStandIn, StandInData, ProjectsApi, FoldersApi, CompaniesApi, UsersApi
+from PyForge.Paginator import JsonApiPaginator, OffsetPaginator
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_pages_follow_the_next_links(urls, data, prefetch):
+    api = ProjectsApi('token', base_url=urls['hubs'])
+
+    pages = list(api.iter_account_projects(data.account_id, limit=1, prefetch=prefetch))
+
+    assert [[project['id'] for project in page] for page in pages] == [[data.project(number)['id']]
+                                                                       for number in range(data.projects)]
+    assert api.get_account_projects(data.account_id, limit=1) == [project for page in pages for project in page]
+
+
+def test_pages_of_folder_contents(urls, data):
+    api = FoldersApi('token', base_url=urls['data'])
+    project_id = data.project(0)['id']
+    folder_id = data.folder_id(0, ())
+    endpoint = "{}/folders/{}/contents".format(project_id, folder_id)
+    headers = {'Authorization' : 'Bearer token'}
+
+    pages = list(JsonApiPaginator(api.http, endpoint, headers=headers, params={'page[limit]' : 1}))
+
+    contents, included = api.get_folder_contents(project_id, folder_id)
+    assert len(pages) == len(contents) == data.fanout + data.items
+    assert [entry for page in pages for entry in page['data']] == contents
+    assert [entry for page in pages for entry in page.get('included', [])] == included
+
+
+def test_pages_are_fetched_lazily():
+    with ForgeStandIn(StandInData(projects=5)) as stand_in:
+        api = ProjectsApi('token', base_url=stand_in.url + 'project/v1/hubs/')
+        pages = api.iter_account_projects(stand_in.data.account_id, limit=1, prefetch=False)
+
+        assert len(next(pages)) == 1
+        assert stand_in.stats() == {'GET /project/v1/hubs/:id/projects' : {200 : 1}}
+
+        pages.close()
+
+
+@pytest.mark.parametrize('total', [True, False])
+@pytest.mark.parametrize('count', [0, 5, 10, 23])
+def test_offset_windows_are_merged_in_order(count, total):
+    requested = []
+
+    def fetch_window(offset):
+        requested.append(offset)
+        return list(range(offset, min(offset + 5, count))), count if total else None
+
+    assert OffsetPaginator(fetch_window, limit=5, max_workers=3).fetch_all() == list(range(count))
+    if total:
+        assert sorted(requested) == list(range(0, max(count, 1), 5))
+    else:
+        assert len(requested) == len(set(requested))
+
+
+@pytest.mark.parametrize('limit', [1, 3, 100])
+def test_offset_windows_of_companies_and_users(urls, data, limit):
+    companies = CompaniesApi('token', base_url=urls['hq']).get_account_companies(data.account_id, limit=limit)
+    users = UsersApi('token', base_url=urls['admin']).get_project_users(data.project(0)['id'], limit=limit)
+
+    assert companies == [data.company(index) for index in range(data.companies)]
+    assert users == [data.user(0, index) for index in range(data.users)]
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests of the PermissionAudit of all folders in a ForgeStandIn project."""
+import pytest
+from PyForge import PermissionAudit, PermissionApi, FolderTree, FoldersApi, TransportRegistry
+
+FULL = ['COLLABORATE', 'DOWNLOAD', 'PUBLISH', 'VIEW']
+
+
+@pytest.fixture
+def project_id(data):
+    return data.project(0)['id']
+
+
+@pytest.fixture
+def tree(urls, data, project_id):
+    tree = FolderTree(data.folder(0, ()))
+    tree.populate('token', project_id, breadth_first=True,
+                  folders_api=FoldersApi('token', base_url=urls['data'], timeout=5, registry=TransportRegistry()))
+    return tree
+
+
+@pytest.fixture
+def permission_api(urls):
+    return PermissionApi('token', base_url=urls['docs'], timeout=5, registry=TransportRegistry())
+
+
+@pytest.fixture
+def audit(tree, project_id, permission_api):
+    return PermissionAudit.from_tree('token', project_id, tree, max_workers=3, permission_api=permission_api)
+
+
+def test_from_tree_fetches_every_folder(data, tree, audit):
+    assert audit.errors == {}
+    assert sorted(audit.folders) == sorted(node.folder['id'] for node in tree.walk())
+
+    for node in tree.walk():
+        folder = audit.folders[node.folder['id']]
+        number, path = data.parse_folder_id(node.folder['id'])
+        assert folder['name'] == node.name
+        assert folder['path'] == node.path
+        assert folder['permissions'] == data.permissions(number, path)
+
+
+def test_actions_include_the_inherited_actions(data, audit):
+    subject_id = data.user(0, 5)['id']
+    folder_id = data.folder_id(0, (0, 1))
+
+    permission = {'actions' : ['VIEW'], 'inheritActions' : ['VIEW', 'DOWNLOAD']}
+
+    assert PermissionAudit.get_actions(permission) == ['DOWNLOAD', 'VIEW']
+    assert PermissionAudit.get_actions({'subjectId' : 'u'}) == []
+    assert audit.get_subjects(folder_id)[subject_id] == FULL
+    assert audit.get_subjects(data.folder_id(0, (0,)))[subject_id] == FULL
+    assert audit.get_subjects('unknown') == {}
+
+
+def test_get_folders_of_a_subject(data, tree, audit):
+    subject_id = data.user(0, 7)['id']
+    folders = audit.get_folders(subject_id)
+    controlled = audit.get_folders(subject_id, action='CONTROL')
+
+    assert data.folder_id(0, (0,)) in folders
+    assert data.folder_id(0, (0, 1)) in controlled
+    assert data.folder_id(0, ()) not in folders
+    assert set(controlled) <= set(folders)
+    assert all('CONTROL' in actions for actions in controlled.values())
+    assert set(audit.get_folders(data.user(0, 5)['id'])) == set(audit.folders)
+    assert audit.get_folders('unknown') == {}
+
+
+def test_find_subjects(data, audit):
+    user = data.user(0, 3)
+
+    assert audit.find_subjects(name=user['name'].upper()) == [user['id']]
+    assert audit.find_subjects(email=user['email'], subject_type='user') == [user['id']]
+    assert audit.find_subjects(name=user['name'], email='other@example.com') == []
+    assert audit.find_subjects(subject_type='COMPANY') == []
+    assert sorted(audit.find_subjects()) == sorted(audit.subjects)
+
+
+def test_failed_folders_are_reported(data, tree, project_id, permission_api):
+    missing = tree.add_child({'id' : data.folder_id(0, (7,)), 'attributes' : {'name' : 'Missing'}})
+
+    audit = PermissionAudit.from_tree('token', project_id, tree, permission_api=permission_api)
+
+    assert list(audit.errors) == [missing.folder['id']]
+    assert audit.errors[missing.folder['id']].startswith('HTTPError: ')
+    assert missing.folder['id'] not in audit.folders
+    assert len(audit.folders) == sum(1 for _ in tree.walk()) - 1
+
+
+def test_from_tree_needs_a_token_and_project_id(tree, project_id):
+    with pytest.raises(ValueError):
+        PermissionAudit.from_tree(None, project_id, tree)
+    with pytest.raises(ValueError):
+        PermissionAudit.from_tree('token', None, tree)
+
+
+def test_save_and_load(tmp_path, audit):
+    path = str(tmp_path / 'audit.json')
+    audit.errors['folder'] = 'HTTPError: 404'
+
+    audit.save(path)
+    loaded = PermissionAudit.load(path)
+
+    assert loaded.project_id == audit.project_id
+    assert loaded.folders == audit.folders
+    assert loaded.errors == audit.errors
+    assert loaded.subjects == audit.subjects
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Tests of the BulkPermissionApi applying permission plans to the folders of a ForgeStandIn."""
+import pytest
+import requests
+from PyForge import (BulkPermissionApi, PermissionApi, PostPermissionApi, ForgeStandIn, StandInData, TransportRegistry,
+                     Poller)
+
+BATCH = 'POST /bim360/docs/v1/projects/:id/folders/:id/permissions:batch-{}'
+
+
+@pytest.fixture
+def own_stand_in():
+    """ForgeStandIn of its own, as the tests change its permissions."""
+    with ForgeStandIn(StandInData(projects=1, depth=1, fanout=3, users=20), processing_polls=0) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def bulk_api(own_stand_in):
+    return BulkPermissionApi('token', base_url=own_stand_in.url + 'bim360/docs/v1/projects/', timeout=5,
+                             registry=TransportRegistry())
+
+
+def get_permissions(stand_in, folder_id):
+    api = PermissionApi('token', base_url=stand_in.url + 'bim360/docs/v1/projects/', timeout=5,
+                        registry=TransportRegistry())
+    return {permission['subjectId'] : permission for permission in
+            api.get_folder_permission(stand_in.data.project(0)['id'], folder_id)}
+
+
+def test_make_plan():
+    plan = BulkPermissionApi.make_plan(['f1', 'f2'], [('u1', 'USER', ['VIEW']), ('c1', 'COMPANY', 'VIEW COLLABORATE')],
+                                       operation='update')
+
+    assert len(plan) == 4
+    assert plan[1] == {'folder_id' : 'f1', 'subject_id' : 'c1', 'subject_type' : 'COMPANY',
+                       'actions' : 'VIEW COLLABORATE', 'operation' : 'update'}
+
+
+def test_apply_plan_in_batches(own_stand_in, bulk_api):
+    data = own_stand_in.data
+    folder_ids = [data.folder_id(0, (i,)) for i in range(3)]
+    subjects = [("subject-{}".format(i), 'USER', ['VIEW', 'COLLABORATE']) for i in range(5)]
+
+    applied, failed = bulk_api.apply_plan(data.project(0)['id'], bulk_api.make_plan(folder_ids, subjects),
+                                          batch_size=2, max_workers=4)
+
+    assert len(applied) == 15
+    assert failed == {}
+    assert own_stand_in.stats()[BATCH.format('create')] == {200 : 9}
+    for folder_id in folder_ids:
+        permissions = get_permissions(own_stand_in, folder_id)
+        assert all(permissions["subject-{}".format(i)]['actions'] == ['VIEW', 'COLLABORATE'] for i in range(5))
+
+
+def test_throttled_batches_are_retried():
+    with ForgeStandIn(StandInData(projects=1, depth=1, fanout=3, users=20), processing_polls=0, throttle_rate=0.4,
+                      retry_after=0, seed=3) as stand_in:
+        data = stand_in.data
+        bulk_api = BulkPermissionApi('token', base_url=stand_in.url + 'bim360/docs/v1/projects/', timeout=5,
+                                     registry=TransportRegistry(), poller=Poller(initial_delay=0.01, jitter=0))
+        subjects = [("subject-{}".format(i), 'USER', ['VIEW']) for i in range(4)]
+
+        applied, failed = bulk_api.apply_plan(data.project(0)['id'],
+                                              bulk_api.make_plan([data.folder_id(0, (i,)) for i in range(3)], subjects),
+                                              batch_size=2)
+
+        assert len(applied) == 12
+        assert failed == {}
+        assert stand_in.stats()[BATCH.format('create')][200] == 6
+        assert stand_in.stats()[BATCH.format('create')][429] > 0
+        for i in range(3):
+            permissions = {permission['subjectId'] : permission for permission in data.permissions(0, (i,))}
+            assert all(permissions["subject-{}".format(j)]['actions'] == ['VIEW'] for j in range(4))
+
+
+def test_legacy_methods_use_the_token_for_one_call(own_stand_in):
+    data = own_stand_in.data
+    folder_id = data.folder_id(0, (2,))
+    api = PostPermissionApi(None, subjectId='legacy', subjectType='USER', actions='VIEW',
+                            base_url=own_stand_in.url + 'bim360/docs/v1/projects/', timeout=5, registry=TransportRegistry())
+
+    api.get_folder_permission_batch_create('token', data.project(0)['id'], folder_id)
+
+    assert api.token is None
+    assert 'legacy' in get_permissions(own_stand_in, folder_id)
+    with pytest.raises(ValueError):
+        api.get_folder_permission_batch_delete(None, data.project(0)['id'], folder_id)
+
+
+def test_deletes_go_first_and_the_last_item_wins(own_stand_in, bulk_api):
+    data = own_stand_in.data
+    folder_id = data.folder_id(0, (0,))
+    existing = next(iter(get_permissions(own_stand_in, folder_id)))
+    plan = [{'folder_id' : folder_id, 'subject_id' : existing, 'subject_type' : 'USER', 'actions' : ['VIEW'],
+             'operation' : 'create'},
+            {'folder_id' : folder_id, 'subject_id' : existing, 'subject_type' : 'USER', 'operation' : 'delete'},
+            {'folder_id' : folder_id, 'subject_id' : 'new', 'subject_type' : 'USER', 'actions' : ['VIEW'],
+             'operation' : 'update'},
+            {'folder_id' : folder_id, 'subject_id' : 'new', 'subject_type' : 'USER', 'actions' : ['DOWNLOAD'],
+             'operation' : 'create'},
+            {'folder_id' : folder_id, 'subject_id' : 'new', 'subject_type' : 'USER', 'actions' : ['VIEW', 'DOWNLOAD'],
+             'operation' : 'create'}]
+
+    applied, failed = bulk_api.apply_plan(data.project(0)['id'], plan)
+
+    permissions = get_permissions(own_stand_in, folder_id)
+    assert [item['operation'] for item in applied] == ['delete', 'create', 'create', 'update']
+    assert failed == {}
+    assert permissions[existing]['actions'] == ['VIEW']
+    assert permissions['new']['actions'] == ['VIEW']
+
+
+def test_failures_are_reported_per_item(own_stand_in, bulk_api):
+    data = own_stand_in.data
+    folder_id = data.folder_id(0, (1,))
+    missing_folder = data.folder_id(0, (7,))
+    plan = (bulk_api.make_plan([folder_id], [('ok', 'USER', ['VIEW']), ('bad', 'TEAM', ['VIEW'])]) +
+            bulk_api.make_plan([folder_id], [('unknown', 'USER', ['VIEW'])], operation='update') +
+            bulk_api.make_plan([missing_folder], [('a', 'USER', ['VIEW']), ('b', 'USER', ['VIEW'])]))
+
+    applied, failed = bulk_api.apply_plan(data.project(0)['id'], plan)
+
+    assert [item['subject_id'] for item in applied] == ['ok']
+    assert sorted(failed) == sorted([(folder_id, 'bad', 'create'), (folder_id, 'unknown', 'update'),
+                                     (missing_folder, 'a', 'create'), (missing_folder, 'b', 'create')])
+    assert isinstance(failed[(folder_id, 'bad', 'create')], ConnectionError)
+    assert isinstance(failed[(missing_folder, 'a', 'create')], requests.HTTPError)
+    assert 'bad' not in get_permissions(own_stand_in, folder_id)
+
+
+def test_invalid_plans_are_rejected(own_stand_in, bulk_api):
+    project_id = own_stand_in.data.project(0)['id']
+    plan = bulk_api.make_plan(['f'], [('u', 'USER', ['VIEW'])])
+
+    with pytest.raises(ValueError):
+        bulk_api.apply_plan(project_id, plan, batch_size=0)
+    with pytest.raises(ValueError):
+        bulk_api.apply_plan(None, plan)
+    with pytest.raises(ValueError):
+        bulk_api.apply_plan(project_id, bulk_api.make_plan(['f'], [('u', 'USER', ['VIEW'])], operation='merge'))
+    with pytest.raises(TypeError):
+        bulk_api.apply_plan(project_id, bulk_api.make_plan(['f'], [('u', 'USER', 5)]))
+    assert own_stand_in.stats() == {}
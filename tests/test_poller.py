@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Tests of the Poller repeating requests answered with 202 Accepted."""
+from email.utils import formatdate
+import time
+import pytest
+from PyForge import Poller, ForgeStandIn, ModelDerivativeApi
+
+
+class Response():
+    """Minimal response with a status code and headers."""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def make_send(statuses):
+    """Make a send function answering with the given status codes in turn, recording the responses."""
+    responses = [Response(status) for status in statuses]
+    sent = []
+
+    def send():
+        resp = responses[len(sent)]
+        sent.append(resp)
+        return resp
+
+    return send, sent
+
+
+def test_delays_grow_up_to_the_maximum():
+    poller = Poller(initial_delay=1, max_delay=5, multiplier=2, jitter=0)
+
+    assert [poller.next_delay(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+    assert poller.next_delay(0, Response(202, {'Retry-After' : '3'})) == 3
+    assert 0.5 <= Poller(initial_delay=1, jitter=0.5).next_delay(0) <= 1
+
+
+@pytest.mark.parametrize('value, expected', [('2', 2.0), ('-1', 0.0), ('soon', None), (None, None)])
+def test_retry_after_in_seconds(value, expected):
+    headers = {} if value is None else {'Retry-After' : value}
+
+    assert Poller.retry_after(Response(202, headers)) == expected
+
+
+def test_retry_after_as_date():
+    delay = Poller.retry_after(Response(202, {'Retry-After' : formatdate(time.time() + 60, usegmt=True)}))
+
+    assert 55 < delay <= 60
+
+
+def test_poll_repeats_until_the_response_is_ready():
+    send, sent = make_send([202, 202, 200])
+
+    resp = Poller(initial_delay=0.01, jitter=0).poll(send)
+
+    assert resp.status_code == 200
+    assert [r.closed for r in sent] == [True, True, False]
+
+
+def test_poll_gives_up_at_the_deadline():
+    send, sent = make_send([202] * 10)
+
+    with pytest.raises(TimeoutError):
+        Poller(initial_delay=0.05, jitter=0, deadline=0.1).poll(send)
+    assert len(sent) == 2
+
+
+def test_poll_many_polls_all_requests():
+    failing = {'n' : 0}
+
+    def fail():
+        failing['n'] += 1
+        raise ConnectionError("Unreachable.")
+
+    sends = {key : make_send([202] * key + [200])[0] for key in range(5)}
+    sends['failing'] = fail
+
+    results = Poller(initial_delay=0.01, jitter=0).poll_many(sends, max_workers=2)
+
+    assert sorted(key for key, resp in results.items() if getattr(resp, 'status_code', None) == 200) == list(range(5))
+    assert isinstance(results['failing'], ConnectionError)
+    assert failing['n'] == 1
+
+
+def test_model_views_in_process(data):
+    with ForgeStandIn(data, processing_polls=2) as stand_in:
+        api = ModelDerivativeApi('token', base_url=stand_in.url + 'modelderivative/v2/designdata/',
+                                 poller=Poller(initial_delay=0.01, jitter=0))
+        urn = data.version(0, (), 0, 1)['id']
+        guids = [view['guid'] for view in api.get_metadata_ids(urn)['metadata']]
+
+        trees, errors = api.get_object_trees([(urn, guid) for guid in guids])
+
+        assert not errors
+        assert sorted(trees) == sorted((urn, guid) for guid in guids)
+        assert stand_in.stats()['GET /modelderivative/v2/designdata/:id/metadata/:id'] == {202 : 4, 200 : 2}
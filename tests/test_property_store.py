@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Tests of the PropertyStore, with the properties of the ForgeStandIn and mixed typed values."""
+import importlib
+import pytest
+from PyForge import PropertyStore, ModelDerivativeApi, TransportRegistry
+
+MIXED = [{'objectid' : 1, 'name' : 'a', 'externalId' : 'x1',
+          'properties' : {'Data' : {'Count' : 1, 'Ratio' : 0.5, 'Mark' : 'A', 'Tags' : ['x']}}},
+         {'objectid' : 2, 'name' : 'b', 'externalId' : 'x2',
+          'properties' : {'Data' : {'Count' : 1.0, 'Ratio' : 0.5, 'Mark' : True, 'Tags' : [1]}}},
+         {'objectid' : 3, 'name' : 'c', 'externalId' : 'x3',
+          'properties' : {'Data' : {'Count' : True, 'Mark' : 1, 'Tags' : [1.0]}, 'Other' : {'Flag' : None}}},
+         {'objectid' : 4, 'name' : 'd', 'externalId' : 'x4',
+          'properties' : {'Data' : {'Count' : 1, 'Ratio' : 2 ** 70, 'Tags' : [True]}}}]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def find_backend(request, monkeypatch):
+    """Run a test with and without NumPy."""
+    if request.param == 'python':
+        monkeypatch.setattr(importlib.import_module('PyForge.PropertyStore'), 'numpy', None)
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def collection(stand_in, urls, data):
+    urn = data.version(0, (), 1, 1)['id']
+    api = ModelDerivativeApi('token', base_url=urls['derivative'], registry=TransportRegistry())
+    guid = api.get_metadata_ids(urn)['metadata'][0]['guid']
+    return api.get_object_properties(urn, guid)['collection']
+
+
+def test_store_round_trips_the_stand_in_collection(collection, data):
+    store = PropertyStore.from_collection(collection)
+
+    assert len(store) == data.objects
+    assert store.to_collection() == collection
+    assert [store.get_object(obj['objectid']) for obj in collection] == collection
+    assert store.categories() == ['Identity Data', 'Dimensions', 'Constraints']
+    assert store.column_values('Identity Data', 'Mark') == [str(i) for i in range(data.objects)]
+    assert store.find('Identity Data', 'Mark', '3') == [5]
+
+
+def test_store_round_trips_mixed_types():
+    store = PropertyStore.from_collection(MIXED)
+    collection = store.to_collection()
+
+    assert collection == MIXED
+    for restored, obj in zip(collection, MIXED):
+        for category, values in obj['properties'].items():
+            for name, value in values.items():
+                assert type(restored['properties'][category][name]) is type(value)
+
+    assert store.column_values('Other', 'Flag') == [None, None, None, None]
+    assert store.nbytes() > 0
+
+
+def test_find_keeps_types_apart(find_backend):
+    store = PropertyStore.from_collection(MIXED)
+
+    assert store.find('Data', 'Count', 1) == [1, 4]
+    assert store.find('Data', 'Count', 1.0) == [2]
+    assert store.find('Data', 'Count', True) == [3]
+    assert store.find('Data', 'Ratio', 0.5) == [1, 2]
+    assert store.find('Data', 'Ratio', 2 ** 70) == [4]
+    assert store.find('Data', 'Mark', 1) == [3]
+    assert store.find('Data', 'Tags', [1]) == [2]
+    assert store.find('Data', 'Tags', [1.0]) == [3]
+    assert store.find('Data', 'Tags', [True]) == [4]
+    assert store.find('Data', 'Missing', 1) == []
+    assert store.find('Data', 'Mark', 'B') == []
+
+
+def test_typed_columns_stay_typed():
+    store = PropertyStore.from_collection([{'objectid' : i, 'properties' : {'Data' : {'Int' : i, 'Float' : i / 2}}}
+                                           for i in range(10)])
+
+    assert store.get_column('Data', 'Int').kind == 'int'
+    assert store.get_column('Data', 'Float').kind == 'float'
+    assert store.find('Data', 'Int', 4) == [4]
+    assert store.find('Data', 'Float', 4.5) == [9]
+
+
+@pytest.mark.parametrize('obj, error', [({'name' : 'no id'}, ValueError),
+                                        ({'objectid' : 1}, ValueError),
+                                        ({'objectid' : '9'}, TypeError),
+                                        ({'objectid' : 9.0}, TypeError),
+                                        ({'objectid' : 9, 'properties' : ['Data']}, TypeError),
+                                        ({'objectid' : 9, 'properties' : {'Data' : {'Count' : 2}, 'Bad' : 'x'}},
+                                         TypeError)])
+def test_append_rejects_invalid_objects_without_changes(obj, error):
+    store = PropertyStore.from_collection(MIXED)
+    before = store.to_collection()
+    columns = len(store.columns)
+
+    with pytest.raises(error):
+        store.append(obj)
+
+    assert store.to_collection() == before
+    assert len(store.columns) == columns
+    assert len(store) == len(MIXED)
+
+
+def test_missing_properties_raise_key_errors():
+    store = PropertyStore.from_collection(MIXED)
+
+    with pytest.raises(KeyError):
+        store.get_object(99)
+    with pytest.raises(KeyError):
+        store.column_values('Data', 'Missing')
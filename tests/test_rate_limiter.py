@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Tests of the TokenBucket and the RateLimiter pacing requests per endpoint family."""
+import asyncio
+import importlib
+import pytest
+from PyForge import RateLimiter, TokenBucket, TransportRegistry, HubsApi, endpoint_family
+
+
+class Clock():
+    """Stand-in for the time module, with a clock that only moves when slept on."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(importlib.import_module('PyForge.RateLimiter'), 'time', clock)
+    return clock
+
+
+@pytest.mark.parametrize('url, family', [
+    ('https://developer.api.autodesk.com/data/v1/projects/b.1/folders', 'data/v1'),
+    ('https://developer.api.autodesk.com/project/v1/hubs', 'project/v1'),
+    ('/bim360/admin/v1/projects/1/users', 'bim360/admin'),
+    ('/bim360/docs/v1/projects/1/folders/2/permissions', 'bim360/docs'),
+    ('/modelderivative/v2/designdata/abc/metadata', 'modelderivative'),
+    ('https://developer.api.autodesk.com/', '')])
+def test_endpoint_family(url, family):
+    assert endpoint_family(url) == family
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+
+
+def test_token_bucket_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        TokenBucket(1, burst=0)
+    assert TokenBucket(0.5).burst == 1
+
+
+def test_families_have_their_own_buckets(clock):
+    limiter = RateLimiter({'data/v1' : (1, 1), 'hq' : (1, 1)})
+
+    assert limiter.acquire('/data/v1/projects/a') == 0.0
+    assert limiter.acquire('/hq/v1/accounts/a') == 0.0
+    assert limiter.acquire('/data/v1/projects/b') == pytest.approx(1.0)
+    assert limiter.acquire('/bim360/admin/v1/projects') == 0.0
+    assert clock.slept == [pytest.approx(1.0)]
+    assert limiter.stats() == {'data/v1' : {'waits' : 1, 'waited' : pytest.approx(1.0)}}
+
+
+def test_default_limit_and_set_limit(clock):
+    limiter = RateLimiter({}, default_limit=(1, 1))
+
+    limiter.reserve('/hq/v1/accounts')
+    assert limiter.reserve('/hq/v1/accounts') == pytest.approx(1.0)
+
+    limiter.set_limit('hq', None)
+    limiter.default_limit = None
+    assert limiter.reserve('/hq/v1/accounts') == 0.0
+
+    limiter.set_limit('hq', 4, burst=1)
+    limiter.reserve('/hq/v1/accounts')
+    assert limiter.reserve('/hq/v1/accounts') == pytest.approx(0.25)
+
+
+def test_acquire_async_waits():
+    limiter = RateLimiter({'hq' : (50, 1)})
+
+    async def acquire_all():
+        return [await limiter.acquire_async('/hq/v1/accounts') for _ in range(3)]
+
+    delays = asyncio.run(acquire_all())
+
+    assert delays[0] == 0.0
+    assert all(delay > 0 for delay in delays[1:])
+
+
+def test_requests_are_only_limited_when_asked_for(urls):
+    registry = TransportRegistry(rate_limiter=RateLimiter({'project/v1' : (5, 1)}))
+
+    unlimited = HubsApi('token', base_url=urls['project'], timeout=5, registry=registry)
+    for _ in range(3):
+        unlimited.get_hubs()
+    assert unlimited.http.rate_limiter is None
+    assert registry.rate_limiter.stats() == {}
+
+    limited = HubsApi('token', base_url=urls['project'], timeout=5, registry=registry, rate_limiter=True)
+    for _ in range(3):
+        limited.get_hubs()
+    assert limited.http.rate_limiter is registry.rate_limiter
+    assert registry.rate_limiter.stats()['project/v1']['waits'] == 2
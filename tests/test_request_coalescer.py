@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Tests of the RequestCoalescer merging identical concurrent GET requests."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from PyForge import RequestCoalescer, ForgeStandIn, StandInData, HubsApi, TransportRegistry
+
+
+class BlockingSend():
+    """Send function answering every request once it is released, counting the requests it received."""
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.error = error
+
+    def __call__(self, request, **kwargs):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers['ETag'] = '"v1"'
+        resp._content = b'{"data": []}'
+        resp.request = request
+        return resp
+
+
+def prepare(url='https://developer.api.autodesk.com/project/v1/hubs', token='token'):
+    return requests.Request('GET', url, headers={'Authorization' : "Bearer {}".format(token)}).prepare()
+
+
+def send_concurrently(coalescer, send, requests_to_send):
+    """Send the first request, wait until it is in flight, then send the others and release them all."""
+    with ThreadPoolExecutor(len(requests_to_send)) as executor:
+        futures = [executor.submit(coalescer.send, send, requests_to_send[0])]
+        send.started.wait(5)
+        futures += [executor.submit(coalescer.send, send, request) for request in requests_to_send[1:]]
+        while coalescer.stats()['sent'] + coalescer.stats()['coalesced'] < len(requests_to_send):
+            threading.Event().wait(0.01)
+        send.release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_identical_requests_share_one_response():
+    coalescer = RequestCoalescer()
+    send = BlockingSend()
+    sent = [prepare() for _ in range(5)]
+
+    responses = send_concurrently(coalescer, send, sent)
+
+    assert send.calls == 1
+    assert coalescer.stats() == {'sent' : 1, 'coalesced' : 4, 'in_flight' : 0}
+    assert [resp.content for resp in responses] == [b'{"data": []}'] * 5
+    assert [resp.request for resp in responses] == sent
+
+    responses[1].headers['ETag'] = '"changed"'
+    assert responses[0].headers['ETag'] == '"v1"'
+
+
+def test_requests_with_other_tokens_or_urls_are_not_merged():
+    coalescer = RequestCoalescer()
+    send = BlockingSend()
+
+    send_concurrently(coalescer, send, [prepare(), prepare(token='other'),
+                                        prepare('https://developer.api.autodesk.com/project/v1/hubs/b.1/projects')])
+
+    assert send.calls == 3
+    assert coalescer.stats() == {'sent' : 3, 'coalesced' : 0, 'in_flight' : 0}
+    assert RequestCoalescer.make_key(prepare()) == RequestCoalescer.make_key(prepare())
+    assert 'token' not in repr(RequestCoalescer.make_key(prepare()))
+
+
+def test_errors_are_raised_for_every_caller():
+    coalescer = RequestCoalescer()
+    send = BlockingSend(error=requests.ConnectionError("Connection reset."))
+
+    results = send_concurrently(coalescer, send, [prepare() for _ in range(3)])
+
+    assert send.calls == 1
+    assert all(isinstance(result, requests.ConnectionError) for result in results)
+    assert coalescer.stats()['in_flight'] == 0
+
+
+def test_requests_after_a_response_are_sent_again():
+    coalescer = RequestCoalescer()
+    send = BlockingSend()
+    send.release.set()
+
+    coalescer.send(send, prepare())
+    coalescer.send(send, prepare())
+
+    assert send.calls == 2
+
+
+def test_apis_coalesce_concurrent_requests():
+    with ForgeStandIn(StandInData(projects=1), latency=0.2, processing_polls=0) as stand_in:
+        registry = TransportRegistry()
+        api = HubsApi('token', base_url=stand_in.url + 'project/v1/', timeout=5, registry=registry, coalesce=True)
+        barrier = threading.Barrier(8)
+
+        def get_hubs():
+            barrier.wait()
+            return api.get_hubs()
+
+        with ThreadPoolExecutor(8) as executor:
+            hubs = list(executor.map(lambda _: get_hubs(), range(8)))
+
+        stats = registry.coalescer.stats()
+
+        assert all(result == hubs[0] for result in hubs)
+        assert stats['sent'] + stats['coalesced'] == 8
+        assert stats['coalesced'] > 0
+        assert stand_in.stats()['GET /project/v1/hubs'] == {200 : stats['sent']}
+
+
+def test_coalescing_is_off_by_default(urls):
+    assert HubsApi('token', base_url=urls['project'], registry=TransportRegistry()).http.coalescer is None
+    own = RequestCoalescer()
+    assert HubsApi('token', base_url=urls['project'], registry=TransportRegistry(), coalesce=own).http.coalescer is own
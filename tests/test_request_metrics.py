@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests of the RequestMetrics recorded per endpoint template, against the ForgeStandIn."""
+import pytest
+import requests
+from PyForge import RequestMetrics, TransportRegistry, FoldersApi, HubsApi, endpoint_template
+
+
+@pytest.mark.parametrize('url, template', [
+    ('https://developer.api.autodesk.com/project/v1/hubs', '/project/v1/hubs'),
+    ('https://developer.api.autodesk.com/project/v1/hubs/b.1234abcd/projects?page[limit]=5',
+     '/project/v1/hubs/:id/projects'),
+    ('/data/v1/projects/b.abc/folders/urn:adsk.wipprod:fs.folder:co.Xy1/contents',
+     '/data/v1/projects/:id/folders/:id/contents'),
+    ('/modelderivative/v2/designdata/dXJuOmFkc2sud2lwcHJvZA/metadata/4f981e94-8241-4eaf-b08b-cd337c6b8b1f/properties',
+     '/modelderivative/v2/designdata/:id/metadata/:id/properties'),
+    ('/bim360/admin/v1/projects/1234/users', '/bim360/admin/v1/projects/:id/users')])
+def test_endpoint_template(url, template):
+    assert endpoint_template(url) == template
+
+
+def test_record_groups_by_template():
+    metrics = RequestMetrics(buckets=(0.1, 1.0))
+
+    metrics.record('GET', '/project/v1/hubs/b.1/projects', 200, 0.05, nbytes=10)
+    metrics.record('GET', '/project/v1/hubs/b.2/projects', 404, 0.5, retries=2)
+    metrics.record('GET', '/project/v1/hubs/b.3/projects', elapsed=2.0)
+    metrics.record('GET', '/project/v1/hubs/b.3/projects', 200, 0.0, from_cache=True)
+    metrics.record('POST', '/project/v1/hubs/b.3/projects', 201, 0.05)
+
+    snapshot = metrics.snapshot()
+    entry = snapshot['GET /project/v1/hubs/:id/projects']
+
+    assert sorted(snapshot) == ['GET /project/v1/hubs/:id/projects', 'POST /project/v1/hubs/:id/projects']
+    assert entry['requests'] == 4
+    assert entry['errors'] == 1
+    assert entry['status'] == {'2xx' : 2, '4xx' : 1}
+    assert entry['retries'] == 2
+    assert entry['bytes'] == 10
+    assert entry['cache_hits'] == 1
+    assert entry['latency'] == {'buckets' : {0.1 : 2, 1.0 : 3, float('inf') : 4}, 'sum' : 2.55, 'count' : 4}
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_export():
+    metrics = RequestMetrics(buckets=(0.1,))
+    metrics.record('GET', '/project/v1/hubs', 200, 0.05, nbytes=3)
+    metrics.record('GET', '/project/v1/hubs', elapsed=0.2)
+
+    text = metrics.to_prometheus(prefix='test')
+
+    assert 'test_requests_total{method="GET",endpoint="/project/v1/hubs",status="2xx"} 1\n' in text
+    assert 'test_requests_total{method="GET",endpoint="/project/v1/hubs",status="error"} 1\n' in text
+    assert 'test_response_bytes_total{method="GET",endpoint="/project/v1/hubs"} 3\n' in text
+    assert 'test_request_duration_seconds_bucket{method="GET",endpoint="/project/v1/hubs",le="0.1"} 1\n' in text
+    assert 'test_request_duration_seconds_bucket{method="GET",endpoint="/project/v1/hubs",le="+Inf"} 2\n' in text
+    assert 'test_request_duration_seconds_count{method="GET",endpoint="/project/v1/hubs"} 2\n' in text
+    assert text.count('# TYPE') == 5
+
+
+def test_sessions_record_their_requests(urls, data):
+    registry = TransportRegistry()
+    folders_api = FoldersApi('token', base_url=urls['data'], timeout=5, registry=registry)
+    project_id = data.project(0)['id']
+
+    folders_api.get_folder_contents(project_id, data.folder_id(0, ()))
+    folders_api.get_folder_contents(project_id, data.folder_id(0, (1,)))
+    with pytest.raises(requests.HTTPError):
+        folders_api.get_folder(project_id, data.folder_id(0, (9,)))
+
+    snapshot = registry.metrics.snapshot()
+
+    assert snapshot['GET /data/v1/projects/:id/folders/:id/contents']['status'] == {'2xx' : 2}
+    assert snapshot['GET /data/v1/projects/:id/folders/:id/contents']['bytes'] > 0
+    assert snapshot['GET /data/v1/projects/:id/folders/:id']['status'] == {'4xx' : 1}
+
+
+def test_metrics_can_be_disabled(urls):
+    registry = TransportRegistry()
+
+    HubsApi('token', base_url=urls['project'], timeout=5, registry=registry, metrics=False).get_hubs()
+    assert registry.metrics.snapshot() == {}
+
+    own = RequestMetrics()
+    HubsApi('token', base_url=urls['project'], timeout=5, registry=registry, metrics=own).get_hubs()
+    assert own.snapshot()['GET /project/v1/hubs']['requests'] == 1
+    assert registry.metrics.snapshot() == {}
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Tests of the ResponseCache answering GET requests from memory, against the ForgeStandIn."""
+import importlib
+import pytest
+import requests
+from PyForge import (ResponseCache, ForgeStandIn, StandInData, HubsApi, FoldersApi, PermissionApi, PostPermissionApi,
+                     TransportRegistry)
+
+
+class Clock():
+    """Stand-in for the time module, with a clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(importlib.import_module('PyForge.ResponseCache'), 'time', clock)
+    return clock
+
+
+def send(request, **kwargs):
+    """Send function answering every request with its own url."""
+    resp = requests.Response()
+    resp.status_code = 404 if 'missing' in request.url else 200
+    resp._content = request.url.encode('utf8')
+    resp.request = request
+    resp.url = request.url
+    return resp
+
+
+def get(cache, url):
+    return cache.send(send, requests.Request('GET', url).prepare())
+
+
+def test_ttl_per_endpoint_template():
+    cache = ResponseCache(ttls={'/project/v1/hubs' : 300, '/:id/projects' : 60}, default_ttl=5)
+
+    assert cache.get_ttl('https://developer.api.autodesk.com/project/v1/hubs') == 300
+    assert cache.get_ttl('https://developer.api.autodesk.com/project/v1/hubs/b.1/projects?page[limit]=5') == 60
+    assert cache.get_ttl('https://developer.api.autodesk.com/project/v1/hubs/b.1') == 5
+    assert ResponseCache().get_ttl('https://developer.api.autodesk.com/data/v1/projects/b.1/folders/f.1') == 60
+    assert ResponseCache().get_ttl('https://developer.api.autodesk.com/data/v1/projects/b.1/folders/f.1/contents') == 0
+
+
+def test_responses_expire(clock):
+    cache = ResponseCache(ttls={}, default_ttl=10)
+
+    first = get(cache, 'https://host/a')
+    second = get(cache, 'https://host/a')
+
+    assert second.from_cache is True
+    assert second.content == first.content
+    assert not getattr(first, 'from_cache', False)
+
+    clock.now += 11
+    assert not getattr(get(cache, 'https://host/a'), 'from_cache', False)
+    assert cache.stats() == {'entries' : 1, 'hits' : 1, 'misses' : 2, 'evictions' : 0, 'invalidations' : 0}
+
+
+def test_errors_and_uncached_endpoints_are_not_stored():
+    cache = ResponseCache(ttls={'/a' : 10})
+
+    get(cache, 'https://host/missing/a')
+    get(cache, 'https://host/b')
+
+    assert cache.stats()['entries'] == 0
+
+
+def test_least_recently_used_responses_are_evicted():
+    cache = ResponseCache(max_entries=2, ttls={}, default_ttl=10)
+
+    for path in ['a', 'b', 'a', 'c']:
+        get(cache, 'https://host/' + path)
+
+    assert cache.stats()['evictions'] == 1
+    assert get(cache, 'https://host/a').from_cache is True
+    assert not getattr(get(cache, 'https://host/b'), 'from_cache', False)
+
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
+
+
+def test_invalidation():
+    cache = ResponseCache(ttls={}, default_ttl=10)
+    removed = []
+    cache.add_invalidation_hook(removed.extend)
+
+    for path in ['p/b.1/f/1', 'p/b.1/f/2', 'p/b.2/f/1', 'q/1']:
+        get(cache, 'https://host/' + path)
+
+    assert cache.invalidate('https://host/p/b.1/') == 2
+    assert cache.invalidate_containing('b.2') == 1
+    assert cache.invalidate('https://host/none') == 0
+    assert removed == ['https://host/p/b.1/f/1', 'https://host/p/b.1/f/2', 'https://host/p/b.2/f/1']
+    assert cache.invalidate() == 1
+    assert cache.stats()['invalidations'] == 4
+
+
+@pytest.mark.parametrize('method, url, removed', [
+    ('GET', 'https://host/p/1/f/1', []),
+    ('PATCH', 'https://host/p/1/f/1', ['https://host/p/1/f/1', 'https://host/p/1/f/1/permissions',
+                                        'https://host/p/1/f/1?x=1']),
+    ('POST', 'https://host/p/1/f/1/permissions:batch-update', ['https://host/p/1/f/1/permissions',
+                                                               'https://host/p/1/f/1', 'https://host/p/1/f/1?x=1']),
+    ('DELETE', 'https://host/p/1/f/1/permissions', ['https://host/p/1/f/1/permissions', 'https://host/p/1/f/1',
+                                                   'https://host/p/1/f/1?x=1'])])
+def test_invalidate_for_unsafe_requests(method, url, removed):
+    cache = ResponseCache(ttls={}, default_ttl=10)
+    cached = ['https://host/p/1', 'https://host/p/1/f/1', 'https://host/p/1/f/1?x=1', 'https://host/p/1/f/1/permissions',
+              'https://host/p/1/f/2', 'https://host/p/2/f/1']
+    for cached_url in cached:
+        get(cache, cached_url)
+
+    assert cache.invalidate_for(requests.Request(method, url).prepare()) == len(removed)
+    assert cache.stats()['entries'] == len(cached) - len(removed)
+
+
+def test_apis_answer_lookups_from_memory(stand_in, urls, data):
+    registry = TransportRegistry()
+    hubs_api = HubsApi('token', base_url=urls['project'], timeout=5, registry=registry, cache_responses=True)
+    folders_api = FoldersApi('token', base_url=urls['data'], timeout=5, registry=registry, cache_responses=True)
+    project_id = data.project(0)['id']
+    served = stand_in.stats().get('GET /project/v1/hubs', {}).get(200, 0)
+
+    hubs = hubs_api.get_hubs()
+    assert hubs_api.get_hubs() == hubs
+    hubs[0]['id'] = 'changed'
+    assert hubs_api.get_hubs()[0]['id'] == data.hub_id
+    assert stand_in.stats()['GET /project/v1/hubs'][200] == served + 1
+
+    folders_api.get_folder(project_id, data.folder_id(0, ()))
+    folders_api.get_folder(project_id, data.folder_id(0, ()))
+    folders_api.get_folder_contents(project_id, data.folder_id(0, ()))
+    folders_api.get_folder_contents(project_id, data.folder_id(0, ()))
+    assert registry.response_cache.stats()['hits'] == 3
+    assert registry.response_cache.stats()['entries'] == 2
+    assert HubsApi('token', base_url=urls['project'], registry=registry).http.response_cache is None
+
+
+def test_posts_invalidate_the_cached_permissions():
+    data = StandInData(projects=1, depth=1, fanout=1, users=5)
+
+    with ForgeStandIn(data, processing_polls=0) as stand_in:
+        cache = ResponseCache(ttls={'/folders/:id/permissions' : 60})
+        base_url = stand_in.url + 'bim360/docs/v1/projects/'
+        get_api = PermissionApi('token', base_url=base_url, timeout=5, registry=TransportRegistry(), cache_responses=cache)
+        post_api = PostPermissionApi('token', base_url=base_url, timeout=5, registry=TransportRegistry(),
+                                     cache_responses=cache)
+        project_id = data.project(0)['id']
+        folder_id = data.folder_id(0, ())
+
+        before = get_api.get_folder_permission(project_id, folder_id)
+        assert get_api.get_folder_permission(project_id, folder_id) == before
+        post_api.post_folder_permissions(project_id, folder_id, 'create',
+                                         [{'subjectId' : 'new', 'subjectType' : 'USER', 'actions' : ['VIEW']}])
+        after = get_api.get_folder_permission(project_id, folder_id)
+
+        assert len(after) == len(before) + 1
+        assert cache.stats()['invalidations'] == 1
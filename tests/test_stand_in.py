@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Tests of the ForgeStandIn serving synthetic Autodesk Forge data, with latency and fault injection."""
+import base64
+import time
+import pytest
+import requests
+from PyForge import ForgeStandIn, StandInData, ModelDerivativeApi, TransportRegistry
+
+AUTH = {'Authorization' : 'Bearer token'}
+
+
+def encode(urn, padding=True):
+    encoded = base64.urlsafe_b64encode(urn.encode('utf8')).decode('utf8')
+    return encoded if padding else encoded.rstrip('=')
+
+
+def test_data_is_deterministic():
+    first = StandInData(projects=2, users=5)
+    second = StandInData(projects=2, users=5)
+
+    assert first.project(1) == second.project(1)
+    assert first.user(1, 3) == second.user(1, 3)
+    assert first.version(0, (1, 2), 0, 1) == second.version(0, (1, 2), 0, 1)
+    assert first.parse_version_id(first.version(0, (1, 2), 0, 1)['id']) == first.version(0, (1, 2), 0, 1)
+    assert first.parse_folder_id(first.folder_id(1, (0, 3))) == (1, (0, 3))
+    assert first.parse_folder_id(first.folder_id(2, ())) is None
+
+
+def test_derivative_urns_ignore_the_base64_padding(data):
+    urn = encode(data.version(0, (), 0, 1)['id'])
+    assert urn.endswith('=')
+    unpadded = urn.rstrip('=')
+    guid = data.view_guids(urn)[0]
+
+    assert data.view_guids(unpadded) == data.view_guids(urn)
+    assert data.properties(unpadded, guid) == data.properties(urn, guid)
+    assert data.object_tree(unpadded, guid) == data.object_tree(urn, guid)
+    assert data.properties(urn, 'not-a-view') is None
+
+
+def test_padded_api_urns_match_the_derivative_ids_of_versions(urls, data):
+    api = ModelDerivativeApi('token', base_url=urls['derivative'], timeout=5, registry=TransportRegistry())
+    version = data.version(0, (), 1, 1)
+    derivative_id = version['relationships']['derivatives']['data']['id']
+
+    assert api.get_metadata_ids(version['id']) == data.metadata(derivative_id)['data']
+
+
+def test_requests_need_a_bearer_token(stand_in, urls):
+    assert requests.get(urls['project'] + 'hubs').status_code == 401
+    assert requests.get(urls['project'] + 'hubs', headers=AUTH).status_code == 200
+
+    token = requests.post(urls['authentication'], data={'grant_type' : 'client_credentials'}).json()
+    assert token['access_token'].startswith('stand-in-')
+    assert token['expires_in'] > 0
+
+
+def test_unknown_resources_are_not_found(urls, data):
+    assert requests.get(urls['project'] + 'unknown', headers=AUTH).status_code == 404
+    assert requests.get(urls['data'] + data.project(0)['id'] + '/folders/' + data.folder_id(0, (9,)),
+                        headers=AUTH).status_code == 404
+    assert requests.get(urls['data'] + 'b.unknown/folders/' + data.folder_id(0, ()), headers=AUTH).status_code == 404
+
+
+def test_model_views_are_processing_for_a_number_of_polls():
+    data = StandInData(projects=1, objects=3)
+
+    with ForgeStandIn(data, processing_polls=2) as stand_in:
+        urn = encode(data.version(0, (), 0, 1)['id'])
+        guid = data.view_guids(urn)[0]
+        url = "{}modelderivative/v2/designdata/{}/metadata/{}/properties".format(stand_in.url, urn, guid)
+
+        assert [requests.get(url, headers=AUTH).status_code for _ in range(3)] == [202, 202, 200]
+        assert requests.get(url, headers=AUTH).json()['data']['collection'] == data.properties(urn, guid)['data']['collection']
+
+        stand_in.reset_stats()
+        assert stand_in.stats() == {}
+        assert requests.get(url, headers=AUTH).status_code == 202
+
+
+def test_fault_injection():
+    with ForgeStandIn(StandInData(projects=1), throttle_rate=0.3, error_rate=0.2, retry_after=7, seed=3) as stand_in:
+        with requests.Session() as session:
+            responses = [session.get(stand_in.url + 'project/v1/hubs', headers=AUTH) for _ in range(400)]
+
+        statuses = stand_in.stats()['GET /project/v1/hubs']
+
+        assert sum(statuses.values()) == 400
+        assert 80 <= statuses[429] <= 160
+        assert 40 <= sum(statuses.get(status, 0) for status in (500, 502, 503)) <= 120
+        assert set(statuses) <= {200, 429, 500, 502, 503}
+        assert all(resp.headers['Retry-After'] == '7' for resp in responses if resp.status_code == 429)
+
+
+def test_latency():
+    with ForgeStandIn(StandInData(projects=1), latency=0.05) as stand_in:
+        started = time.perf_counter()
+        requests.get(stand_in.url + 'project/v1/hubs', headers=AUTH)
+
+        assert time.perf_counter() - started >= 0.05
+
+
+@pytest.mark.parametrize('rates', [{'throttle_rate' : -0.1}, {'error_rate' : 1.5}])
+def test_rates_are_validated(rates):
+    with pytest.raises(ValueError):
+        ForgeStandIn(StandInData(projects=1), **rates)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Tests of the TimeoutPolicy, and of the timeouts the sessions apply with it."""
+import pytest
+from PyForge import TimeoutPolicy, ModelDerivativeApi, HubsApi, TransportRegistry, endpoint_template
+
+DERIVATIVE = 'https://developer.api.autodesk.com/modelderivative/v2/designdata/dXJuOmFkc2s/'
+GUID = '4f981e94-8241-4eaf-b08b-cd337c6b8b1f'
+
+
+class RecordingPolicy(TimeoutPolicy):
+    """TimeoutPolicy recording the urls and size hints it was asked for."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = []
+
+    def get_timeout(self, url, size_hint=None):
+        self.requests.append((url, size_hint))
+        return super().get_timeout(url, size_hint)
+
+
+@pytest.mark.parametrize('url, timeouts', [
+    ('https://developer.api.autodesk.com/project/v1/hubs', (1, 2)),
+    (DERIVATIVE + 'manifest', (1, 2)),
+    (DERIVATIVE + 'metadata/' + GUID, (3.05, 60.0)),
+    (DERIVATIVE + 'metadata/' + GUID + '/properties?forceget=true', (3.05, 120.0)),
+    (DERIVATIVE + 'manifest/urn%3Aadsk.viewing%3Afs.file%3Aabc', (3.05, 60.0))])
+def test_template_timeouts(url, timeouts):
+    assert TimeoutPolicy(connect=1, read=2).get_timeout(url) == timeouts
+
+
+def test_custom_templates_use_the_longest_match():
+    policy = TimeoutPolicy(connect=1, read=2, templates={'/hubs' : (1, 5), '/:id/projects' : (1, 10)})
+
+    assert policy.get_timeout('/project/v1/hubs') == (1, 5)
+    assert policy.get_timeout('/project/v1/hubs/b.1/projects') == (1, 10)
+    assert policy.get_timeout(DERIVATIVE + 'metadata/' + GUID) == (1, 2)
+
+
+def test_size_hint_extends_the_read_timeout():
+    policy = TimeoutPolicy(connect=1, read=2, bytes_per_second=1000)
+
+    assert policy.get_timeout('/project/v1/hubs', size_hint=5000) == (1, 7)
+    assert policy.get_timeout('/project/v1/hubs', size_hint=0) == (1, 2)
+
+
+def test_adaptive_read_timeouts():
+    policy = TimeoutPolicy(connect=1, read=2, adaptive=True, percentile=0.5, multiplier=2, min_read=0.5, max_read=30,
+                           min_samples=4, window=4, bytes_per_second=1000)
+    url = '/project/v1/hubs/b.1/projects'
+
+    for elapsed in [4, 5, 6]:
+        policy.observe(url, elapsed)
+    assert policy.get_timeout(url) == (1, 2)
+    assert policy.stats() == {'/project/v1/hubs/:id/projects' : {'samples' : 3, 'read' : None}}
+
+    policy.observe(url, 7)
+    assert policy.get_timeout('/project/v1/hubs/b.2/projects') == (1, 12)
+    assert policy.get_timeout(url, size_hint=100000) == (1, 30)
+
+    for elapsed in [0.1] * 4:
+        policy.observe(url, elapsed)
+    assert policy.get_timeout(url) == (1, 2)
+
+    for elapsed in [100] * 4:
+        policy.observe(url, elapsed)
+    assert policy.get_timeout(url) == (1, 30)
+
+
+def test_adaptive_timeouts_never_drop_below_the_template_timeouts():
+    policy = TimeoutPolicy(adaptive=True, min_samples=1)
+    url = DERIVATIVE + 'metadata/' + GUID
+
+    policy.observe(url, 0.01)
+
+    assert policy.get_timeout(url) == (3.05, 60.0)
+
+
+def test_observe_is_ignored_without_adaptive_mode():
+    policy = TimeoutPolicy()
+    policy.observe('/project/v1/hubs', 10)
+
+    assert policy.stats() == {}
+
+
+def test_sessions_pass_urls_and_size_hints(urls, data):
+    policy = RecordingPolicy(connect=5, read=5, adaptive=True, min_samples=1)
+    api = ModelDerivativeApi('token', base_url=urls['derivative'], registry=TransportRegistry(), timeout_policy=policy)
+    urn = data.version(0, (), 0, 1)['id']
+
+    guid = api.get_metadata_ids(urn)['metadata'][0]['guid']
+    api.get_object_properties(urn, guid, size_hint=4096)
+
+    assert [(endpoint_template(url), size_hint) for url, size_hint in policy.requests] == [
+        ('/modelderivative/v2/designdata/:id/metadata', None),
+        ('/modelderivative/v2/designdata/:id/metadata/:id/properties', 4096)]
+    assert policy.stats()['/modelderivative/v2/designdata/:id/metadata/:id/properties']['samples'] == 1
+
+
+def test_default_policy_uses_the_timeout_of_the_api(urls):
+    api = HubsApi('token', base_url=urls['project'], timeout=7, registry=TransportRegistry())
+
+    assert api.http.timeout_policy.get_timeout(urls['project'] + 'hubs') == (7, 7)
+    assert api.http.timeout_policy.get_timeout(DERIVATIVE + 'metadata/' + GUID) == (3.05, 60.0)
+    assert api.get_hubs()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Tests of the TokenProvider, its single-flight refresh and the replay of requests rejected with a 401."""
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+import requests
+from PyForge import TokenProvider, OAuth2Negotiator, HubsApi, TransportRegistry
+
+
+class Negotiator():
+    """Negotiator handing out numbered tokens, slowly, and counting its calls."""
+
+    def __init__(self, expires_in=3600, delay=0.1):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+        self.token = None
+
+    def get_token(self, legs=2):
+        self.calls += 1
+        time.sleep(self.delay)
+        self.token = "token-{}".format(self.calls)
+        return self.token, self.expires_in
+
+
+@pytest.fixture
+def server():
+    """Server answering with 200 only to the bearer token in server.token, and 401 otherwise."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            accepted = self.headers.get('Authorization') == "Bearer {}".format(self.server.token)
+            body = json.dumps({'data' : [{'id' : 'b.hub'}]} if accepted else {'developerMessage' : 'Unauthorized'})
+            self.send_response(200 if accepted else 401)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode('utf8'))
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.token = None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run_threads(target, count):
+    """Run target in count threads at once and get their results."""
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(target())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_callers_share_one_refresh():
+    negotiator = Negotiator()
+    provider = TokenProvider(negotiator)
+
+    tokens = run_threads(provider.get_token, 20)
+
+    assert tokens == ['token-1'] * 20
+    assert negotiator.calls == 1
+
+
+def test_token_is_refreshed_before_it_expires():
+    negotiator = Negotiator(expires_in=0.4, delay=0)
+    provider = TokenProvider(negotiator)
+
+    assert provider.get_token() == 'token-1'
+    time.sleep(0.25)
+
+    assert provider.get_token() == 'token-2'
+    assert negotiator.calls == 2
+
+
+def test_rejected_requests_are_replayed_once_with_one_renewed_token(server):
+    negotiator = Negotiator()
+    provider = TokenProvider(negotiator)
+    api = HubsApi(provider, base_url="http://127.0.0.1:{}/".format(server.server_port), registry=TransportRegistry())
+
+    server.token = provider.get_token()
+    assert api.get_hubs() == [{'id' : 'b.hub'}]
+
+    server.token = 'token-2'
+    hubs = run_threads(api.get_hubs, 10)
+
+    assert hubs == [[{'id' : 'b.hub'}]] * 10
+    assert negotiator.calls == 2
+
+
+def test_request_is_not_replayed_twice(server):
+    negotiator = Negotiator(delay=0)
+    api = HubsApi(TokenProvider(negotiator), base_url="http://127.0.0.1:{}/".format(server.server_port),
+                  registry=TransportRegistry())
+
+    server.token = 'never-issued'
+
+    with pytest.raises(requests.HTTPError):
+        api.get_hubs()
+    assert negotiator.calls == 2
+
+
+def test_tokens_from_the_stand_in(urls):
+    negotiator = OAuth2Negotiator(urls['authentication'], 'client_id', 'client_secret', ['data:read'])
+    provider = TokenProvider(negotiator)
+
+    assert HubsApi(provider, base_url=urls['project']).get_hubs()
+    assert str(provider).startswith('stand-in-')
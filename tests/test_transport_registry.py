@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tests of the TransportRegistry sharing pooled http adapters between ForgeApi instances."""
+from urllib.parse import urlparse
+import pytest
+from PyForge import TransportRegistry, HubsApi, FoldersApi
+
+
+def test_apis_share_one_adapter_per_host(urls):
+    registry = TransportRegistry()
+    hubs_api = HubsApi('token', base_url=urls['project'], registry=registry)
+    folders_api = FoldersApi('token', base_url=urls['data'], registry=registry)
+
+    assert hubs_api.http.get_adapter(urls['project']) is folders_api.http.get_adapter(urls['data'])
+
+    for _ in range(3):
+        hubs_api.get_hubs()
+
+    stats = registry.stats()[urlparse(urls['project']).netloc]
+    assert stats['adapters_created'] == 1
+    assert stats['adapter_reuses'] == 1
+    assert stats['requests'] == 3
+    assert stats['connection_reuses'] == 2
+
+
+def test_pool_size_per_host(urls):
+    host = urlparse(urls['project']).netloc
+    registry = TransportRegistry(default_pool_size=4)
+    api = HubsApi('token', base_url=urls['project'], registry=registry)
+
+    registry.set_pool_size(host, 2)
+
+    assert registry.get_pool_size(host) == 2
+    assert registry.get_pool_size('developer.api.autodesk.com') == 4
+    assert api.get_hubs()
+
+    with pytest.raises(ValueError):
+        registry.set_pool_size(host, 0)
+
+
+def test_resize_closes_the_old_pool(urls):
+    host = urlparse(urls['project']).netloc
+    registry = TransportRegistry()
+    api = HubsApi('token', base_url=urls['project'], registry=registry)
+    api.get_hubs()
+    old_poolmanager = api.http.get_adapter(urls['project']).poolmanager
+    pools = [old_poolmanager.pools[key] for key in old_poolmanager.pools.keys()]
+    connections = [conn for pool in pools for conn in pool.pool.queue if conn is not None]
+
+    registry.set_pool_size(host, 2)
+
+    assert connections and all(conn.sock is None for conn in connections)
+    assert len(old_poolmanager.pools) == 0
+    assert api.get_hubs()
+    assert registry.stats()[host]['connections'] == 1
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Tests of the VersionsApi, fetching single versions and batches of versions from the ForgeStandIn."""
+import asyncio
+import pytest
+import requests
+from PyForge import VersionsApi, AsyncVersionsApi, AsyncForgeApi, TransportRegistry
+
+
+@pytest.fixture
+def versions_api(urls):
+    return VersionsApi('token', base_url=urls['data'], docs_base_url=urls['docs'], timeout=5,
+                       registry=TransportRegistry())
+
+
+@pytest.fixture
+def version_ids(data):
+    return [data.version(0, path, index, number)['id'] for path in [(), (0,), (1, 1)]
+            for index in range(data.items) for number in range(1, data.versions + 1)]
+
+
+def test_get_version(versions_api, data):
+    version = data.version(0, (0,), 1, 2)
+
+    assert versions_api.get_version(data.project(0)['id'], version['id']) == version
+    assert versions_api.get_version(data.project(0)['id'][2:], version['id']) == version
+
+
+def test_get_version_async(urls, data):
+    version = data.version(1, (1,), 0, 1)
+
+    async def main():
+        try:
+            return await AsyncVersionsApi('token', base_url=urls['data']).get_version(data.project(1)['id'], version['id'])
+        finally:
+            await AsyncForgeApi.close()
+
+    assert asyncio.run(main()) == version
+
+
+def test_get_versions_in_chunks(stand_in, versions_api, data, version_ids):
+    bogus = 'urn:adsk.wipprod:fs.file:vf.bogus?version=1'
+    sent = stand_in.stats().get('POST /bim360/docs/v1/projects/:id/versions:batch-get', {}).get(200, 0)
+
+    results, errors = versions_api.get_versions(data.project(0)['id'], version_ids + version_ids[:2] + [bogus],
+                                                chunk_size=5, max_workers=3)
+
+    assert sorted(results) == sorted(version_ids)
+    assert list(errors) == [bogus]
+    assert isinstance(errors[bogus], ConnectionError)
+    assert results[version_ids[0]]['itemUrn'] == data.version(0, (), 0, 1)['relationships']['item']['data']['id']
+    assert stand_in.stats()['POST /bim360/docs/v1/projects/:id/versions:batch-get'][200] == sent + 3
+
+
+def test_failed_chunks_are_reported_per_version(versions_api, data, version_ids):
+    results, errors = versions_api.get_versions('b.00000000-0000-4000-8000-000000000bad', version_ids, chunk_size=4)
+
+    assert results == {}
+    assert sorted(errors) == sorted(version_ids)
+    assert all(isinstance(error, requests.HTTPError) for error in errors.values())
+
+
+def test_undecodable_chunks_are_reported_per_version(monkeypatch, versions_api, data, version_ids):
+    post = versions_api.http.post
+
+    def truncating_post(*args, **kwargs):
+        resp = post(*args, **kwargs)
+        if kwargs['json']['urns'][0] == version_ids[4]:
+            resp._content = resp.content[:-10]
+        return resp
+
+    monkeypatch.setattr(versions_api.http, 'post', truncating_post)
+    results, errors = versions_api.get_versions(data.project(0)['id'], version_ids, chunk_size=4)
+
+    assert sorted(results) == sorted(version_ids[:4] + version_ids[8:])
+    assert sorted(errors) == sorted(version_ids[4:8])
+    assert all(isinstance(error, ValueError) for error in errors.values())
+
+
+def test_get_versions_uses_the_docs_base_url(urls, data, version_ids):
+    api = VersionsApi('token', base_url=urls['data'], docs_base_url=urls['data'], timeout=5, registry=TransportRegistry())
+
+    results, errors = api.get_versions(data.project(0)['id'], version_ids[:2])
+
+    assert results == {}
+    assert sorted(errors) == sorted(version_ids[:2])
+
+
+@pytest.mark.parametrize('chunk_size', [0, 51])
+def test_chunk_size_is_validated(versions_api, data, chunk_size):
+    with pytest.raises(ValueError):
+        versions_api.get_versions(data.project(0)['id'], [], chunk_size=chunk_size)
+    with pytest.raises(ValueError):
+        versions_api.get_versions(None, [])